@@ -0,0 +1,60 @@
+"""Concurrent Redis publish throughput with and without `auto_pipeline`.
+
+Requires a running Redis server:
+
+    python benchmarks/redis_publish.py --url redis://localhost:6379 --messages 50000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict
+
+from faststream.redis import RedisBroker
+
+
+async def run(
+    url: str,
+    messages: int,
+    concurrency: int,
+    **broker_options: Any,
+) -> float:
+    channel = "faststream-benchmark"
+
+    async with RedisBroker(url, **broker_options) as broker:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def publish(i: int) -> None:
+            async with semaphore:
+                await broker.publish(i, channel)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(publish(i) for i in range(messages)))
+        return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="redis://localhost:6379")
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    args = parser.parse_args()
+
+    cases: Dict[str, Dict[str, Any]] = {
+        "default": {},
+        "auto_pipeline": {"auto_pipeline": True},
+        "auto_pipeline (1ms linger)": {
+            "auto_pipeline": True,
+            "auto_pipeline_linger": 0.001,
+        },
+    }
+
+    for name, options in cases.items():
+        elapsed = await run(args.url, args.messages, args.concurrency, **options)
+        print(  # noqa: T201
+            f"{name:<28} {elapsed:>8.3f}s {args.messages / elapsed:>12,.0f} msg/s"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
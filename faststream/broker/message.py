@@ -20,7 +20,6 @@ from typing_extensions import deprecated
 
 from faststream._compat import dump_json, json_loads
 from faststream.constants import ContentTypes
-from faststream.types import EMPTY
 
 if TYPE_CHECKING:
     from faststream.types import AnyDict, DecodedMessage, SendableMessage
@@ -114,26 +113,51 @@ class StreamMessage(Generic[MsgType]):
 def decode_message(message: "StreamMessage[Any]") -> "DecodedMessage":
     """Decodes a message."""
     body: Any = getattr(message, "body", message)
+    content_type = cast(Optional[str], getattr(message, "content_type", None))
+    return decode_body(body, content_type)
+
+
+def decode_body(body: Any, content_type: Optional[str]) -> "DecodedMessage":
+    """Decodes a message body by its content type."""
     m: DecodedMessage = body
 
-    if (content_type := getattr(message, "content_type", EMPTY)) is not EMPTY:
-        content_type = cast(Optional[str], content_type)
+    if not content_type:
+        with suppress(json.JSONDecodeError, UnicodeDecodeError):
+            m = json_loads(body)
 
-        if not content_type:
-            with suppress(json.JSONDecodeError, UnicodeDecodeError):
-                m = json_loads(body)
+    elif ContentTypes.text.value in content_type:
+        m = body.decode()
 
-        elif ContentTypes.text.value in content_type:
-            m = body.decode()
+    elif ContentTypes.json.value in content_type:
+        m = json_loads(body)
 
-        elif ContentTypes.json.value in content_type:
-            m = json_loads(body)
+    return m
 
-    else:
+
+def decode_batch(
+    bodies: Sequence[Any],
+    batch_headers: Sequence["AnyDict"],
+) -> List["DecodedMessage"]:
+    """Decodes a batch of message bodies by their own content types.
+
+    A batch of JSON messages is decoded by a single `json_loads` call. Every body
+    is wrapped to a single item array and separated by raw newlines, which JSON
+    strings can't contain: a malformed body (e.g. `1,2`, `[3` or `"a`) can't
+    be merged with its neighbours unnoticed, and the batch falls back to
+    decoding each body.
+    """
+    content_types: List[Optional[str]] = [h.get("content-type") for h in batch_headers]
+
+    if bodies and all(ct and ContentTypes.json.value in ct for ct in content_types):
         with suppress(json.JSONDecodeError, UnicodeDecodeError):
-            m = json_loads(body)
+            result = json_loads(b"[[\n" + b"\n],[\n".join(bodies) + b"\n]]")
 
-    return m
+            if len(result) == len(bodies) and all(
+                isinstance(x, list) and len(x) == 1 for x in result
+            ):
+                return [x[0] for x in result]
+
+    return [decode_body(b, ct) for b, ct in zip(bodies, content_types)]
 
 
 def encode_message(
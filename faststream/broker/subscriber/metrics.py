@@ -0,0 +1,114 @@
+import time
+from typing import Any, Iterable, Optional, Protocol, Tuple
+
+
+class ConsumerMetricsRecorder(Protocol):
+    """Consumer-level metrics sink provided by metrics middlewares."""
+
+    def observe_consumer_fetch(
+        self,
+        broker: str,
+        handler: str,
+        records: int,
+    ) -> None: ...
+
+    def set_consumer_lag(
+        self,
+        broker: str,
+        handler: str,
+        topic: str,
+        partition: int,
+        lag: int,
+    ) -> None: ...
+
+    def remove_consumer_lag(
+        self,
+        broker: str,
+        handler: str,
+        topic: str,
+        partition: int,
+    ) -> None: ...
+
+    def observe_consumer_rebalance(
+        self,
+        broker: str,
+        handler: str,
+        duration: Optional[float],
+    ) -> None: ...
+
+
+class ConsumerMetrics:
+    """Sends consumer events (fetches, partitions lag, rebalances) to metrics recorders.
+
+    Recorders are taken from broker middlewares `consumer_metrics` attribute.
+    The object is falsy without recorders, so subscribers can skip calculations.
+    """
+
+    __slots__ = ("_rebalance_started_at", "broker", "handler", "recorders")
+
+    def __init__(
+        self,
+        *,
+        broker: str,
+        handler: str,
+        middlewares: Iterable[Any] = (),
+    ) -> None:
+        self.broker = broker
+        self.handler = handler
+        self.recorders: Tuple[ConsumerMetricsRecorder, ...] = tuple(
+            r
+            for m in middlewares
+            if (r := getattr(m, "consumer_metrics", None)) is not None
+        )
+
+        self._rebalance_started_at: Optional[float] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.recorders)
+
+    def fetched(self, records: int) -> None:
+        for r in self.recorders:
+            r.observe_consumer_fetch(
+                broker=self.broker,
+                handler=self.handler,
+                records=records,
+            )
+
+    def lag(self, topic: str, partition: int, lag: int) -> None:
+        for r in self.recorders:
+            r.set_consumer_lag(
+                broker=self.broker,
+                handler=self.handler,
+                topic=topic,
+                partition=partition,
+                lag=max(lag, 0),
+            )
+
+    def remove_lag(self, topic: str, partition: int) -> None:
+        """Drop the lag of a revoked partition to not report it forever."""
+        for r in self.recorders:
+            r.remove_consumer_lag(
+                broker=self.broker,
+                handler=self.handler,
+                topic=topic,
+                partition=partition,
+            )
+
+    def rebalance_started(self) -> None:
+        self._rebalance_started_at = time.perf_counter()
+
+    def rebalance_finished(self) -> None:
+        """Count the rebalance and observe its duration since partitions revoke."""
+        duration = (
+            None
+            if self._rebalance_started_at is None
+            else time.perf_counter() - self._rebalance_started_at
+        )
+        self._rebalance_started_at = None
+
+        for r in self.recorders:
+            r.observe_consumer_rebalance(
+                broker=self.broker,
+                handler=self.handler,
+                duration=duration,
+            )
@@ -1,10 +1,18 @@
 import asyncio
+import math
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
+    Callable,
     Coroutine,
+    Dict,
     Generic,
+    Hashable,
+    Iterable,
     List,
+    Optional,
+    Union,
 )
 
 import anyio
@@ -49,12 +57,15 @@ class ConcurrentMixin(TasksMixin, Generic[MsgType]):
         self.max_workers = max_workers
 
         self.send_stream, self.receive_stream = anyio.create_memory_object_stream(
-            max_buffer_size=max_workers
+            max_buffer_size=self._get_max_buffer_size()
         )
         self.limiter = anyio.Semaphore(max_workers)
 
         super().__init__(*args, **kwargs)
 
+    def _get_max_buffer_size(self) -> Union[int, float]:
+        return self.max_workers
+
     def start_consume_task(self) -> None:
         self.add_task(self._serve_consume_queue())
 
@@ -81,3 +92,192 @@ class ConcurrentMixin(TasksMixin, Generic[MsgType]):
         """Proxy method to put msg into in-memory queue with semaphore block."""
         async with self.limiter:
             await self.send_stream.send(msg)
+
+
+class PausableConcurrentMixin(ConcurrentMixin[MsgType]):
+    """Pause fetching instead of blocking the consume loop when all workers are busy.
+
+    Messages are put into the unbounded in-memory queue. Subscriber `pause_consuming`
+    is called when the number of not processed messages reaches `high_watermark`
+    and `resume_consuming` - when it falls to `low_watermark`, so the consume loop
+    keeps polling the broker (and heartbeating) while handlers are stalled.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        max_workers: int,
+        **kwargs: Any,
+    ) -> None:
+        self.high_watermark = max_workers * 2
+        self.low_watermark = max_workers
+        self.in_flight = 0
+        self.paused = False
+
+        super().__init__(*args, max_workers=max_workers, **kwargs)
+
+    def _get_max_buffer_size(self) -> Union[int, float]:
+        # queue size is limited by the pause
+        return math.inf
+
+    async def pause_consuming(self) -> None:
+        """Stop fetching new messages from the broker."""
+        raise NotImplementedError()
+
+    async def resume_consuming(self) -> None:
+        """Continue fetching messages from the broker."""
+        raise NotImplementedError()
+
+    async def _consume_msg(
+        self,
+        msg: "MsgType",
+    ) -> None:
+        try:
+            await super()._consume_msg(msg)
+
+        finally:
+            self.in_flight -= 1
+
+            if self.paused and self.in_flight <= self.low_watermark:
+                self.paused = False
+                await self.resume_consuming()
+
+    async def _put_msg(self, msg: "MsgType") -> None:
+        """Put msg into in-memory queue and pause consuming on high watermark."""
+        self.in_flight += 1
+        self.send_stream.send_nowait(msg)
+
+        # already buffered records are still coming after the pause and
+        # new partitions can be assigned, so pause is repeated
+        if self.in_flight >= self.high_watermark:
+            self.paused = True
+            await self.pause_consuming()
+
+
+class _PartitionWorker(Generic[MsgType]):
+    """Serial worker processing messages of a single partition in order.
+
+    The worker buffer is unbounded, its size is limited by the partition pause.
+    """
+
+    send_stream: "MemoryObjectSendStream[MsgType]"
+    receive_stream: "MemoryObjectReceiveStream[MsgType]"
+
+    def __init__(
+        self,
+        consume: Callable[[MsgType], Awaitable[Any]],
+        on_drain: Callable[[], Awaitable[Any]],
+        low_watermark: int,
+    ) -> None:
+        self.send_stream, self.receive_stream = anyio.create_memory_object_stream(
+            max_buffer_size=math.inf
+        )
+        self.low_watermark = low_watermark
+        self.buffered = 0
+        self.paused = False
+
+        self.task = asyncio.create_task(self._serve(consume, on_drain))
+
+    async def _serve(
+        self,
+        consume: Callable[[MsgType], Awaitable[Any]],
+        on_drain: Callable[[], Awaitable[Any]],
+    ) -> None:
+        async with self.receive_stream:
+            async for msg in self.receive_stream:
+                try:
+                    await consume(msg)
+
+                finally:
+                    self.buffered -= 1
+
+                    if self.paused and self.buffered <= self.low_watermark:
+                        self.paused = False
+                        await on_drain()
+
+    def put(self, msg: MsgType) -> None:
+        self.buffered += 1
+        self.send_stream.send_nowait(msg)
+
+    async def stop(self, timeout: Optional[float]) -> None:
+        """Process already buffered messages and stop the worker."""
+        self.send_stream.close()
+
+        if not self.task.done():
+            await asyncio.wait((self.task,), timeout=timeout)
+
+        if not self.task.done():
+            self.task.cancel()
+
+
+class PartitionsConcurrentMixin(TasksMixin, Generic[MsgType]):
+    """Process messages of different partitions concurrently keeping in-partition order.
+
+    Every partition gets its own serial worker. Workers are created on partitions
+    assignment (or lazily at the first partition message) and stopped on revocation.
+
+    Putting a message never blocks the fetch loop: the partition is paused by
+    `pause_partition` when its worker has `partition_buffer_size` not processed
+    messages and resumed by `resume_partition` when half of them is processed.
+    """
+
+    partition_workers: Dict[Hashable, _PartitionWorker[MsgType]]
+
+    def __init__(
+        self,
+        *args: Any,
+        partition_buffer_size: int = 32,
+        **kwargs: Any,
+    ) -> None:
+        self.partition_buffer_size = partition_buffer_size
+        self.partition_workers = {}
+
+        super().__init__(*args, **kwargs)
+
+    async def pause_partition(self, partition: Hashable) -> None:
+        """Stop fetching new messages of the partition from the broker."""
+        raise NotImplementedError()
+
+    async def resume_partition(self, partition: Hashable) -> None:
+        """Continue fetching messages of the partition."""
+        raise NotImplementedError()
+
+    def start_partition_workers(self, partitions: Iterable[Hashable]) -> None:
+        for partition in partitions:
+            self._get_partition_worker(partition)
+
+    async def stop_partition_workers(
+        self,
+        partitions: Optional[Iterable[Hashable]] = None,
+    ) -> None:
+        """Drain and stop workers of the partitions (all if not specified)."""
+        if partitions is None:
+            partitions = tuple(self.partition_workers)
+
+        workers = (w for p in partitions if (w := self.partition_workers.pop(p, None)))
+
+        await asyncio.gather(*(w.stop(self.graceful_timeout) for w in workers))
+
+    def _get_partition_worker(self, partition: Hashable) -> _PartitionWorker[MsgType]:
+        if (worker := self.partition_workers.get(partition)) is None:
+            worker = self.partition_workers[partition] = _PartitionWorker(
+                self.consume,
+                on_drain=lambda: self.resume_partition(partition),
+                low_watermark=self.partition_buffer_size // 2,
+            )
+        return worker
+
+    async def _put_partition_msg(self, partition: Hashable, msg: MsgType) -> None:
+        """Put msg into the partition worker in-memory queue and pause the full partition."""
+        worker = self._get_partition_worker(partition)
+        worker.put(msg)
+
+        # already fetched messages are still coming after the pause and
+        # partitions can be resumed by rebalance, so pause is repeated
+        if worker.buffered >= self.partition_buffer_size:
+            worker.paused = True
+            await self.pause_partition(partition)
+
+    async def close(self) -> None:
+        await super().close()
+        await self.stop_partition_workers()
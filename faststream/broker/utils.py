@@ -1,16 +1,22 @@
 import asyncio
 import inspect
+from collections import deque
 from contextlib import AsyncExitStack, suppress
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncContextManager,
+    AsyncIterable,
+    AsyncIterator,
     Awaitable,
     Callable,
+    Deque,
+    Iterable,
     Optional,
     Sequence,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -32,7 +38,7 @@ if TYPE_CHECKING:
         CustomCallable,
         SyncCallable,
     )
-    from faststream.types import LoggerProto
+    from faststream.types import LoggerProto, SendableMessage
 
 
 async def process_msg(
@@ -153,3 +159,92 @@ def resolve_custom_func(
     else:
         name = tuple(original_params.items())[1][0]
         return partial(to_async(custom_func), **{name: default_func})
+
+
+_DeliveryT = TypeVar("_DeliveryT")
+
+
+def publish_with_window(
+    messages: Union[Iterable["SendableMessage"], AsyncIterable["SendableMessage"]],
+    send: Callable[["SendableMessage"], Awaitable["asyncio.Future[_DeliveryT]"]],
+    max_in_flight: int,
+) -> AsyncIterator[_DeliveryT]:
+    """Send messages keeping up to `max_in_flight` unconfirmed ones.
+
+    Delivery results are yielded in the messages order. The next message is taken
+    from the source only when the window has a free slot, and the first failed
+    delivery raises its error.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be >= 1")
+
+    return _publish_with_window(messages, send, max_in_flight)
+
+
+async def _publish_with_window(
+    messages: Union[Iterable["SendableMessage"], AsyncIterable["SendableMessage"]],
+    send: Callable[["SendableMessage"], Awaitable["asyncio.Future[_DeliveryT]"]],
+    max_in_flight: int,
+) -> AsyncIterator[_DeliveryT]:
+    in_flight: Deque[asyncio.Future[_DeliveryT]] = deque()
+
+    async def _iter() -> AsyncIterator["SendableMessage"]:
+        if isinstance(messages, AsyncIterable):
+            async for m in messages:
+                yield m
+        else:
+            for m in messages:
+                yield m
+
+    try:
+        async for msg in _iter():
+            if len(in_flight) >= max_in_flight:
+                yield await in_flight.popleft()
+
+            in_flight.append(await send(msg))
+
+        while in_flight:
+            yield await in_flight.popleft()
+
+    finally:
+        # do not leave unretrieved exceptions of abandoned deliveries
+        for future in in_flight:
+            future.add_done_callback(_retrieve_exception)
+
+
+def deliver_in_scope(
+    send: Callable[..., Awaitable["asyncio.Future[_DeliveryT]"]],
+    middlewares: Iterable[Callable[..., Any]],
+) -> Callable[..., Awaitable["asyncio.Future[_DeliveryT]"]]:
+    """Wrap `send` by publish middlewares lasting until the message delivery.
+
+    Middlewares scope awaits the delivery confirmation, so publish metrics and
+    errors reflect failed deliveries. The wrapped function still returns the
+    delivery future as soon as the message is enqueued, which keeps messages order
+    and the sending window of `publish_with_window`.
+    """
+    middlewares = tuple(middlewares)
+
+    async def wrapped(*args: Any, **kwargs: Any) -> "asyncio.Future[_DeliveryT]":
+        enqueued: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        async def deliver(*args: Any, **kwargs: Any) -> _DeliveryT:
+            future = await send(*args, **kwargs)
+            enqueued.set_result(None)
+            return await future
+
+        call: Callable[..., Awaitable[_DeliveryT]] = deliver
+        for m in middlewares:
+            call = partial(m, call)
+
+        task: asyncio.Future[_DeliveryT] = asyncio.ensure_future(call(*args, **kwargs))
+        # middleware can fail or skip sending before the message is enqueued
+        await asyncio.wait((enqueued, task), return_when=asyncio.FIRST_COMPLETED)
+        return task
+
+    return wrapped
+
+
+def _retrieve_exception(future: "asyncio.Future[Any]") -> None:
+    if not future.cancelled():
+        future.exception()
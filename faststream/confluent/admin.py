@@ -0,0 +1,99 @@
+import logging
+from time import monotonic
+from typing import TYPE_CHECKING, Iterable, List, Optional, Set
+
+import anyio
+from confluent_kafka.admin import AdminClient, NewTopic  # type: ignore[attr-defined]
+
+from faststream.confluent.client import ADMINCLIENT_CONFIG_PARAMS
+from faststream.log import logger as faststream_logger
+from faststream.utils.functions import call_or_await
+
+if TYPE_CHECKING:
+    from faststream.types import AnyDict, LoggerProto
+
+
+class AdminService:
+    """Broker-level cluster metadata and topics management.
+
+    All broker consumers share a single `AdminClient` and a `list_topics`
+    metadata cache, so the cluster is requested once per `metadata_ttl`
+    and all missing topics are created by a single request.
+    """
+
+    def __init__(
+        self,
+        config: "AnyDict",
+        logger: Optional["LoggerProto"] = None,
+        metadata_ttl: float = 60.0,
+    ) -> None:
+        self.config = {x: config[x] for x in ADMINCLIENT_CONFIG_PARAMS if x in config}
+        self.logger = logger or faststream_logger
+        self.metadata_ttl = metadata_ttl
+
+        self._timeout = self.config.get("request.timeout.ms", 40000) / 1000
+        self._client: Optional[AdminClient] = None
+        self._topics: Set[str] = set()
+        self._fetched_at: Optional[float] = None
+        self._lock = anyio.Lock()
+
+    @property
+    def client(self) -> AdminClient:
+        if self._client is None:
+            self._client = AdminClient(self.config)
+        return self._client
+
+    async def list_topics(self, *, refresh: bool = False) -> Set[str]:
+        """Returns cluster topic names, cached for `metadata_ttl` seconds."""
+        if (
+            refresh
+            or self._fetched_at is None
+            or monotonic() - self._fetched_at >= self.metadata_ttl
+        ):
+            metadata = await call_or_await(
+                self.client.list_topics,
+                timeout=self._timeout,
+            )
+            self._topics = set(metadata.topics)
+            self._fetched_at = monotonic()
+
+        return self._topics
+
+    async def create_topics(self, topics: Iterable[str]) -> None:
+        """Creates all topics missing in the cluster by a single request."""
+        async with self._lock:
+            try:
+                existing = await self.list_topics()
+            except Exception as e:
+                self.logger.log(logging.WARNING, f"Failed to list topics: {e}")
+                existing = set()
+
+            if missing := [t for t in dict.fromkeys(topics) if t not in existing]:
+                created = await call_or_await(self._create_topics, missing)
+                self._topics.update(created)
+
+    def _create_topics(self, topics: List[str]) -> List[str]:
+        fs = self.client.create_topics(
+            [
+                NewTopic(topic, num_partitions=1, replication_factor=1)
+                for topic in topics
+            ],
+            request_timeout=self._timeout,
+        )
+
+        created = []
+        for topic, f in fs.items():
+            try:
+                f.result()  # The result itself is None
+            except Exception as e:  # noqa: PERF203
+                if "TOPIC_ALREADY_EXISTS" in str(e):
+                    created.append(topic)
+                else:
+                    self.logger.log(
+                        logging.WARN, f"Failed to create topic {topic}: {e}"
+                    )
+            else:
+                created.append(topic)
+                self.logger.log(logging.INFO, f"Topic `{topic}` created.")
+
+        return created
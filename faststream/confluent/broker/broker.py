@@ -9,6 +9,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -20,6 +21,7 @@ from typing_extensions import Annotated, Doc, override
 
 from faststream.__about__ import SERVICE_NAME
 from faststream.broker.message import gen_cor_id
+from faststream.confluent.admin import AdminService
 from faststream.confluent.broker.logging import KafkaLoggingBroker
 from faststream.confluent.broker.registrator import KafkaRegistrator
 from faststream.confluent.client import (
@@ -30,6 +32,7 @@ from faststream.confluent.config import ConfluentFastConfig
 from faststream.confluent.publisher.producer import AsyncConfluentFastProducer
 from faststream.confluent.schemas.params import ConsumerConnectionParams
 from faststream.confluent.security import parse_security
+from faststream.confluent.stats import create_stats_callback
 from faststream.exceptions import NOT_CONNECTED_YET
 from faststream.types import EMPTY
 from faststream.utils.data import filter_by_dict
@@ -246,6 +249,18 @@ class KafkaBroker(  # type: ignore[misc]
         ] = False,
         transactional_id: Optional[str] = None,
         transaction_timeout_ms: int = 60 * 1000,
+        background_fetch: Annotated[
+            bool,
+            Doc(
+                """
+            Fetch messages by a dedicated consumer thread instead of a threadpool
+            call per `poll`. Fetched batches are buffered in an asyncio queue and
+            partitions are paused while the buffer is full. Buffered messages of
+            revoked partitions are dropped. Can't be used with `auto_commit=False`
+            subscribers.
+            """
+            ),
+        ] = False,
         # broker base args
         graceful_timeout: Annotated[
             Optional[float],
@@ -394,7 +409,9 @@ class KafkaBroker(  # type: ignore[misc]
             validate=validate,
         )
         self.client_id = client_id
+        self.background_fetch = background_fetch
         self._producer = None
+        self._admin: Optional[AdminService] = None
         self.config = ConfluentFastConfig(config)
 
     async def _close(
@@ -407,6 +424,8 @@ class KafkaBroker(  # type: ignore[misc]
             await self._producer.stop()
             self._producer = None
 
+        self._admin = None
+
         await super()._close(exc_type, exc_val, exc_tb)
 
     async def connect(
@@ -432,11 +451,17 @@ class KafkaBroker(  # type: ignore[misc]
         security_params = parse_security(self.security)
         kwargs.update(security_params)
 
+        stats_cb = create_stats_callback(
+            self.config.as_config_dict(),
+            self._middlewares,
+        )
+
         native_producer = AsyncConfluentProducer(
             **kwargs,
             client_id=client_id,
             logger=self.logger,
             config=self.config,
+            stats_cb=stats_cb,
         )
 
         self._producer = AsyncConfluentFastProducer(
@@ -445,16 +470,34 @@ class KafkaBroker(  # type: ignore[misc]
             decoder=self._decoder,
         )
 
+        self._admin = AdminService(native_producer.config, logger=self.logger)
+
         return partial(
             AsyncConfluentConsumer,
             **filter_by_dict(ConsumerConnectionParams, kwargs),
             logger=self.logger,
             config=self.config,
+            stats_cb=stats_cb,
+            background_fetch=self.background_fetch,
+            admin=self._admin,
         )
 
     async def start(self) -> None:
         await super().start()
 
+        if self._admin is not None and self._admin.config.get(
+            "allow.auto.create.topics", True
+        ):
+            # create topics of all subscribers at once before consumers start
+            await self._admin.create_topics(
+                topic
+                for handler in self._subscribers.values()
+                for topic in (
+                    *handler.topics,
+                    *(p.topic for p in handler.partitions),
+                )
+            )
+
         for handler in self._subscribers.values():
             self._log(
                 f"`{handler.call_name}` waiting for messages",
@@ -533,6 +576,7 @@ class KafkaBroker(  # type: ignore[misc]
         *msgs: "SendableMessage",
         topic: str,
         partition: Optional[int] = None,
+        keys: Optional[Sequence[Optional[bytes]]] = None,
         timestamp_ms: Optional[int] = None,
         headers: Optional[Dict[str, str]] = None,
         reply_to: str = "",
@@ -551,6 +595,7 @@ class KafkaBroker(  # type: ignore[misc]
             *msgs,
             topic=topic,
             partition=partition,
+            keys=keys,
             timestamp_ms=timestamp_ms,
             headers=headers,
             reply_to=reply_to,
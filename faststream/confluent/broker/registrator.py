@@ -38,6 +38,7 @@ if TYPE_CHECKING:
     from faststream.confluent.schemas import TopicPartition
     from faststream.confluent.subscriber.asyncapi import (
         AsyncAPIBatchSubscriber,
+        AsyncAPIConcurrentBetweenPartitionsSubscriber,
         AsyncAPIConcurrentDefaultSubscriber,
         AsyncAPIDefaultSubscriber,
     )
@@ -59,6 +60,7 @@ class KafkaRegistrator(
             "AsyncAPIBatchSubscriber",
             "AsyncAPIDefaultSubscriber",
             "AsyncAPIConcurrentDefaultSubscriber",
+            "AsyncAPIConcurrentBetweenPartitionsSubscriber",
         ],
     ]
     _publishers: Dict[  # type: ignore[assignment]
@@ -1198,10 +1200,18 @@ class KafkaRegistrator(
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        parallel_partitions: Annotated[
+            bool,
+            Doc(
+                "Whether to process messages of each assigned partition by its own serial worker. "
+                "Partitions are processed concurrently, messages order inside a partition is kept."
+            ),
+        ] = False,
     ) -> Union[
         "AsyncAPIDefaultSubscriber",
         "AsyncAPIBatchSubscriber",
         "AsyncAPIConcurrentDefaultSubscriber",
+        "AsyncAPIConcurrentBetweenPartitionsSubscriber",
     ]:
         if not auto_commit and not group_id:
             raise SetupError("You should install `group_id` with manual commit mode")
@@ -1209,6 +1219,7 @@ class KafkaRegistrator(
         subscriber = create_subscriber(
             *topics,
             max_workers=max_workers,
+            parallel_partitions=parallel_partitions,
             polling_interval=polling_interval,
             partitions=partitions,
             batch=batch,
@@ -1246,7 +1257,11 @@ class KafkaRegistrator(
         if batch:
             subscriber = cast("AsyncAPIBatchSubscriber", subscriber)
         else:
-            if max_workers > 1:
+            if parallel_partitions:
+                subscriber = cast(
+                    "AsyncAPIConcurrentBetweenPartitionsSubscriber", subscriber
+                )
+            elif max_workers > 1:
                 subscriber = cast("AsyncAPIConcurrentDefaultSubscriber", subscriber)
             else:
                 subscriber = cast("AsyncAPIDefaultSubscriber", subscriber)
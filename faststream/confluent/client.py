@@ -1,11 +1,15 @@
 import asyncio
 import logging
+import threading
+from collections import deque
 from contextlib import suppress
 from time import time
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Coroutine,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -27,10 +31,19 @@ from faststream.types import EMPTY
 from faststream.utils.functions import call_or_await
 
 if TYPE_CHECKING:
+    from confluent_kafka import TopicPartition as ConfluentPartition
     from typing_extensions import NotRequired, TypedDict
 
+    from faststream.confluent.admin import AdminService
     from faststream.types import AnyDict, LoggerProto
 
+    DeliveryReport = Tuple[
+        Union["asyncio.Future[Optional[Message]]", "_BatchDelivery"],
+        Any,
+        Optional[Message],
+    ]
+    RebalanceCallback = Callable[[List[TopicPartition]], Coroutine[Any, Any, None]]
+
     class _SendKwargs(TypedDict):
         value: Optional[Union[str, bytes]]
         key: Optional[Union[str, bytes]]
@@ -39,6 +52,10 @@ if TYPE_CHECKING:
         timestamp: NotRequired[int]
         on_delivery: NotRequired[Callable[..., None]]
 
+    class _RebalanceCallbacks(TypedDict, total=False):
+        on_assign: Callable[[Consumer, List[ConfluentPartition]], None]
+        on_revoke: Callable[[Consumer, List[ConfluentPartition]], None]
+
 
 class AsyncConfluentProducer:
     """An asynchronous Python Kafka client using the "confluent-kafka" package."""
@@ -67,6 +84,7 @@ class AsyncConfluentProducer:
         sasl_mechanism: Optional[str] = None,
         sasl_plain_password: Optional[str] = None,
         sasl_plain_username: Optional[str] = None,
+        stats_cb: Optional[Callable[[str], None]] = None,
     ) -> None:
         self.logger = logger
 
@@ -112,24 +130,61 @@ class AsyncConfluentProducer:
                 }
             )
 
+        if stats_cb is not None:
+            final_config["stats_cb"] = stats_cb
+
+        self.config = final_config
         self.producer = Producer(final_config, logger=self.logger)  # type: ignore[call-arg]
 
+        self._loop = asyncio.get_running_loop()
+        # delivery callbacks are called from librdkafka serving threads
+        self._reports: Deque[DeliveryReport] = deque()
+
         self.__running = True
-        self._poll_task = asyncio.create_task(self._poll_loop())
+        self._delivery_thread = threading.Thread(
+            target=self._serve_deliveries,
+            name="faststream-confluent-delivery",
+            daemon=True,
+        )
+        self._delivery_thread.start()
+
+    def _serve_deliveries(self) -> None:
+        """Poll delivery reports in a dedicated thread.
 
-    async def _poll_loop(self) -> None:
+        `poll` returns right after serving all ready events, so reports
+        completed by a single poll are passed to the event loop at once.
+        """
         while self.__running:
-            with suppress(Exception):
-                await call_or_await(self.producer.poll, 0.1)
+            self._poll_deliveries(0.1)
+
+    def _poll_deliveries(self, timeout: float) -> None:
+        with suppress(Exception):
+            self.producer.poll(timeout)
+
+        if self._reports:
+            self._hand_over_reports()
+
+    def _hand_over_reports(self) -> None:
+        reports = []
+        with suppress(IndexError):
+            while True:
+                reports.append(self._reports.popleft())
+
+        with suppress(RuntimeError):  # loop is closed
+            self._loop.call_soon_threadsafe(_resolve_reports, reports)
 
     async def stop(self) -> None:
         """Stop the Kafka producer and flush remaining messages."""
         if self.__running:
             self.__running = False
-            if not self._poll_task.done():
-                self._poll_task.cancel()
+            await anyio.to_thread.run_sync(self._delivery_thread.join)
             await call_or_await(self.producer.flush)
 
+            # reports served by `flush`
+            reports = list(self._reports)
+            self._reports.clear()
+            _resolve_reports(reports)
+
     async def send(
         self,
         topic: str,
@@ -141,34 +196,40 @@ class AsyncConfluentProducer:
         no_confirm: bool = False,
     ) -> None:
         """Sends a single message to a Kafka topic."""
-        kwargs: _SendKwargs = {
-            "value": value,
-            "key": key,
-            "headers": headers,
-        }
+        if no_confirm:
+            # should be sync to prevent segfault
+            self.producer.produce(
+                topic,
+                **_make_send_kwargs(value, key, partition, timestamp_ms, headers),
+            )
 
-        if partition is not None:
-            kwargs["partition"] = partition
+        else:
+            await self.produce(topic, value, key, partition, timestamp_ms, headers)
 
-        if timestamp_ms is not None:
-            kwargs["timestamp"] = timestamp_ms
+    def produce(
+        self,
+        topic: str,
+        value: Optional[Union[str, bytes]] = None,
+        key: Optional[Union[str, bytes]] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+        headers: Optional[List[Tuple[str, Union[str, bytes]]]] = None,
+    ) -> "asyncio.Future[Optional[Message]]":
+        """Put a message to the producer queue and return its delivery report future."""
+        kwargs = _make_send_kwargs(value, key, partition, timestamp_ms, headers)
 
-        if not no_confirm:
-            result_future: asyncio.Future[Optional[Message]] = asyncio.Future()
+        result_future: asyncio.Future[Optional[Message]] = self._loop.create_future()
 
-            def ack_callback(err: Any, msg: Optional[Message]) -> None:
-                if err or (msg is not None and (err := msg.error())):
-                    result_future.set_exception(KafkaException(err))
-                else:
-                    result_future.set_result(msg)
+        def ack_callback(err: Any, msg: Optional[Message]) -> None:
+            # futures are not thread-safe, so the report is resolved by the loop
+            self._reports.append((result_future, err, msg))
 
-            kwargs["on_delivery"] = ack_callback
+        kwargs["on_delivery"] = ack_callback
 
         # should be sync to prevent segfault
         self.producer.produce(topic, **kwargs)
 
-        if not no_confirm:
-            await result_future
+        return result_future
 
     def create_batch(self) -> "BatchBuilder":
         """Creates a batch for sending multiple messages."""
@@ -182,19 +243,50 @@ class AsyncConfluentProducer:
         partition: Optional[int],
         no_confirm: bool = False,
     ) -> None:
-        """Sends a batch of messages to a Kafka topic."""
-        async with anyio.create_task_group() as tg:
-            for msg in batch._builder:
-                tg.start_soon(
-                    self.send,
-                    topic,
-                    msg["value"],
-                    msg["key"],
-                    partition,
-                    msg["timestamp_ms"],
-                    msg["headers"],
-                    no_confirm,
-                )
+        """Sends a batch of messages to a Kafka topic.
+
+        Messages are put to the librdkafka queue by a single synchronous loop,
+        the whole batch is confirmed by one future resolved by the last
+        delivery report.
+        """
+        if not (messages := batch._builder):
+            return
+
+        on_delivery: Optional[Callable[[Any, Optional[Message]], None]]
+        if no_confirm:
+            on_delivery = None
+
+        else:
+            delivery = _BatchDelivery(self._loop.create_future(), len(messages))
+
+            def on_delivery(err: Any, msg: Optional[Message]) -> None:
+                self._reports.append((delivery, err, msg))
+
+        produce = self.producer.produce
+        for msg in messages:
+            kwargs = _make_send_kwargs(
+                msg["value"],
+                msg["key"],
+                partition,
+                msg["timestamp_ms"],
+                msg["headers"],
+            )
+
+            if on_delivery is not None:
+                kwargs["on_delivery"] = on_delivery
+
+            while True:
+                try:
+                    # should be sync to prevent segfault
+                    produce(topic, **kwargs)
+                except BufferError:  # noqa: PERF203
+                    # local queue is full, serve delivered messages to free it
+                    await anyio.to_thread.run_sync(self._poll_deliveries, 0.1)
+                else:
+                    break
+
+        if not no_confirm:
+            await delivery.future
 
     async def ping(
         self,
@@ -250,8 +342,23 @@ class AsyncConfluentConsumer:
         sasl_mechanism: Optional[str] = None,
         sasl_plain_password: Optional[str] = None,
         sasl_plain_username: Optional[str] = None,
+        on_assign: Optional["RebalanceCallback"] = None,
+        on_revoke: Optional["RebalanceCallback"] = None,
+        stats_cb: Optional[Callable[[str], None]] = None,
+        background_fetch: bool = False,
+        fetch_batch_size: int = 500,
+        fetch_queue_size: int = 4,
+        admin: Optional["AdminService"] = None,
     ) -> None:
+        if background_fetch and not enable_auto_commit:
+            # `commit()` without offsets commits all messages fetched by the
+            # thread ahead of the handler, not only processed ones
+            raise SetupError(
+                "`background_fetch` can't be used with manual commit (`auto_commit=False`)."
+            )
+
         self.logger = logger
+        self.admin = admin
 
         if isinstance(bootstrap_servers, Iterable) and not isinstance(
             bootstrap_servers, str
@@ -259,6 +366,8 @@ class AsyncConfluentConsumer:
             bootstrap_servers = ",".join(bootstrap_servers)
 
         self.topics = list(topics)
+        self.on_assign = on_assign
+        self.on_revoke = on_revoke
         self.partitions = partitions
 
         if not isinstance(partition_assignment_strategy, str):
@@ -311,6 +420,14 @@ class AsyncConfluentConsumer:
                 }
             )
 
+        if stats_cb is not None:
+            final_config["stats_cb"] = stats_cb
+
+        if background_fetch:
+            # poll stores offsets of all fetched messages, so auto commit would
+            # commit buffered ones too: they are stored when taken by subscriber
+            final_config["enable.auto.offset.store"] = False
+
         self.config = final_config
         self.consumer = Consumer(final_config, logger=self.logger)  # type: ignore[call-arg]
 
@@ -318,6 +435,24 @@ class AsyncConfluentConsumer:
         # https://github.com/airtai/faststream/issues/1904#issuecomment-2506990895
         self._lock = anyio.Lock()
 
+        self._loop = asyncio.get_running_loop()
+
+        self.background_fetch = background_fetch
+        self._fetch_batch_size = fetch_batch_size
+        self._fetch_queue_size = fetch_queue_size
+        self._retry_backoff = retry_backoff_ms / 1000
+        # fetched batches, put by the fetch thread
+        self._fetched: asyncio.Queue[List[Message]] = asyncio.Queue()
+        self._pending: Deque[Message] = deque()
+        # polled by the fetch thread while partitions are paused
+        self._unsent: List[Message] = []
+        # guards `_buffered` and `_held` shared with the fetch thread
+        self._fetch_state = threading.Condition()
+        self._buffered = 0
+        self._held = False
+        self._fetching = False
+        self._fetch_thread: Optional[threading.Thread] = None
+
     @property
     def topics_to_create(self) -> List[str]:
         return list({*self.topics, *(p.topic for p in self.partitions)})
@@ -325,9 +460,12 @@ class AsyncConfluentConsumer:
     async def start(self) -> None:
         """Starts the Kafka consumer and subscribes to the specified topics."""
         if self.allow_auto_create_topics:
-            await call_or_await(
-                create_topics, self.topics_to_create, self.config, self.logger
-            )
+            if self.admin is not None:
+                await self.admin.create_topics(self.topics_to_create)
+            else:
+                await call_or_await(
+                    create_topics, self.topics_to_create, self.config, self.logger
+                )
 
         elif self.logger:
             self.logger.log(
@@ -336,7 +474,7 @@ class AsyncConfluentConsumer:
             )
 
         if self.topics:
-            await call_or_await(self.consumer.subscribe, self.topics)
+            await call_or_await(self._subscribe)
 
         elif self.partitions:
             await call_or_await(
@@ -346,6 +484,171 @@ class AsyncConfluentConsumer:
         else:
             raise SetupError("You must provide either `topics` or `partitions` option.")
 
+        if self.background_fetch:
+            self._fetching = True
+            self._fetch_thread = threading.Thread(
+                target=self._fetch_messages,
+                name="faststream-confluent-fetch",
+                daemon=True,
+            )
+            self._fetch_thread.start()
+
+    def _fetch_messages(self) -> None:
+        """Fetch messages in a dedicated thread and pass them to the event loop.
+
+        Partitions are paused while the loop has `fetch_queue_size` batches
+        not taken yet or fetching is paused by `pause`, so librdkafka doesn't
+        prefetch messages nobody is going to read soon. The thread keeps polling
+        paused partitions: the consumer stays in the group regardless of
+        `max.poll.interval.ms` and rebalance callbacks are still served.
+        """
+        paused = False
+
+        while self._fetching:
+            with self._fetch_state:
+                ready = self._can_fetch()
+
+            if not self._fetching:
+                break
+
+            try:
+                if not ready:
+                    # pause partitions assigned meanwhile as well
+                    self._toggle_fetching(False)
+                    paused = True
+
+                    # messages fetched before the pause are sent after it
+                    if (msg := check_msg_error(self.consumer.poll(0.1))) is not None:
+                        self._unsent.append(msg)
+
+                    continue
+
+                if paused:
+                    self._toggle_fetching(True)
+                    paused = False
+
+                # wait for the first message only, then take all already fetched
+                if (msg := self.consumer.poll(1.0)) is None and not self._unsent:
+                    continue
+
+                messages: List[Optional[Message]] = [msg]
+                messages.extend(
+                    self.consumer.consume(  # type: ignore[arg-type]
+                        num_messages=self._fetch_batch_size - 1,
+                        timeout=0,
+                    )
+                )
+
+            except Exception as e:
+                if self.logger:
+                    self.logger.log(
+                        logging.ERROR,
+                        "Messages fetching error occurred.",
+                        exc_info=e,
+                    )
+
+                with self._fetch_state:
+                    self._fetch_state.wait(self._retry_backoff)
+
+                continue
+
+            batch, self._unsent = self._unsent, []
+            batch.extend(m for x in messages if (m := check_msg_error(x)) is not None)
+            if batch:
+                with self._fetch_state:
+                    self._buffered += 1
+
+                with suppress(RuntimeError):  # loop is closed
+                    self._loop.call_soon_threadsafe(self._fetched.put_nowait, batch)
+
+    def _store_offsets(self, messages: Iterable[Message]) -> None:
+        """Mark messages taken from the fetch buffer to be committed."""
+        offsets: Dict[Tuple[str, int], int] = {}
+        for msg in messages:
+            offsets[(msg.topic(), msg.partition())] = msg.offset() + 1  # type: ignore[index,operator]
+
+        if offsets:
+            with suppress(KafkaException):  # partition is revoked already
+                self.consumer.store_offsets(
+                    offsets=[
+                        TopicPartition(
+                            topic=topic, partition=partition, offset=offset
+                        ).to_confluent()
+                        for (topic, partition), offset in offsets.items()
+                    ]
+                )
+
+    def _can_fetch(self) -> bool:
+        return not self._fetching or (
+            not self._held and self._buffered < self._fetch_queue_size
+        )
+
+    async def _take_fetched(self, timeout: float) -> None:
+        """Move the next fetched batch to pending messages if there are no ones."""
+        if self._pending:
+            return
+
+        with anyio.move_on_after(timeout):
+            batch = await self._fetched.get()
+
+            with self._fetch_state:
+                self._buffered -= 1
+                self._fetch_state.notify()
+
+            self._pending.extend(batch)
+
+    def _subscribe(self) -> None:
+        self.consumer.subscribe(self.topics, **self._rebalance_callbacks())
+
+    def _rebalance_callbacks(self) -> "_RebalanceCallbacks":
+        """Wrap async rebalance callbacks to be called from librdkafka poll thread."""
+        callbacks: _RebalanceCallbacks = {}
+
+        if self.on_assign is not None:
+            callbacks["on_assign"] = _to_rebalance_callback(
+                self.on_assign,
+                self._loop,
+            )
+
+        on_revoke = self._revoke_fetched if self.background_fetch else self.on_revoke
+        if on_revoke is not None:
+            callbacks["on_revoke"] = _to_rebalance_callback(
+                on_revoke,
+                self._loop,
+            )
+
+        return callbacks
+
+    async def _revoke_fetched(self, partitions: List[TopicPartition]) -> None:
+        self._drop_fetched(partitions)
+
+        if self.on_revoke is not None:
+            await self.on_revoke(partitions)
+
+    def _drop_fetched(self, partitions: Iterable[TopicPartition]) -> None:
+        """Drop buffered messages of revoked partitions to not process them twice."""
+        revoked = {(p.topic, p.partition) for p in partitions}
+
+        def is_assigned(msg: Message) -> bool:
+            return (msg.topic(), msg.partition()) not in revoked
+
+        self._pending = deque(filter(is_assigned, self._pending))
+        self._unsent = list(filter(is_assigned, self._unsent))
+
+        # the fetch thread is blocked by the rebalance callback, so the queue
+        # is not filled concurrently
+        batches: List[List[Message]] = []
+        while not self._fetched.empty():
+            batches.append(self._fetched.get_nowait())
+
+        kept = [b for batch in batches if (b := list(filter(is_assigned, batch)))]
+        for batch in kept:
+            self._fetched.put_nowait(batch)
+
+        with self._fetch_state:
+            self._buffered -= len(batches) - len(kept)
+            self._fetch_state.notify()
+
     async def commit(self, asynchronous: bool = True) -> None:
         """Commits the offsets of all messages returned by the last poll operation."""
         await call_or_await(self.consumer.commit, asynchronous=asynchronous)
@@ -370,12 +673,29 @@ class AsyncConfluentConsumer:
                     exc_info=e,
                 )
 
+        if self._fetch_thread is not None:
+            with self._fetch_state:
+                self._fetching = False
+                self._fetch_state.notify()
+
+            await anyio.to_thread.run_sync(self._fetch_thread.join)
+            self._fetch_thread = None
+
         # Wrap calls to async to make method cancelable by timeout
         async with self._lock:
             await call_or_await(self.consumer.close)
 
     async def getone(self, timeout: float = 0.1) -> Optional[Message]:
         """Consumes a single message from Kafka."""
+        if self.background_fetch:
+            await self._take_fetched(timeout)
+            if not self._pending:
+                return None
+
+            fetched = self._pending.popleft()
+            self._store_offsets((fetched,))
+            return fetched
+
         async with self._lock:
             msg = await call_or_await(self.consumer.poll, timeout)
         return check_msg_error(msg)
@@ -386,6 +706,15 @@ class AsyncConfluentConsumer:
         max_records: Optional[int] = 10,
     ) -> Tuple[Message, ...]:
         """Consumes a batch of messages from Kafka and groups them by topic and partition."""
+        if self.background_fetch:
+            await self._take_fetched(timeout)
+            messages = tuple(
+                self._pending.popleft()
+                for _ in range(min(max_records or 10, len(self._pending)))
+            )
+            self._store_offsets(messages)
+            return messages
+
         async with self._lock:
             raw_messages: List[Optional[Message]] = await call_or_await(
                 self.consumer.consume,  # type: ignore[arg-type]
@@ -395,6 +724,63 @@ class AsyncConfluentConsumer:
 
         return tuple(x for x in map(check_msg_error, raw_messages) if x is not None)
 
+    def highwater(self, topic: str, partition: int) -> Optional[int]:
+        """Returns the partition high watermark cached by the last fetch."""
+        offsets = self.consumer.get_watermark_offsets(
+            TopicPartition(topic=topic, partition=partition).to_confluent(),
+            cached=True,
+        )
+        return None if offsets is None else offsets[1]
+
+    async def pause(self) -> None:
+        """Suspends fetching from all assigned partitions keeping group membership."""
+        if self.background_fetch:
+            self._hold_fetching(True)
+        else:
+            await call_or_await(self._toggle_fetching, False)
+
+    async def resume(self) -> None:
+        """Resumes fetching from all assigned partitions."""
+        if self.background_fetch:
+            self._hold_fetching(False)
+        else:
+            await call_or_await(self._toggle_fetching, True)
+
+    async def pause_partitions(self, partitions: Iterable[Tuple[str, int]]) -> None:
+        """Suspends fetching from the assigned partitions of the given ones."""
+        if selected := self._select_assigned(partitions):
+            await call_or_await(self.consumer.pause, selected)
+
+    async def resume_partitions(self, partitions: Iterable[Tuple[str, int]]) -> None:
+        """Resumes fetching from the assigned partitions of the given ones."""
+        if selected := self._select_assigned(partitions):
+            await call_or_await(self.consumer.resume, selected)
+
+    def _select_assigned(
+        self,
+        partitions: Iterable[Tuple[str, int]],
+    ) -> List["ConfluentPartition"]:
+        # partitions can be already revoked
+        selected = set(partitions)
+        return [
+            tp
+            for tp in self.consumer.assignment()
+            if (tp.topic, tp.partition) in selected  # type: ignore[attr-defined]
+        ]
+
+    def _hold_fetching(self, held: bool) -> None:
+        # partitions are paused and resumed by the fetch thread itself
+        with self._fetch_state:
+            self._held = held
+            self._fetch_state.notify()
+
+    def _toggle_fetching(self, enabled: bool) -> None:
+        assignment = self.consumer.assignment()
+        if enabled:
+            self.consumer.resume(assignment)
+        else:
+            self.consumer.pause(assignment)
+
     async def seek(self, topic: str, partition: int, offset: int) -> None:
         """Seeks to the specified offset in the specified topic and partition."""
         topic_partition = TopicPartition(
@@ -403,6 +789,96 @@ class AsyncConfluentConsumer:
         await call_or_await(self.consumer.seek, topic_partition.to_confluent())
 
 
+def _make_send_kwargs(
+    value: Optional[Union[str, bytes]],
+    key: Optional[Union[str, bytes]],
+    partition: Optional[int],
+    timestamp_ms: Optional[int],
+    headers: Optional[List[Tuple[str, Union[str, bytes]]]],
+) -> "_SendKwargs":
+    kwargs: _SendKwargs = {
+        "value": value,
+        "key": key,
+        "headers": headers,
+    }
+
+    if partition is not None:
+        kwargs["partition"] = partition
+
+    if timestamp_ms is not None:
+        kwargs["timestamp"] = timestamp_ms
+
+    return kwargs
+
+
+def _resolve_reports(reports: Iterable["DeliveryReport"]) -> None:
+    for future, err, msg in reports:
+        if future.done():  # cancelled by caller
+            continue
+
+        if err or (msg is not None and (err := msg.error())):
+            future.set_exception(KafkaException(err))
+        else:
+            future.set_result(msg)
+
+
+class _BatchDelivery:
+    """Future-like delivery reports receiver of a whole batch.
+
+    Resolves the batch future by the last message report, fails it by the first error.
+    """
+
+    __slots__ = ("error", "future", "pending")
+
+    def __init__(self, future: "asyncio.Future[None]", pending: int) -> None:
+        self.future = future
+        self.pending = pending
+        self.error: Optional[BaseException] = None
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def set_result(self, msg: Optional[Message]) -> None:
+        self._report()
+
+    def set_exception(self, exc: BaseException) -> None:
+        if self.error is None:
+            self.error = exc
+        self._report()
+
+    def _report(self) -> None:
+        self.pending -= 1
+
+        if self.pending <= 0:
+            if self.error is None:
+                self.future.set_result(None)
+            else:
+                self.future.set_exception(self.error)
+
+
+def _to_rebalance_callback(
+    callback: "RebalanceCallback",
+    loop: asyncio.AbstractEventLoop,
+) -> Callable[[Consumer, List["ConfluentPartition"]], None]:
+    def rebalance_callback(
+        consumer: Consumer,
+        partitions: List["ConfluentPartition"],
+    ) -> None:
+        # `poll` and `close` are running in a worker or fetch thread, so we
+        # block it until the callback is finished at the event loop
+        asyncio.run_coroutine_threadsafe(
+            callback(
+                [
+                    TopicPartition(topic=p.topic, partition=p.partition)  # type: ignore[attr-defined]
+                    for p in partitions
+                ]
+            ),
+            loop,
+        ).result()
+
+    return rebalance_callback
+
+
 def check_msg_error(msg: Optional[Message]) -> Optional[Message]:
     """Checks for errors in the consumed message."""
     if msg is None or msg.error():
@@ -55,6 +55,7 @@ if TYPE_CHECKING:
     from faststream.confluent.schemas import TopicPartition
     from faststream.confluent.subscriber.asyncapi import (
         AsyncAPIBatchSubscriber,
+        AsyncAPIConcurrentBetweenPartitionsSubscriber,
         AsyncAPIConcurrentDefaultSubscriber,
         AsyncAPIDefaultSubscriber,
     )
@@ -252,6 +253,18 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
         ] = False,
         transactional_id: Optional[str] = None,
         transaction_timeout_ms: int = 60 * 1000,
+        background_fetch: Annotated[
+            bool,
+            Doc(
+                """
+            Fetch messages by a dedicated consumer thread instead of a threadpool
+            call per `poll`. Fetched batches are buffered in an asyncio queue and
+            partitions are paused while the buffer is full. Buffered messages of
+            revoked partitions are dropped. Can't be used with `auto_commit=False`
+            subscribers.
+            """
+            ),
+        ] = False,
         # broker base args
         graceful_timeout: Annotated[
             Optional[float],
@@ -561,6 +574,7 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             enable_idempotence=enable_idempotence,
             transactional_id=transactional_id,
             transaction_timeout_ms=transaction_timeout_ms,
+            background_fetch=background_fetch,
             # broker args
             graceful_timeout=graceful_timeout,
             decoder=decoder,
@@ -2210,15 +2224,24 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        parallel_partitions: Annotated[
+            bool,
+            Doc(
+                "Whether to process messages of each assigned partition by its own serial worker. "
+                "Partitions are processed concurrently, messages order inside a partition is kept."
+            ),
+        ] = False,
     ) -> Union[
         "AsyncAPIBatchSubscriber",
         "AsyncAPIDefaultSubscriber",
         "AsyncAPIConcurrentDefaultSubscriber",
+        "AsyncAPIConcurrentBetweenPartitionsSubscriber",
     ]:
         subscriber = super().subscriber(
             *topics,
             polling_interval=polling_interval,
             max_workers=max_workers,
+            parallel_partitions=parallel_partitions,
             partitions=partitions,
             group_id=group_id,
             group_instance_id=group_instance_id,
@@ -2262,7 +2285,9 @@ class KafkaRouter(StreamRouter[Union[Message, Tuple[Message, ...]]]):
         if batch:
             return cast("AsyncAPIBatchSubscriber", subscriber)
         else:
-            if max_workers > 1:
+            if parallel_partitions:
+                return cast("AsyncAPIConcurrentBetweenPartitionsSubscriber", subscriber)
+            elif max_workers > 1:
                 return cast("AsyncAPIConcurrentDefaultSubscriber", subscriber)
             else:
                 return cast("AsyncAPIDefaultSubscriber", subscriber)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
-from faststream.broker.message import decode_message, gen_cor_id
+from faststream.broker.message import decode_batch, decode_message, gen_cor_id
 from faststream.confluent.message import FAKE_CONSUMER, KafkaMessage
 from faststream.utils.context.repository import context
 
@@ -81,13 +81,13 @@ class AsyncConfluentParser:
         """Decodes a message."""
         return decode_message(msg)
 
-    @classmethod
+    @staticmethod
     async def decode_message_batch(
-        cls,
         msg: "StreamMessage[Tuple[Message, ...]]",
     ) -> "DecodedMessage":
         """Decode a batch of messages."""
-        return [decode_message(await cls.parse_message(m)) for m in msg.raw_message]
+        # records are already parsed to the batch body and headers
+        return decode_batch(msg.body, msg.batch_headers)
 
 
 def _parse_msg_headers(
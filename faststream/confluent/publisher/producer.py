@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from typing_extensions import override
 
@@ -9,6 +10,10 @@ from faststream.confluent.parser import AsyncConfluentParser
 from faststream.exceptions import OperationForbiddenError
 
 if TYPE_CHECKING:
+    import asyncio
+
+    from confluent_kafka import Message
+
     from faststream.broker.types import CustomCallable
     from faststream.confluent.client import AsyncConfluentProducer
     from faststream.types import SendableMessage
@@ -45,30 +50,46 @@ class AsyncConfluentFastProducer(ProducerProto):
         no_confirm: bool = False,
     ) -> None:
         """Publish a message to a topic."""
-        message, content_type = encode_message(message)
-
-        headers_to_send = {
-            "content-type": content_type or "",
-            "correlation_id": correlation_id,
-            **(headers or {}),
-        }
-
-        if reply_to:
-            headers_to_send["reply_to"] = headers_to_send.get(
-                "reply_to",
-                reply_to,
-            )
+        body, headers_to_send = _encode_message(
+            message, headers, correlation_id, reply_to
+        )
 
         await self._producer.send(
             topic=topic,
-            value=message,
+            value=body,
             key=key,
             partition=partition,
             timestamp_ms=timestamp_ms,
-            headers=[(i, (j or "").encode()) for i, j in headers_to_send.items()],
+            headers=headers_to_send,
             no_confirm=no_confirm,
         )
 
+    async def send(
+        self,
+        message: "SendableMessage",
+        topic: str,
+        *,
+        key: Optional[bytes] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        correlation_id: str = "",
+        reply_to: str = "",
+    ) -> "asyncio.Future[Optional[Message]]":
+        """Put a message to the producer queue and return its delivery report future."""
+        body, headers_to_send = _encode_message(
+            message, headers, correlation_id, reply_to
+        )
+
+        return self._producer.produce(
+            topic=topic,
+            value=body,
+            key=key,
+            partition=partition,
+            timestamp_ms=timestamp_ms,
+            headers=headers_to_send,
+        )
+
     async def stop(self) -> None:
         await self._producer.stop()
 
@@ -77,13 +98,20 @@ class AsyncConfluentFastProducer(ProducerProto):
         *msgs: "SendableMessage",
         topic: str,
         partition: Optional[int] = None,
+        keys: Optional[Sequence[Optional[bytes]]] = None,
         timestamp_ms: Optional[int] = None,
         headers: Optional[Dict[str, str]] = None,
         reply_to: str = "",
         correlation_id: str = "",
         no_confirm: bool = False,
     ) -> None:
-        """Publish a batch of messages to a topic."""
+        """Publish a batch of messages to a topic.
+
+        Keyed messages are placed to partitions by the librdkafka partitioner.
+        """
+        if keys is not None and len(keys) != len(msgs):
+            raise ValueError("You should pass a key for each batch message.")
+
         batch = self._producer.create_batch()
 
         headers_to_send = {"correlation_id": correlation_id, **(headers or {})}
@@ -94,7 +122,7 @@ class AsyncConfluentFastProducer(ProducerProto):
                 reply_to,
             )
 
-        for msg in msgs:
+        for msg, key in zip(msgs, keys or repeat(None)):
             message, content_type = encode_message(msg)
 
             if content_type:
@@ -106,7 +134,7 @@ class AsyncConfluentFastProducer(ProducerProto):
                 final_headers = headers_to_send.copy()
 
             batch.append(
-                key=None,
+                key=key,
                 value=message,
                 timestamp=timestamp_ms,
                 headers=[(i, j.encode()) for i, j in final_headers.items()],
@@ -124,3 +152,26 @@ class AsyncConfluentFastProducer(ProducerProto):
         raise OperationForbiddenError(
             "Kafka doesn't support `request` method without test client."
         )
+
+
+def _encode_message(
+    message: "SendableMessage",
+    headers: Optional[Dict[str, str]],
+    correlation_id: str,
+    reply_to: str,
+) -> Tuple[bytes, List[Tuple[str, Union[str, bytes]]]]:
+    body, content_type = encode_message(message)
+
+    headers_to_send = {
+        "content-type": content_type or "",
+        "correlation_id": correlation_id,
+        **(headers or {}),
+    }
+
+    if reply_to:
+        headers_to_send["reply_to"] = headers_to_send.get(
+            "reply_to",
+            reply_to,
+        )
+
+    return body, [(i, (j or "").encode()) for i, j in headers_to_send.items()]
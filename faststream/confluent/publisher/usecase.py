@@ -4,10 +4,13 @@ from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
     Iterable,
+    List,
     Optional,
     Sequence,
     Tuple,
@@ -21,10 +24,13 @@ from typing_extensions import override
 from faststream.broker.message import SourceType, gen_cor_id
 from faststream.broker.publisher.usecase import PublisherUsecase
 from faststream.broker.types import MsgType
+from faststream.broker.utils import deliver_in_scope, publish_with_window
 from faststream.exceptions import NOT_CONNECTED_YET
 from faststream.utils.functions import return_input
 
 if TYPE_CHECKING:
+    import asyncio
+
     from faststream.broker.types import BrokerMiddleware, PublisherMiddleware
     from faststream.confluent.message import KafkaMessage
     from faststream.confluent.publisher.producer import AsyncConfluentFastProducer
@@ -209,6 +215,85 @@ class DefaultPublisher(LogicPublisher[Message]):
 
         return await call(message, **kwargs)
 
+    async def publish_stream(
+        self,
+        messages: Union[Iterable["SendableMessage"], AsyncIterable["SendableMessage"]],
+        topic: str = "",
+        *,
+        max_in_flight: int = 100,
+        key: Optional[bytes] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        reply_to: str = "",
+        # publisher specific
+        _extra_middlewares: Iterable["PublisherMiddleware"] = (),
+    ) -> AsyncIterator[Optional[Message]]:
+        """Publish messages keeping up to `max_in_flight` unconfirmed sends.
+
+        Yields delivered messages (with partition and offset) in order and
+        raises the first delivery error.
+
+        Publish middlewares scope of each message lasts until its delivery.
+        """
+        assert self._producer, NOT_CONNECTED_YET  # nosec B101
+
+        kwargs: AnyDict = {
+            "key": key or self.key,
+            # basic args
+            "topic": topic or self.topic,
+            "partition": partition or self.partition,
+            "timestamp_ms": timestamp_ms,
+            "headers": headers or self.headers,
+            "reply_to": reply_to or self.reply_to,
+        }
+
+        call = deliver_in_scope(
+            self._producer.send,
+            chain(
+                self._middlewares[::-1],
+                (
+                    _extra_middlewares
+                    or (m(None).publish_scope for m in self._broker_middlewares[::-1])
+                ),
+            ),
+        )
+
+        async def send(
+            message: "SendableMessage",
+        ) -> "asyncio.Future[Optional[Message]]":
+            return await call(message, correlation_id=gen_cor_id(), **kwargs)
+
+        async for msg in publish_with_window(messages, send, max_in_flight):
+            yield msg
+
+    async def publish_many(
+        self,
+        messages: Union[Iterable["SendableMessage"], AsyncIterable["SendableMessage"]],
+        topic: str = "",
+        *,
+        max_in_flight: int = 100,
+        key: Optional[bytes] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        reply_to: str = "",
+    ) -> List[Optional[Message]]:
+        """Publish all messages by `publish_stream` and return their delivery reports."""
+        return [
+            msg
+            async for msg in self.publish_stream(
+                messages,
+                topic,
+                max_in_flight=max_in_flight,
+                key=key,
+                partition=partition,
+                timestamp_ms=timestamp_ms,
+                headers=headers,
+                reply_to=reply_to,
+            )
+        ]
+
     @override
     async def request(
         self,
@@ -245,6 +330,7 @@ class BatchPublisher(LogicPublisher[Tuple[Message, ...]]):
         *extra_messages: "SendableMessage",
         topic: str = "",
         partition: Optional[int] = None,
+        keys: Optional[Sequence[Optional[bytes]]] = None,
         timestamp_ms: Optional[int] = None,
         headers: Optional[Dict[str, str]] = None,
         correlation_id: Optional[str] = None,
@@ -265,6 +351,7 @@ class BatchPublisher(LogicPublisher[Tuple[Message, ...]]):
             "topic": topic or self.topic,
             "no_confirm": no_confirm,
             "partition": partition or self.partition,
+            "keys": keys,
             "timestamp_ms": timestamp_ms,
             "headers": headers or self.headers,
             "reply_to": reply_to or self.reply_to,
@@ -426,12 +426,20 @@ class KafkaRoute(SubscriberRoute):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        parallel_partitions: Annotated[
+            bool,
+            Doc(
+                "Whether to process messages of each assigned partition by its own serial worker. "
+                "Partitions are processed concurrently, messages order inside a partition is kept."
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             call,
             *topics,
             publishers=publishers,
             max_workers=max_workers,
+            parallel_partitions=parallel_partitions,
             partitions=partitions,
             polling_interval=polling_interval,
             group_id=group_id,
@@ -0,0 +1,153 @@
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from faststream.types import AnyDict
+
+# librdkafka statistics fields used by the metrics, all other fields
+# are dropped while decoding
+_STATS_FIELDS = frozenset(
+    (
+        "name",
+        "type",
+        "msg_cnt",
+        "msg_size",
+        "replyq",
+        "txmsgs",
+        "rxmsgs",
+        "outbuf_cnt",
+        "waitresp_cnt",
+        "avg",
+    )
+)
+
+
+class BrokerStats(NamedTuple):
+    rtt_seconds: float
+    outbuf_requests: int
+    waitresp_requests: int
+
+
+class TopicStats(NamedTuple):
+    batch_size_bytes: float
+    batch_messages: float
+
+
+class ClientStats(NamedTuple):
+    """Selected gauges of a librdkafka statistics report."""
+
+    name: str
+    type: str
+    queue_messages: int
+    queue_bytes: int
+    reply_queue_ops: int
+    transmitted_messages: int
+    received_messages: int
+    brokers: Dict[str, BrokerStats]
+    topics: Dict[str, TopicStats]
+
+
+class ClientStatsRecorder(Protocol):
+    """librdkafka statistics sink provided by metrics middlewares."""
+
+    def observe_client_stats(self, broker: str, stats: ClientStats) -> None: ...
+
+
+def _prune(pairs: List[Tuple[str, Any]]) -> "AnyDict":
+    """Keep used fields and not empty nested objects only.
+
+    Called for every JSON object at decoding, so large subtrees (partitions,
+    requests counters) are released right after their creation and never
+    accumulate as GC tracked objects.
+    """
+    if any(k == "partition" for k, _ in pairs):
+        return {}
+
+    return {k: v for k, v in pairs if k in _STATS_FIELDS or (v and type(v) is dict)}
+
+
+def parse_stats(raw: str) -> ClientStats:
+    """Decode librdkafka statistics JSON to the selected gauges."""
+    data = json.loads(raw, object_pairs_hook=_prune)
+
+    return ClientStats(
+        name=data.get("name", ""),
+        type=data.get("type", ""),
+        queue_messages=data.get("msg_cnt", 0),
+        queue_bytes=data.get("msg_size", 0),
+        reply_queue_ops=data.get("replyq", 0),
+        transmitted_messages=data.get("txmsgs", 0),
+        received_messages=data.get("rxmsgs", 0),
+        brokers={
+            name: BrokerStats(
+                # librdkafka windows are in microseconds
+                rtt_seconds=b.get("rtt", {}).get("avg", 0) / 1_000_000,
+                outbuf_requests=b.get("outbuf_cnt", 0),
+                waitresp_requests=b.get("waitresp_cnt", 0),
+            )
+            for name, b in data.get("brokers", {}).items()
+        },
+        topics={
+            name: TopicStats(
+                batch_size_bytes=t.get("batchsize", {}).get("avg", 0),
+                batch_messages=t.get("batchcnt", {}).get("avg", 0),
+            )
+            for name, t in data.get("topics", {}).items()
+        },
+    )
+
+
+class StatisticsBridge:
+    """librdkafka `stats_cb` publishing statistics to metrics recorders.
+
+    librdkafka calls it from `poll`, which runs in a worker thread, so
+    the statistics are parsed off the event loop.
+    """
+
+    __slots__ = ("broker", "recorders")
+
+    def __init__(
+        self,
+        recorders: Iterable[ClientStatsRecorder],
+        broker: str = "kafka",
+    ) -> None:
+        self.broker = broker
+        self.recorders = tuple(recorders)
+
+    def __call__(self, raw: str) -> None:
+        stats = parse_stats(raw)
+
+        for r in self.recorders:
+            r.observe_client_stats(broker=self.broker, stats=stats)
+
+
+def create_stats_callback(
+    config: "AnyDict",
+    middlewares: Iterable[Any],
+) -> Optional[StatisticsBridge]:
+    """Create the statistics bridge if statistics are enabled by `statistics.interval.ms`.
+
+    Recorders are taken from broker middlewares `client_metrics` attribute.
+    User `stats_cb` takes precedence over the bridge.
+    """
+    if not config.get("statistics.interval.ms") or "stats_cb" in config:
+        return None
+
+    recorders = tuple(
+        r for m in middlewares if (r := getattr(m, "client_metrics", None)) is not None
+    )
+
+    if not recorders:
+        return None
+
+    return StatisticsBridge(recorders)
@@ -17,6 +17,7 @@ from faststream.asyncapi.utils import resolve_payloads
 from faststream.broker.types import MsgType
 from faststream.confluent.subscriber.usecase import (
     BatchSubscriber,
+    ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
     DefaultSubscriber,
     LogicSubscriber,
@@ -80,3 +81,10 @@ class AsyncAPIConcurrentDefaultSubscriber(
     AsyncAPISubscriber["ConfluentMsg"],
 ):
     pass
+
+
+class AsyncAPIConcurrentBetweenPartitionsSubscriber(
+    ConcurrentBetweenPartitionsSubscriber,
+    AsyncAPISubscriber["ConfluentMsg"],
+):
+    pass
@@ -12,6 +12,7 @@ from typing import (
 
 from faststream.confluent.subscriber.asyncapi import (
     AsyncAPIBatchSubscriber,
+    AsyncAPIConcurrentBetweenPartitionsSubscriber,
     AsyncAPIConcurrentDefaultSubscriber,
     AsyncAPIDefaultSubscriber,
 )
@@ -40,6 +41,7 @@ def create_subscriber(
     # Subscriber args
     no_ack: bool,
     max_workers: int,
+    parallel_partitions: bool,
     no_reply: bool,
     retry: bool,
     broker_dependencies: Iterable["Depends"],
@@ -65,6 +67,7 @@ def create_subscriber(
     # Subscriber args
     no_ack: bool,
     max_workers: int,
+    parallel_partitions: bool,
     no_reply: bool,
     retry: bool,
     broker_dependencies: Iterable["Depends"],
@@ -76,6 +79,7 @@ def create_subscriber(
 ) -> Union[
     "AsyncAPIDefaultSubscriber",
     "AsyncAPIConcurrentDefaultSubscriber",
+    "AsyncAPIConcurrentBetweenPartitionsSubscriber",
 ]: ...
 
 
@@ -93,6 +97,7 @@ def create_subscriber(
     # Subscriber args
     no_ack: bool,
     max_workers: int,
+    parallel_partitions: bool,
     no_reply: bool,
     retry: bool,
     broker_dependencies: Iterable["Depends"],
@@ -108,6 +113,7 @@ def create_subscriber(
     "AsyncAPIDefaultSubscriber",
     "AsyncAPIBatchSubscriber",
     "AsyncAPIConcurrentDefaultSubscriber",
+    "AsyncAPIConcurrentBetweenPartitionsSubscriber",
 ]: ...
 
 
@@ -124,6 +130,7 @@ def create_subscriber(
     # Subscriber args
     no_ack: bool,
     max_workers: int,
+    parallel_partitions: bool,
     no_reply: bool,
     retry: bool,
     broker_dependencies: Iterable["Depends"],
@@ -139,10 +146,20 @@ def create_subscriber(
     "AsyncAPIDefaultSubscriber",
     "AsyncAPIBatchSubscriber",
     "AsyncAPIConcurrentDefaultSubscriber",
+    "AsyncAPIConcurrentBetweenPartitionsSubscriber",
 ]:
     if is_manual and max_workers > 1:
         raise SetupError("Max workers not work with manual commit mode.")
 
+    if parallel_partitions and batch:
+        raise SetupError("You can't use `parallel_partitions` with batch consuming.")
+
+    if parallel_partitions and max_workers > 1:
+        raise SetupError("You can't use both `parallel_partitions` and `max_workers`.")
+
+    if parallel_partitions and is_manual:
+        raise SetupError("Parallel partitions not work with manual commit mode.")
+
     if batch:
         return AsyncAPIBatchSubscriber(
             *topics,
@@ -165,7 +182,27 @@ def create_subscriber(
             include_in_schema=include_in_schema,
         )
     else:
-        if max_workers > 1:
+        if parallel_partitions:
+            return AsyncAPIConcurrentBetweenPartitionsSubscriber(
+                *topics,
+                partitions=partitions,
+                polling_interval=polling_interval,
+                group_id=group_id,
+                connection_data=connection_data,
+                is_manual=is_manual,
+                no_ack=no_ack,
+                no_reply=no_reply,
+                retry=retry,
+                broker_dependencies=broker_dependencies,
+                broker_middlewares=cast(
+                    Sequence["BrokerMiddleware[ConfluentMsg]"],
+                    broker_middlewares,
+                ),
+                title_=title_,
+                description_=description_,
+                include_in_schema=include_in_schema,
+            )
+        elif max_workers > 1:
             return AsyncAPIConcurrentDefaultSubscriber(
                 *topics,
                 max_workers=max_workers,
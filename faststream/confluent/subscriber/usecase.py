@@ -16,7 +16,12 @@ from confluent_kafka import KafkaException, Message
 from typing_extensions import override
 
 from faststream.broker.publisher.fake import FakePublisher
-from faststream.broker.subscriber.mixins import ConcurrentMixin, TasksMixin
+from faststream.broker.subscriber.metrics import ConsumerMetrics
+from faststream.broker.subscriber.mixins import (
+    PartitionsConcurrentMixin,
+    PausableConcurrentMixin,
+    TasksMixin,
+)
 from faststream.broker.subscriber.usecase import SubscriberUsecase
 from faststream.broker.types import MsgType
 from faststream.broker.utils import process_msg
@@ -47,6 +52,7 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
     consumer: Optional["AsyncConfluentConsumer"]
 
     client_id: Optional[str]
+    consumer_metrics: ConsumerMetrics
 
     def __init__(
         self,
@@ -93,6 +99,7 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
         self.is_manual = is_manual
 
         self.consumer = None
+        self.consumer_metrics = ConsumerMetrics(broker="kafka", handler="")
         self.polling_interval = polling_interval
 
         # Setup it later
@@ -140,12 +147,22 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
         """Start the consumer."""
         assert self.builder, "You should setup subscriber at first."  # nosec B101
 
+        self.consumer_metrics = ConsumerMetrics(
+            broker="kafka",
+            handler=",".join(self.topic_names),
+            middlewares=self._broker_middlewares,
+        )
+
+        connection_data = self.__connection_data
+        if self.consumer_metrics:
+            connection_data = self._with_rebalance_metrics(connection_data)
+
         self.consumer = consumer = self.builder(
             *self.topics,
             partitions=self.partitions,
             group_id=self.group_id,
             client_id=self.client_id,
-            **self.__connection_data,
+            **connection_data,
         )
         await consumer.start()
 
@@ -200,6 +217,45 @@ class LogicSubscriber(TasksMixin, SubscriberUsecase[MsgType]):
     async def consume_one(self, msg: MsgType) -> None:
         await self.consume(msg)
 
+    def _with_rebalance_metrics(self, connection_data: "AnyDict") -> "AnyDict":
+        """Wrap rebalance callbacks to observe rebalances count and duration."""
+        on_assign = connection_data.get("on_assign")
+        on_revoke = connection_data.get("on_revoke")
+
+        async def observe_assign(partitions: List["TopicPartition"]) -> None:
+            if on_assign is not None:
+                await on_assign(partitions)
+            self.consumer_metrics.rebalance_finished()
+
+        async def observe_revoke(partitions: List["TopicPartition"]) -> None:
+            self.consumer_metrics.rebalance_started()
+
+            for tp in partitions:
+                self.consumer_metrics.remove_lag(tp.topic, tp.partition)
+
+            if on_revoke is not None:
+                await on_revoke(partitions)
+
+        return {
+            **connection_data,
+            "on_assign": observe_assign,
+            "on_revoke": observe_revoke,
+        }
+
+    def _observe_fetch(self, messages: Sequence[Message]) -> None:
+        """Send fetched messages count and partitions lag to metrics."""
+        assert self.consumer  # nosec B101
+
+        self.consumer_metrics.fetched(len(messages))
+
+        last_offsets: Dict[Tuple[str, int], int] = {}
+        for msg in messages:
+            last_offsets[(msg.topic(), msg.partition())] = msg.offset()  # type: ignore[index,assignment]
+
+        for (topic, partition), offset in last_offsets.items():
+            if (highwater := self.consumer.highwater(topic, partition)) is not None:
+                self.consumer_metrics.lag(topic, partition, highwater - offset - 1)
+
     @abstractmethod
     async def get_msg(self) -> Optional[MsgType]:
         raise NotImplementedError()
@@ -312,7 +368,13 @@ class DefaultSubscriber(LogicSubscriber[Message]):
 
     async def get_msg(self) -> Optional["Message"]:
         assert self.consumer, "You should setup subscriber at first."  # nosec B101
-        return await self.consumer.getone(timeout=self.polling_interval)
+
+        msg = await self.consumer.getone(timeout=self.polling_interval)
+
+        if self.consumer_metrics:
+            self._observe_fetch(() if msg is None else (msg,))
+
+        return msg
 
     def get_log_context(
         self,
@@ -384,6 +446,9 @@ class BatchSubscriber(LogicSubscriber[Tuple[Message, ...]]):
             max_records=self.max_records,
         )
 
+        if self.consumer_metrics:
+            self._observe_fetch(messages)
+
         if not messages:  # TODO: why we are sleeping here?
             await anyio.sleep(self.polling_interval)
             return None
@@ -406,7 +471,7 @@ class BatchSubscriber(LogicSubscriber[Tuple[Message, ...]]):
         )
 
 
-class ConcurrentDefaultSubscriber(ConcurrentMixin[Message], DefaultSubscriber):
+class ConcurrentDefaultSubscriber(PausableConcurrentMixin[Message], DefaultSubscriber):
     def __init__(
         self,
         *topics: str,
@@ -455,3 +520,101 @@ class ConcurrentDefaultSubscriber(ConcurrentMixin[Message], DefaultSubscriber):
 
     async def consume_one(self, msg: "Message") -> None:
         await self._put_msg(msg)
+
+    async def pause_consuming(self) -> None:
+        if self.consumer is not None:
+            await self.consumer.pause()
+
+    async def resume_consuming(self) -> None:
+        if self.consumer is not None:
+            await self.consumer.resume()
+
+
+class ConcurrentBetweenPartitionsSubscriber(
+    PartitionsConcurrentMixin[Message],
+    DefaultSubscriber,
+):
+    """Consume messages of assigned partitions concurrently keeping in-partition order."""
+
+    def __init__(
+        self,
+        *topics: str,
+        # Kafka information
+        partitions: Sequence["TopicPartition"],
+        polling_interval: float,
+        group_id: Optional[str],
+        connection_data: "AnyDict",
+        is_manual: bool,
+        # Subscriber args
+        no_ack: bool,
+        no_reply: bool,
+        retry: bool,
+        broker_dependencies: Iterable["Depends"],
+        broker_middlewares: Sequence["BrokerMiddleware[Message]"],
+        # AsyncAPI args
+        title_: Optional[str],
+        description_: Optional[str],
+        include_in_schema: bool,
+    ) -> None:
+        super().__init__(
+            *topics,
+            partitions=partitions,
+            polling_interval=polling_interval,
+            group_id=group_id,
+            connection_data={
+                **connection_data,
+                "on_assign": self._on_assign,
+                "on_revoke": self._on_revoke,
+            },
+            is_manual=is_manual,
+            # Propagated args
+            no_ack=no_ack,
+            no_reply=no_reply,
+            retry=retry,
+            broker_middlewares=broker_middlewares,
+            broker_dependencies=broker_dependencies,
+            # AsyncAPI args
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        )
+
+    async def _consume(self) -> None:
+        assert self.consumer, "You should start subscriber at first."  # nosec B101
+
+        connected = True
+        while self.running:
+            try:
+                messages = await self.consumer.getmany(timeout=self.polling_interval)
+            except KafkaException:  # pragma: no cover  # noqa: PERF203
+                if connected:
+                    connected = False
+                await anyio.sleep(5)
+
+            else:
+                if not connected:  # pragma: no cover
+                    connected = True
+
+                if self.consumer_metrics:
+                    self._observe_fetch(messages)
+
+                for msg in messages:
+                    await self.consume_one(msg)
+
+    async def consume_one(self, msg: "Message") -> None:
+        await self._put_partition_msg((msg.topic(), msg.partition()), msg)
+
+    async def pause_partition(self, partition: Tuple[str, int]) -> None:  # type: ignore[override]
+        if self.consumer is not None:
+            await self.consumer.pause_partitions((partition,))
+
+    async def resume_partition(self, partition: Tuple[str, int]) -> None:  # type: ignore[override]
+        if self.consumer is not None:
+            await self.consumer.resume_partitions((partition,))
+
+    async def _on_assign(self, partitions: List["TopicPartition"]) -> None:
+        self.start_partition_workers((p.topic, p.partition) for p in partitions)
+
+    async def _on_revoke(self, partitions: List["TopicPartition"]) -> None:
+        # finish revoked partitions messages before the partitions reassignment
+        await self.stop_partition_workers((p.topic, p.partition) for p in partitions)
@@ -1,5 +1,16 @@
+import asyncio
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from itertools import repeat
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from unittest.mock import AsyncMock, MagicMock
 
 import anyio
@@ -18,6 +29,8 @@ from faststream.testing.broker import TestBroker
 from faststream.utils.functions import timeout_scope
 
 if TYPE_CHECKING:
+    from confluent_kafka import Message
+
     from faststream.confluent.publisher.asyncapi import AsyncAPIPublisher
     from faststream.confluent.subscriber.usecase import LogicSubscriber
     from faststream.types import SendableMessage
@@ -139,11 +152,54 @@ class FakeProducer(AsyncConfluentFastProducer):
 
         return return_value
 
+    @override
+    async def send(
+        self,
+        message: "SendableMessage",
+        topic: str,
+        *,
+        key: Optional[bytes] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        correlation_id: str = "",
+        reply_to: str = "",
+    ) -> "asyncio.Future[Optional[Message]]":
+        """Publish a message and return already confirmed delivery future."""
+        await self.publish(
+            message,
+            topic,
+            key=key,
+            partition=partition,
+            timestamp_ms=timestamp_ms,
+            headers=headers,
+            correlation_id=correlation_id,
+            reply_to=reply_to,
+        )
+
+        future: asyncio.Future[Optional[Message]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        future.set_result(
+            build_message(  # type: ignore[arg-type]
+                message=message,
+                topic=topic,
+                key=key,
+                partition=partition,
+                timestamp_ms=timestamp_ms,
+                headers=headers,
+                correlation_id=correlation_id,
+                reply_to=reply_to,
+            )
+        )
+        return future
+
     async def publish_batch(
         self,
         *msgs: "SendableMessage",
         topic: str,
         partition: Optional[int] = None,
+        keys: Optional[Sequence[Optional[bytes]]] = None,
         timestamp_ms: Optional[int] = None,
         headers: Optional[Dict[str, str]] = None,
         reply_to: str = "",
@@ -158,12 +214,13 @@ class FakeProducer(AsyncConfluentFastProducer):
                         message=message,
                         topic=topic,
                         partition=partition,
+                        key=key,
                         timestamp_ms=timestamp_ms,
                         headers=headers,
                         correlation_id=correlation_id or gen_cor_id(),
                         reply_to=reply_to,
                     )
-                    for message in msgs
+                    for message, key in zip(msgs, keys or repeat(None))
                 )
 
                 if isinstance(handler, AsyncAPIBatchSubscriber):
@@ -28,8 +28,10 @@ from faststream.exceptions import NOT_CONNECTED_YET
 from faststream.kafka.broker.logging import KafkaLoggingBroker
 from faststream.kafka.broker.registrator import KafkaRegistrator
 from faststream.kafka.publisher.producer import AioKafkaFastProducer
+from faststream.kafka.publisher.reply import RepliesConsumer
 from faststream.kafka.schemas.params import ConsumerConnectionParams
 from faststream.kafka.security import parse_security
+from faststream.kafka.subscriber.shared import SharedConsumersPool
 from faststream.types import EMPTY
 from faststream.utils.data import filter_by_dict
 
@@ -235,6 +237,7 @@ class KafkaBroker(
 ):
     url: List[str]
     _producer: Optional["AioKafkaFastProducer"]
+    _consumers_pool: Optional["SharedConsumersPool"]
 
     def __init__(
         self,
@@ -421,6 +424,33 @@ class KafkaBroker(
         ] = False,
         transactional_id: Optional[str] = None,
         transaction_timeout_ms: int = 60 * 1000,
+        # consumer args
+        shared_consumers: Annotated[
+            bool,
+            Doc(
+                """
+            Whether to serve all subscribers with the same `group_id` and connection options
+            by a single `AIOKafkaConsumer`. The shared consumer subscribes to the union of
+            subscribers topics and dispatches records to subscribers by topic.
+            Each subscriber processes its records in its own task, so a slow handler
+            pauses only its own topics. Subscribers with `pattern`, `partitions`,
+            custom `listener`, `batch=True` or `auto_commit=False` always use their
+            own consumer.
+            """
+            ),
+        ] = False,
+        reply_topic: Annotated[
+            str,
+            Doc(
+                """
+            Topic to consume RPC replies from. A single consumer without consumer group
+            reads this topic and routes replies to `request` calls by `correlation_id`.
+            The topic is shared by all broker instances: each process resolves only
+            replies to its own requests and ignores the rest. Create it in advance if
+            topics auto creation is disabled on your cluster.
+            """
+            ),
+        ] = "faststream-replies",
         # broker base args
         graceful_timeout: Annotated[
             Optional[float],
@@ -578,6 +608,8 @@ class KafkaBroker(
 
         self.client_id = client_id
         self._producer = None
+        self._consumers_pool = SharedConsumersPool() if shared_consumers else None
+        self._reply_topic = reply_topic
 
     async def _close(
         self,
@@ -585,6 +617,9 @@ class KafkaBroker(
         exc_val: Optional[BaseException] = None,
         exc_tb: Optional["TracebackType"] = None,
     ) -> None:
+        if self._consumers_pool is not None:
+            await self._consumers_pool.stop()
+
         if self._producer is not None:  # pragma: no branch
             await self._producer.stop()
             self._producer = None
@@ -631,16 +666,24 @@ class KafkaBroker(
         )
 
         await producer.start()
+
+        builder = partial(
+            aiokafka.AIOKafkaConsumer,
+            **filter_by_dict(ConsumerConnectionParams, kwargs),
+        )
+
         self._producer = AioKafkaFastProducer(
             producer=producer,
             parser=self._parser,
             decoder=self._decoder,
+            replies=RepliesConsumer(
+                topic=self._reply_topic,
+                builder=partial(builder, client_id=client_id),
+                producer=producer,
+            ),
         )
 
-        return partial(
-            aiokafka.AIOKafkaConsumer,
-            **filter_by_dict(ConsumerConnectionParams, kwargs),
-        )
+        return builder
 
     async def start(self) -> None:
         """Connect broker to Kafka and startup all subscribers."""
@@ -653,12 +696,16 @@ class KafkaBroker(
             )
             await handler.start()
 
+        if self._consumers_pool is not None:
+            await self._consumers_pool.start()
+
     @property
     def _subscriber_setup_extra(self) -> "AnyDict":
         return {
             **super()._subscriber_setup_extra,
             "client_id": self.client_id,
             "builder": self._connection,
+            "consumers_pool": self._consumers_pool,
         }
 
     @override
@@ -843,6 +890,16 @@ class KafkaBroker(
             """
             ),
         ] = None,
+        keys: Annotated[
+            Optional[Sequence[Union[bytes, Any, None]]],
+            Doc(
+                """
+            Keys of the messages (one per message). Keyed messages are
+            grouped by partitions chosen by the configured `partitioner`
+            and each partition batch is sent concurrently.
+            """
+            ),
+        ] = None,
         timestamp_ms: Annotated[
             Optional[int],
             Doc(
@@ -885,6 +942,7 @@ class KafkaBroker(
             *msgs,
             topic=topic,
             partition=partition,
+            keys=keys,
             timestamp_ms=timestamp_ms,
             headers=headers,
             reply_to=reply_to,
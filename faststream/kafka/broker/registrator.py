@@ -41,6 +41,7 @@ if TYPE_CHECKING:
     )
     from faststream.kafka.subscriber.asyncapi import (
         AsyncAPIBatchSubscriber,
+        AsyncAPIConcurrentBetweenPartitionsSubscriber,
         AsyncAPIConcurrentDefaultSubscriber,
         AsyncAPIDefaultSubscriber,
     )
@@ -62,6 +63,7 @@ class KafkaRegistrator(
             "AsyncAPIBatchSubscriber",
             "AsyncAPIDefaultSubscriber",
             "AsyncAPIConcurrentDefaultSubscriber",
+            "AsyncAPIConcurrentBetweenPartitionsSubscriber",
         ],
     ]
     _publishers: Dict[
@@ -1557,6 +1559,37 @@ class KafkaRegistrator(
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        parallel_partitions: Annotated[
+            bool,
+            Doc(
+                "Whether to process records of each assigned partition by its own serial worker. "
+                "Partitions are processed concurrently, records order inside a partition is kept."
+            ),
+        ] = False,
+        prefetch_records: Annotated[
+            int,
+            Doc(
+                "Max number of records to fetch by a single request and buffer locally "
+                "for one-by-one processing. Buffered records are lost at crash under auto commit, "
+                "so prefetching is disabled by default. Not used in manual commit mode "
+                "without `commit_interval_ms`."
+            ),
+        ] = 1,
+        commit_interval_ms: Annotated[
+            Optional[int],
+            Doc(
+                "Enables offsets commit manager for manual commit mode (`auto_commit=False`). "
+                "Acknowledged offsets are committed in background each `commit_interval_ms` "
+                "milliseconds or after `commit_batch_size` acknowledgements "
+                "instead of a commit request per message."
+            ),
+        ] = None,
+        commit_batch_size: Annotated[
+            int,
+            Doc(
+                "Number of acknowledgements to commit offsets before `commit_interval_ms` is over."
+            ),
+        ] = 100,
         filter: Annotated[
             "Filter[KafkaMessage]",
             Doc(
@@ -1602,12 +1635,17 @@ class KafkaRegistrator(
         "AsyncAPIDefaultSubscriber",
         "AsyncAPIBatchSubscriber",
         "AsyncAPIConcurrentDefaultSubscriber",
+        "AsyncAPIConcurrentBetweenPartitionsSubscriber",
     ]:
         subscriber = super().subscriber(
             create_subscriber(
                 *topics,
                 batch=batch,
                 max_workers=max_workers,
+                parallel_partitions=parallel_partitions,
+                prefetch_records=prefetch_records,
+                commit_interval_ms=commit_interval_ms,
+                commit_batch_size=commit_batch_size,
                 batch_timeout_ms=batch_timeout_ms,
                 max_records=max_records,
                 group_id=group_id,
@@ -1659,7 +1697,17 @@ class KafkaRegistrator(
             )
 
         else:
-            if max_workers > 1:
+            if parallel_partitions:
+                return cast(
+                    "AsyncAPIConcurrentBetweenPartitionsSubscriber", subscriber
+                ).add_call(
+                    filter_=filter,
+                    parser_=parser or self._parser,
+                    decoder_=decoder or self._decoder,
+                    dependencies_=dependencies,
+                    middlewares_=middlewares,
+                )
+            elif max_workers > 1:
                 return cast("AsyncAPIConcurrentDefaultSubscriber", subscriber).add_call(
                     filter_=filter,
                     parser_=parser or self._parser,
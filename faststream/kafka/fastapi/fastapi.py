@@ -60,6 +60,7 @@ if TYPE_CHECKING:
     )
     from faststream.kafka.subscriber.asyncapi import (
         AsyncAPIBatchSubscriber,
+        AsyncAPIConcurrentBetweenPartitionsSubscriber,
         AsyncAPIConcurrentDefaultSubscriber,
         AsyncAPIDefaultSubscriber,
     )
@@ -260,6 +261,33 @@ class KafkaRouter(StreamRouter[Union[ConsumerRecord, Tuple[ConsumerRecord, ...]]
         ] = False,
         transactional_id: Optional[str] = None,
         transaction_timeout_ms: int = 60 * 1000,
+        # consumer args
+        shared_consumers: Annotated[
+            bool,
+            Doc(
+                """
+            Whether to serve all subscribers with the same `group_id` and connection options
+            by a single `AIOKafkaConsumer`. The shared consumer subscribes to the union of
+            subscribers topics and dispatches records to subscribers by topic.
+            Each subscriber processes its records in its own task, so a slow handler
+            pauses only its own topics. Subscribers with `pattern`, `partitions`,
+            custom `listener`, `batch=True` or `auto_commit=False` always use their
+            own consumer.
+            """
+            ),
+        ] = False,
+        reply_topic: Annotated[
+            str,
+            Doc(
+                """
+            Topic to consume RPC replies from. A single consumer without consumer group
+            reads this topic and routes replies to `request` calls by `correlation_id`.
+            The topic is shared by all broker instances: each process resolves only
+            replies to its own requests and ignores the rest. Create it in advance if
+            topics auto creation is disabled on your cluster.
+            """
+            ),
+        ] = "faststream-replies",
         # broker base args
         graceful_timeout: Annotated[
             Optional[float],
@@ -576,6 +604,9 @@ class KafkaRouter(StreamRouter[Union[ConsumerRecord, Tuple[ConsumerRecord, ...]]
             enable_idempotence=enable_idempotence,
             transactional_id=transactional_id,
             transaction_timeout_ms=transaction_timeout_ms,
+            # consumer args
+            shared_consumers=shared_consumers,
+            reply_topic=reply_topic,
             # broker args
             graceful_timeout=graceful_timeout,
             decoder=decoder,
@@ -2623,15 +2654,51 @@ class KafkaRouter(StreamRouter[Union[ConsumerRecord, Tuple[ConsumerRecord, ...]]
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        prefetch_records: Annotated[
+            int,
+            Doc(
+                "Max number of records to fetch by a single request and buffer locally "
+                "for one-by-one processing. Buffered records are lost at crash under auto commit, "
+                "so prefetching is disabled by default. Not used in manual commit mode "
+                "without `commit_interval_ms`."
+            ),
+        ] = 1,
+        commit_interval_ms: Annotated[
+            Optional[int],
+            Doc(
+                "Enables offsets commit manager for manual commit mode (`auto_commit=False`). "
+                "Acknowledged offsets are committed in background each `commit_interval_ms` "
+                "milliseconds or after `commit_batch_size` acknowledgements "
+                "instead of a commit request per message."
+            ),
+        ] = None,
+        commit_batch_size: Annotated[
+            int,
+            Doc(
+                "Number of acknowledgements to commit offsets before `commit_interval_ms` is over."
+            ),
+        ] = 100,
+        parallel_partitions: Annotated[
+            bool,
+            Doc(
+                "Whether to process records of each assigned partition by its own serial worker. "
+                "Partitions are processed concurrently, records order inside a partition is kept."
+            ),
+        ] = False,
     ) -> Union[
         "AsyncAPIBatchSubscriber",
         "AsyncAPIDefaultSubscriber",
         "AsyncAPIConcurrentDefaultSubscriber",
+        "AsyncAPIConcurrentBetweenPartitionsSubscriber",
     ]:
         subscriber = super().subscriber(
             *topics,
             group_id=group_id,
             max_workers=max_workers,
+            prefetch_records=prefetch_records,
+            commit_interval_ms=commit_interval_ms,
+            commit_batch_size=commit_batch_size,
+            parallel_partitions=parallel_partitions,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
             fetch_max_wait_ms=fetch_max_wait_ms,
@@ -2682,7 +2749,9 @@ class KafkaRouter(StreamRouter[Union[ConsumerRecord, Tuple[ConsumerRecord, ...]]
         if batch:
             return cast("AsyncAPIBatchSubscriber", subscriber)
         else:
-            if max_workers > 1:
+            if parallel_partitions:
+                return cast("AsyncAPIConcurrentBetweenPartitionsSubscriber", subscriber)
+            elif max_workers > 1:
                 return cast("AsyncAPIConcurrentDefaultSubscriber", subscriber)
             else:
                 return cast("AsyncAPIDefaultSubscriber", subscriber)
@@ -1,4 +1,13 @@
-from typing import TYPE_CHECKING, Any, Protocol, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+)
 
 from aiokafka import TopicPartition as AIOKafkaTopicPartition
 
@@ -7,6 +16,8 @@ from faststream.broker.message import StreamMessage
 if TYPE_CHECKING:
     from aiokafka import ConsumerRecord
 
+    from faststream.kafka.subscriber.commit import OffsetsCommitManager
+
 
 class ConsumerProtocol(Protocol):
     """A protocol for Kafka consumers."""
@@ -55,11 +66,17 @@ class KafkaMessage(
         self,
         *args: Any,
         consumer: ConsumerProtocol,
+        commit_manager: Optional["OffsetsCommitManager"] = None,
+        drop_buffered: Optional[
+            Callable[[Iterable[AIOKafkaTopicPartition]], None]
+        ] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
 
         self.consumer = consumer
+        self.commit_manager = commit_manager
+        self.drop_buffered = drop_buffered
 
     async def nack(self) -> None:
         """Reject the Kafka message."""
@@ -77,6 +94,14 @@ class KafkaMessage(
                 partition=topic_partition,
                 offset=raw_message.offset,
             )
+
+            # already fetched records of the partition are fetched again after seek
+            if self.drop_buffered is not None:
+                self.drop_buffered((topic_partition,))
+
+            if self.commit_manager is not None:
+                self.commit_manager.reset(topic_partition, raw_message.offset)
+
         await super().nack()
 
 
@@ -84,5 +109,15 @@ class KafkaAckableMessage(KafkaMessage):
     async def ack(self) -> None:
         """Acknowledge the Kafka message."""
         if not self.committed:
-            await self.consumer.commit()
+            if self.commit_manager is not None:
+                self.commit_manager.ack(self.raw_message)
+            else:
+                await self.consumer.commit()
         await super().ack()
+
+    async def reject(self) -> None:
+        """Reject the Kafka message without redelivery."""
+        if not self.committed and self.commit_manager is not None:
+            # rejected message should not block next offsets commit
+            self.commit_manager.ack(self.raw_message)
+        await super().reject()
@@ -1,6 +1,6 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
-from faststream.broker.message import decode_message, gen_cor_id
+from faststream.broker.message import decode_batch, decode_message, gen_cor_id
 from faststream.kafka.message import FAKE_CONSUMER, KafkaMessage
 from faststream.utils.context.repository import context
 
@@ -43,6 +43,8 @@ class AioKafkaParser:
             raw_message=message,
             path=self.get_path(message.topic),
             consumer=getattr(handler, "consumer", None) or FAKE_CONSUMER,
+            commit_manager=getattr(handler, "commit_manager", None),
+            drop_buffered=getattr(handler, "drop_prefetched", None),
         )
 
     async def decode_message(
@@ -90,6 +92,7 @@ class AioKafkaBatchParser(AioKafkaParser):
             raw_message=message,
             path=self.get_path(first.topic),
             consumer=getattr(handler, "consumer", None) or FAKE_CONSUMER,
+            commit_manager=getattr(handler, "commit_manager", None),
         )
 
     async def decode_message(
@@ -97,9 +100,5 @@ class AioKafkaBatchParser(AioKafkaParser):
         msg: "StreamMessage[Tuple[ConsumerRecord, ...]]",
     ) -> "DecodedMessage":
         """Decode a batch of messages."""
-        # super() should be here due python can't find it in comprehension
-        super_obj = cast(AioKafkaParser, super())
-
-        return [
-            decode_message(await super_obj.parse_message(m)) for m in msg.raw_message
-        ]
+        # records are already parsed to the batch body and headers
+        return decode_batch(msg.body, msg.batch_headers)
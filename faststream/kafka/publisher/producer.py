@@ -1,5 +1,8 @@
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+import asyncio
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
+import anyio
 from typing_extensions import override
 
 from faststream.broker.message import encode_message
@@ -10,9 +13,12 @@ from faststream.kafka.message import KafkaMessage
 from faststream.kafka.parser import AioKafkaParser
 
 if TYPE_CHECKING:
-    from aiokafka import AIOKafkaProducer
+    from aiokafka import AIOKafkaProducer, ConsumerRecord
+    from aiokafka.producer.message_accumulator import BatchBuilder
+    from aiokafka.structs import RecordMetadata
 
     from faststream.broker.types import CustomCallable
+    from faststream.kafka.publisher.reply import RepliesConsumer
     from faststream.types import SendableMessage
 
 
@@ -24,8 +30,10 @@ class AioKafkaFastProducer(ProducerProto):
         producer: "AIOKafkaProducer",
         parser: Optional["CustomCallable"],
         decoder: Optional["CustomCallable"],
+        replies: Optional["RepliesConsumer"] = None,
     ) -> None:
         self._producer = producer
+        self._replies = replies
 
         # NOTE: register default parser to be compatible with request
         default = AioKafkaParser(
@@ -50,6 +58,32 @@ class AioKafkaFastProducer(ProducerProto):
         no_confirm: bool = False,
     ) -> None:
         """Publish a message to a topic."""
+        send_future = await self.send(
+            message,
+            topic,
+            correlation_id=correlation_id,
+            key=key,
+            partition=partition,
+            timestamp_ms=timestamp_ms,
+            headers=headers,
+            reply_to=reply_to,
+        )
+        if not no_confirm:
+            await send_future
+
+    async def send(
+        self,
+        message: "SendableMessage",
+        topic: str,
+        *,
+        correlation_id: str,
+        key: Union[bytes, Any, None] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        reply_to: str = "",
+    ) -> "asyncio.Future[RecordMetadata]":
+        """Put a message to the producer buffer and return its delivery future."""
         message, content_type = encode_message(message)
 
         headers_to_send = {
@@ -64,7 +98,7 @@ class AioKafkaFastProducer(ProducerProto):
                 reply_to,
             )
 
-        send_future = await self._producer.send(
+        send_future: asyncio.Future[RecordMetadata] = await self._producer.send(
             topic=topic,
             value=message,
             key=key,
@@ -72,10 +106,12 @@ class AioKafkaFastProducer(ProducerProto):
             timestamp_ms=timestamp_ms,
             headers=[(i, (j or "").encode()) for i, j in headers_to_send.items()],
         )
-        if not no_confirm:
-            await send_future
+        return send_future
 
     async def stop(self) -> None:
+        if self._replies is not None:
+            await self._replies.stop()
+
         await self._producer.stop()
 
     async def publish_batch(
@@ -84,13 +120,23 @@ class AioKafkaFastProducer(ProducerProto):
         correlation_id: str,
         topic: str,
         partition: Optional[int] = None,
+        keys: Optional[Sequence[Union[bytes, Any, None]]] = None,
         timestamp_ms: Optional[int] = None,
         headers: Optional[Dict[str, str]] = None,
         reply_to: str = "",
         no_confirm: bool = False,
     ) -> None:
-        """Publish a batch of messages to a topic."""
-        batch = self._producer.create_batch()
+        """Publish a batch of messages to a topic.
+
+        Keyed messages are grouped by the partition chosen by the producer
+        partitioner and each partition batch is sent concurrently.
+        """
+        if keys is not None and len(keys) != len(msgs):
+            raise ValueError("You should pass a key for each batch message.")
+
+        if keys is not None and partition is None:
+            # partitioner requires the topic metadata
+            await self._producer.partitions_for(topic)
 
         headers_to_send = {"correlation_id": correlation_id, **(headers or {})}
 
@@ -100,7 +146,11 @@ class AioKafkaFastProducer(ProducerProto):
                 reply_to,
             )
 
-        for msg in msgs:
+        # records without a key go to the `partition` batch
+        batches: Dict[Optional[int], BatchBuilder] = {}
+        send_futures: List[asyncio.Future[Any]] = []
+
+        for msg, key in zip(msgs, keys or repeat(None)):
             message, content_type = encode_message(msg)
 
             if content_type:
@@ -111,19 +161,103 @@ class AioKafkaFastProducer(ProducerProto):
             else:
                 final_headers = headers_to_send.copy()
 
-            batch.append(
-                key=None,
-                value=message,
-                timestamp=timestamp_ms,
-                headers=[(i, j.encode()) for i, j in final_headers.items()],
+            if key is None:
+                serialized_key, msg_partition = None, partition
+            else:
+                serialized_key, msg_partition = _route_key(
+                    self._producer, topic, key, partition
+                )
+
+            record = {
+                "key": serialized_key,
+                "value": message,
+                "timestamp": timestamp_ms,
+                "headers": [(i, j.encode()) for i, j in final_headers.items()],
+            }
+
+            if (batch := batches.get(msg_partition)) is None:
+                batch = batches[msg_partition] = self._producer.create_batch()
+
+            if batch.append(**record) is None:
+                # batch is full, so send it and start the new one
+                send_futures.append(
+                    await self._producer.send_batch(
+                        batch, topic, partition=msg_partition
+                    )
+                )
+                batch = batches[msg_partition] = self._producer.create_batch()
+                batch.append(**record)
+
+        send_futures.extend(
+            await asyncio.gather(
+                *(
+                    self._producer.send_batch(batch, topic, partition=p)
+                    for p, batch in batches.items()
+                )
             )
+        )
 
-        send_future = await self._producer.send_batch(batch, topic, partition=partition)
         if not no_confirm:
-            await send_future
+            await asyncio.gather(*send_futures)
 
     @override
-    async def request(self, *args: Any, **kwargs: Any) -> Optional[Any]:
-        raise OperationForbiddenError(
-            "Kafka doesn't support `request` method without test client."
-        )
+    async def request(  # type: ignore[override]
+        self,
+        message: "SendableMessage",
+        topic: str,
+        *,
+        correlation_id: str,
+        key: Union[bytes, Any, None] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = 0.5,
+    ) -> "ConsumerRecord":
+        """Publish a message and wait for the reply with the same correlation_id.
+
+        All concurrent requests share the broker reply topic consumer.
+        """
+        if self._replies is None:
+            raise OperationForbiddenError(
+                "Kafka doesn't support `request` method without replies consumer."
+            )
+
+        await self._replies.start()
+
+        with self._replies.wait(correlation_id) as response:
+            await self.publish(
+                message,
+                topic,
+                correlation_id=correlation_id,
+                key=key,
+                partition=partition,
+                timestamp_ms=timestamp_ms,
+                headers=headers,
+                reply_to=self._replies.topic,
+            )
+
+            with anyio.fail_after(timeout):
+                return await response
+
+
+def _route_key(
+    producer: "AIOKafkaProducer",
+    topic: str,
+    key: Any,
+    partition: Optional[int],
+) -> Tuple[bytes, Optional[int]]:
+    """Serialize the record key and choose its partition as `AIOKafkaProducer.send` does.
+
+    NOTE: relies on private `AIOKafkaProducer._serialize` and `_partition` methods
+    (aiokafka 0.9 - 0.12), check their signatures on aiokafka upgrade.
+    """
+    serialized_key, _ = producer._serialize(topic, key, None)
+
+    if isinstance(serialized_key, str):
+        # batch builder accepts bytes only
+        serialized_key = serialized_key.encode()
+
+    if partition is None:
+        partition = producer._partition(topic, None, key, None, serialized_key, None)
+
+    return serialized_key, partition
@@ -0,0 +1,124 @@
+import asyncio
+from contextlib import contextmanager, suppress
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+)
+
+import anyio
+from aiokafka import TopicPartition
+from aiokafka.errors import KafkaError
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaConsumer, AIOKafkaProducer, ConsumerRecord
+
+
+class RepliesConsumer:
+    """Routes RPC replies to waiting requests by `correlation_id`.
+
+    A single long-lived consumer reads all partitions of the broker reply topic
+    without consumer group, so each broker instance gets every reply and
+    resolves its own requests only. Replies without a waiting request
+    (e.g. arrived after timeout) are dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        topic: str,
+        builder: Callable[..., "AIOKafkaConsumer"],
+        producer: "AIOKafkaProducer",
+    ) -> None:
+        self.topic = topic
+
+        self._builder = builder
+        self._producer = producer
+
+        self._consumer: Optional[AIOKafkaConsumer] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._futures: Dict[str, asyncio.Future[ConsumerRecord]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._consumer is not None
+
+    async def start(self) -> None:
+        """Start consuming replies if it is not started yet."""
+        async with self._lock:
+            if self._consumer is not None:
+                return
+
+            # producer metadata request creates the topic if it doesn't exist
+            partitions = await self._producer.partitions_for(self.topic)
+
+            consumer = self._builder(
+                group_id=None,
+                enable_auto_commit=False,
+            )
+            await consumer.start()
+
+            tps = [TopicPartition(self.topic, p) for p in partitions]
+            consumer.assign(tps)
+            # fix end offsets before the first request to not miss fast replies
+            await consumer.seek_to_end(*tps)
+
+            self._consumer = consumer
+            self._task = asyncio.create_task(self._consume(consumer))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._consumer is not None:
+            await self._consumer.stop()
+            self._consumer = None
+
+        for future in self._futures.values():
+            future.cancel()
+        self._futures = {}
+
+    @contextmanager
+    def wait(self, correlation_id: str) -> Iterator["asyncio.Future[ConsumerRecord]"]:
+        """Register a reply future and drop it on exit even if it is not resolved."""
+        future: asyncio.Future[ConsumerRecord] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._futures[correlation_id] = future
+
+        try:
+            yield future
+        finally:
+            if self._futures.get(correlation_id) is future:
+                del self._futures[correlation_id]
+
+    def resolve(self, record: "ConsumerRecord") -> None:
+        correlation_id = next(
+            (v.decode() for k, v in record.headers if k == "correlation_id"),
+            None,
+        )
+
+        if (
+            correlation_id is not None
+            and (future := self._futures.pop(correlation_id, None)) is not None
+            and not future.done()
+        ):
+            future.set_result(record)
+
+    async def _consume(self, consumer: "AIOKafkaConsumer") -> None:
+        while True:
+            try:
+                records = await consumer.getmany(timeout_ms=1000)
+            except KafkaError:
+                await anyio.sleep(1)
+                continue
+
+            for tp_records in records.values():
+                for record in tp_records:
+                    self.resolve(record)
@@ -4,10 +4,13 @@ from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
     Iterable,
+    List,
     Optional,
     Sequence,
     Tuple,
@@ -21,10 +24,15 @@ from typing_extensions import Annotated, Doc, override
 from faststream.broker.message import SourceType, gen_cor_id
 from faststream.broker.publisher.usecase import PublisherUsecase
 from faststream.broker.types import MsgType
+from faststream.broker.utils import deliver_in_scope, publish_with_window
 from faststream.exceptions import NOT_CONNECTED_YET
 from faststream.utils.functions import return_input
 
 if TYPE_CHECKING:
+    import asyncio
+
+    from aiokafka.structs import RecordMetadata
+
     from faststream.broker.types import BrokerMiddleware, PublisherMiddleware
     from faststream.kafka.message import KafkaMessage
     from faststream.kafka.publisher.producer import AioKafkaFastProducer
@@ -320,6 +328,149 @@ class DefaultPublisher(LogicPublisher[ConsumerRecord]):
             no_confirm=no_confirm,
         )
 
+    async def publish_stream(
+        self,
+        messages: Annotated[
+            Union[Iterable["SendableMessage"], AsyncIterable["SendableMessage"]],
+            Doc("Messages bodies to send. Taken from the source as the window allows."),
+        ],
+        topic: Annotated[
+            str,
+            Doc("Topic where the messages will be published."),
+        ] = "",
+        *,
+        max_in_flight: Annotated[
+            int,
+            Doc("Max number of sent but not confirmed yet messages."),
+        ] = 100,
+        key: Annotated[
+            Union[bytes, Any, None],
+            Doc("A key to associate with each message."),
+        ] = None,
+        partition: Annotated[
+            Optional[int],
+            Doc(
+                """
+            Specify a partition. If not set, the partition will be
+            selected using the configured `partitioner`.
+            """
+            ),
+        ] = None,
+        timestamp_ms: Annotated[
+            Optional[int],
+            Doc(
+                """
+            Epoch milliseconds (from Jan 1 1970 UTC) to use as
+            the messages timestamp. Defaults to current time.
+            """
+            ),
+        ] = None,
+        headers: Annotated[
+            Optional[Dict[str, str]],
+            Doc("Messages headers to store metainformation."),
+        ] = None,
+        reply_to: Annotated[
+            str,
+            Doc("Reply message topic name to send response."),
+        ] = "",
+        # publisher specific
+        _extra_middlewares: Annotated[
+            Iterable["PublisherMiddleware"],
+            Doc("Extra middlewares to wrap publishing process."),
+        ] = (),
+    ) -> AsyncIterator["RecordMetadata"]:
+        """Publish messages keeping up to `max_in_flight` unconfirmed sends.
+
+        Yields delivery metadata (partition, offset) of each message in order and
+        raises the first delivery error.
+
+        Publish middlewares scope of each message lasts until its delivery.
+        """
+        assert self._producer, NOT_CONNECTED_YET  # nosec B101
+
+        topic = topic or self.topic
+        key = key or self.key
+        partition = partition or self.partition
+        headers = headers or self.headers
+        reply_to = reply_to or self.reply_to
+
+        call = deliver_in_scope(
+            self._producer.send,
+            chain(
+                self._middlewares[::-1],
+                (
+                    _extra_middlewares
+                    or (m(None).publish_scope for m in self._broker_middlewares[::-1])
+                ),
+            ),
+        )
+
+        async def send(message: "SendableMessage") -> "asyncio.Future[RecordMetadata]":
+            return await call(
+                message,
+                topic=topic,
+                key=key,
+                partition=partition,
+                headers=headers,
+                reply_to=reply_to,
+                correlation_id=gen_cor_id(),
+                timestamp_ms=timestamp_ms,
+            )
+
+        async for metadata in publish_with_window(messages, send, max_in_flight):
+            yield metadata
+
+    async def publish_many(
+        self,
+        messages: Annotated[
+            Union[Iterable["SendableMessage"], AsyncIterable["SendableMessage"]],
+            Doc("Messages bodies to send."),
+        ],
+        topic: Annotated[
+            str,
+            Doc("Topic where the messages will be published."),
+        ] = "",
+        *,
+        max_in_flight: Annotated[
+            int,
+            Doc("Max number of sent but not confirmed yet messages."),
+        ] = 100,
+        key: Annotated[
+            Union[bytes, Any, None],
+            Doc("A key to associate with each message."),
+        ] = None,
+        partition: Annotated[
+            Optional[int],
+            Doc("Specify a partition."),
+        ] = None,
+        timestamp_ms: Annotated[
+            Optional[int],
+            Doc("Epoch milliseconds to use as the messages timestamp."),
+        ] = None,
+        headers: Annotated[
+            Optional[Dict[str, str]],
+            Doc("Messages headers to store metainformation."),
+        ] = None,
+        reply_to: Annotated[
+            str,
+            Doc("Reply message topic name to send response."),
+        ] = "",
+    ) -> List["RecordMetadata"]:
+        """Publish all messages by `publish_stream` and return their delivery metadata."""
+        return [
+            metadata
+            async for metadata in self.publish_stream(
+                messages,
+                topic,
+                max_in_flight=max_in_flight,
+                key=key,
+                partition=partition,
+                timestamp_ms=timestamp_ms,
+                headers=headers,
+                reply_to=reply_to,
+            )
+        ]
+
     @override
     async def request(
         self,
@@ -423,6 +574,16 @@ class BatchPublisher(LogicPublisher[Tuple["ConsumerRecord", ...]]):
             """
             ),
         ] = None,
+        keys: Annotated[
+            Optional[Sequence[Union[bytes, Any, None]]],
+            Doc(
+                """
+            Keys of the messages (one per message). Keyed messages are
+            grouped by partitions chosen by the configured `partitioner`
+            and each partition batch is sent concurrently.
+            """
+            ),
+        ] = None,
         timestamp_ms: Annotated[
             Optional[int],
             Doc(
@@ -486,6 +647,7 @@ class BatchPublisher(LogicPublisher[Tuple["ConsumerRecord", ...]]):
             *msgs,
             topic=topic,
             partition=partition,
+            keys=keys,
             headers=headers,
             reply_to=reply_to,
             correlation_id=correlation_id,
@@ -529,12 +529,47 @@ class KafkaRoute(SubscriberRoute):
             int,
             Doc("Number of workers to process messages concurrently."),
         ] = 1,
+        prefetch_records: Annotated[
+            int,
+            Doc(
+                "Max number of records to fetch by a single request and buffer locally "
+                "for one-by-one processing. Buffered records are lost at crash under auto commit, "
+                "so prefetching is disabled by default. Not used in manual commit mode "
+                "without `commit_interval_ms`."
+            ),
+        ] = 1,
+        commit_interval_ms: Annotated[
+            Optional[int],
+            Doc(
+                "Enables offsets commit manager for manual commit mode (`auto_commit=False`). "
+                "Acknowledged offsets are committed in background each `commit_interval_ms` "
+                "milliseconds or after `commit_batch_size` acknowledgements "
+                "instead of a commit request per message."
+            ),
+        ] = None,
+        commit_batch_size: Annotated[
+            int,
+            Doc(
+                "Number of acknowledgements to commit offsets before `commit_interval_ms` is over."
+            ),
+        ] = 100,
+        parallel_partitions: Annotated[
+            bool,
+            Doc(
+                "Whether to process records of each assigned partition by its own serial worker. "
+                "Partitions are processed concurrently, records order inside a partition is kept."
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             call,
             *topics,
             publishers=publishers,
             max_workers=max_workers,
+            prefetch_records=prefetch_records,
+            commit_interval_ms=commit_interval_ms,
+            commit_batch_size=commit_batch_size,
+            parallel_partitions=parallel_partitions,
             group_id=group_id,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
@@ -0,0 +1,231 @@
+import asyncio
+from contextlib import suppress
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import anyio
+from aiokafka import ConsumerRebalanceListener, TopicPartition
+from aiokafka.errors import KafkaError
+
+from faststream.utils.functions import call_or_await
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaConsumer, ConsumerRecord
+
+
+class _PartitionOffsets:
+    """In-flight offsets of a single partition.
+
+    Offsets are registered in fetch order, so the first not completed offset
+    is the lowest one and everything before it can be committed.
+    """
+
+    __slots__ = ("committed", "pending", "watermark")
+
+    def __init__(self) -> None:
+        # offset -> is processing completed
+        self.pending: Dict[int, bool] = {}
+        # next offset to consume after all completed ones
+        self.watermark: Optional[int] = None
+        self.committed: Optional[int] = None
+
+    def add(self, offset: int) -> None:
+        self.pending[offset] = False
+
+    def complete(self, offset: int) -> bool:
+        if offset not in self.pending:
+            return False
+
+        self.pending[offset] = True
+        self._advance()
+        return True
+
+    def reset(self, offset: int) -> None:
+        """Forget offsets which will be fetched again after `seek`."""
+        for o in tuple(self.pending):
+            if o >= offset:
+                del self.pending[o]
+        self._advance()
+
+    def _advance(self) -> None:
+        pending = self.pending
+        while pending:
+            first = next(iter(pending))
+            if not pending[first]:
+                break
+            del pending[first]
+            self.watermark = first + 1
+
+    @property
+    def committable(self) -> Optional[int]:
+        if self.watermark is not None and self.watermark != self.committed:
+            return self.watermark
+        return None
+
+
+class OffsetsCommitManager:
+    """Batches manual acknowledgements into explicit offsets commits.
+
+    Acknowledged records are marked as completed and each partition commits
+    its contiguous low watermark only, so records that are still in processing
+    are never committed. Commits are sent in background by timer or after
+    `batch_size` acknowledgements and synchronously on partitions revoke
+    and on shutdown.
+    """
+
+    consumer: Optional["AIOKafkaConsumer"]
+
+    def __init__(
+        self,
+        *,
+        interval_ms: int,
+        batch_size: int,
+    ) -> None:
+        self.interval = interval_ms / 1000
+        self.batch_size = batch_size
+
+        self.consumer = None
+
+        self._partitions: Dict[TopicPartition, _PartitionOffsets] = {}
+        self._acked = 0
+        self._lock = asyncio.Lock()
+        self._timer_task: Optional[asyncio.Task[None]] = None
+        self._commit_task: Optional[asyncio.Task[None]] = None
+
+    def start(self, consumer: "AIOKafkaConsumer") -> None:
+        self.consumer = consumer
+        self._timer_task = asyncio.create_task(self._commit_by_timer())
+
+    async def stop(self) -> None:
+        if self._timer_task is not None:
+            self._timer_task.cancel()
+            self._timer_task = None
+
+        if self._commit_task is not None:
+            with suppress(Exception):
+                await self._commit_task
+            self._commit_task = None
+
+        with suppress(KafkaError):
+            await self.commit()
+
+        self._partitions = {}
+        self.consumer = None
+
+    def track(self, record: "ConsumerRecord") -> None:
+        """Register fetched record as in processing."""
+        tp = TopicPartition(record.topic, record.partition)
+
+        if (offsets := self._partitions.get(tp)) is None:
+            offsets = self._partitions[tp] = _PartitionOffsets()
+
+        offsets.add(record.offset)
+
+    def ack(
+        self,
+        message: Union["ConsumerRecord", Tuple["ConsumerRecord", ...]],
+    ) -> None:
+        """Mark record (or records batch) as completed."""
+        records = message if isinstance(message, tuple) else (message,)
+
+        for record in records:
+            offsets = self._partitions.get(
+                TopicPartition(record.topic, record.partition)
+            )
+            if offsets is not None and offsets.complete(record.offset):
+                self._acked += 1
+
+        if self._acked >= self.batch_size and (
+            self._commit_task is None or self._commit_task.done()
+        ):
+            self._commit_task = asyncio.create_task(self.commit())
+
+    def reset(self, partition: TopicPartition, offset: int) -> None:
+        """Drop partition offsets starting from `offset` after consumer `seek`."""
+        if (offsets := self._partitions.get(partition)) is not None:
+            offsets.reset(offset)
+
+    async def commit(
+        self,
+        partitions: Optional[Iterable[TopicPartition]] = None,
+    ) -> None:
+        """Commit completed offsets of all (or selected) partitions."""
+        if self.consumer is None:
+            return
+
+        async with self._lock:
+            selected = (
+                self._partitions.items()
+                if partitions is None
+                else ((tp, self._partitions.get(tp)) for tp in partitions)
+            )
+
+            # committing not assigned partition raises `IllegalStateError`
+            assignment = self.consumer.assignment()
+
+            to_commit = {
+                tp: offset
+                for tp, offsets in selected
+                if offsets is not None
+                and tp in assignment
+                and (offset := offsets.committable) is not None
+            }
+
+            if not to_commit:
+                return
+
+            self._acked = 0
+            await self.consumer.commit(to_commit)
+
+            for tp, offset in to_commit.items():
+                if (offsets := self._partitions.get(tp)) is not None:
+                    offsets.committed = offset
+
+    async def on_revoke(self, partitions: Iterable[TopicPartition]) -> None:
+        """Commit completed offsets of revoked partitions and stop tracking them."""
+        partitions = tuple(partitions)
+
+        with suppress(KafkaError):
+            await self.commit(partitions)
+
+        for tp in partitions:
+            self._partitions.pop(tp, None)
+
+    async def _commit_by_timer(self) -> None:
+        while True:
+            await anyio.sleep(self.interval)
+
+            # uncommitted offsets will be sent with the next attempt
+            with suppress(KafkaError):
+                await self.commit()
+
+
+class CommitOnRevokeListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Commit completed offsets of revoked partitions and call wrapped listener."""
+
+    def __init__(
+        self,
+        manager: OffsetsCommitManager,
+        listener: Optional["ConsumerRebalanceListener"],
+    ) -> None:
+        self.manager = manager
+        self.listener = listener
+
+    async def on_partitions_revoked(self, revoked: Iterable[TopicPartition]) -> None:
+        revoked = tuple(revoked)
+
+        # wrapped listener can finish processing of revoked partitions records
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_revoked, revoked)
+
+        await self.manager.on_revoke(revoked)
+
+    async def on_partitions_assigned(self, assigned: Iterable[TopicPartition]) -> None:
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_assigned, assigned)
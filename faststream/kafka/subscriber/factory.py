@@ -12,6 +12,7 @@ from typing import (
 from faststream.exceptions import SetupError
 from faststream.kafka.subscriber.asyncapi import (
     AsyncAPIBatchSubscriber,
+    AsyncAPIConcurrentBetweenPartitionsSubscriber,
     AsyncAPIConcurrentDefaultSubscriber,
     AsyncAPIDefaultSubscriber,
 )
@@ -38,8 +39,12 @@ def create_subscriber(
     connection_args: "AnyDict",
     partitions: Iterable["TopicPartition"],
     is_manual: bool,
+    commit_interval_ms: Optional[int],
+    commit_batch_size: int,
     # Subscriber args
     max_workers: int,
+    parallel_partitions: bool,
+    prefetch_records: int,
     no_ack: bool,
     no_reply: bool,
     retry: bool,
@@ -65,8 +70,12 @@ def create_subscriber(
     connection_args: "AnyDict",
     partitions: Iterable["TopicPartition"],
     is_manual: bool,
+    commit_interval_ms: Optional[int],
+    commit_batch_size: int,
     # Subscriber args
     max_workers: int,
+    parallel_partitions: bool,
+    prefetch_records: int,
     no_ack: bool,
     no_reply: bool,
     retry: bool,
@@ -79,6 +88,7 @@ def create_subscriber(
 ) -> Union[
     "AsyncAPIDefaultSubscriber",
     "AsyncAPIConcurrentDefaultSubscriber",
+    "AsyncAPIConcurrentBetweenPartitionsSubscriber",
 ]: ...
 
 
@@ -95,8 +105,12 @@ def create_subscriber(
     connection_args: "AnyDict",
     partitions: Iterable["TopicPartition"],
     is_manual: bool,
+    commit_interval_ms: Optional[int],
+    commit_batch_size: int,
     # Subscriber args
     max_workers: int,
+    parallel_partitions: bool,
+    prefetch_records: int,
     no_ack: bool,
     no_reply: bool,
     retry: bool,
@@ -112,6 +126,7 @@ def create_subscriber(
     "AsyncAPIDefaultSubscriber",
     "AsyncAPIBatchSubscriber",
     "AsyncAPIConcurrentDefaultSubscriber",
+    "AsyncAPIConcurrentBetweenPartitionsSubscriber",
 ]: ...
 
 
@@ -127,8 +142,12 @@ def create_subscriber(
     connection_args: "AnyDict",
     partitions: Iterable["TopicPartition"],
     is_manual: bool,
+    commit_interval_ms: Optional[int],
+    commit_batch_size: int,
     # Subscriber args
     max_workers: int,
+    parallel_partitions: bool,
+    prefetch_records: int,
     no_ack: bool,
     no_reply: bool,
     retry: bool,
@@ -144,12 +163,35 @@ def create_subscriber(
     "AsyncAPIDefaultSubscriber",
     "AsyncAPIBatchSubscriber",
     "AsyncAPIConcurrentDefaultSubscriber",
+    "AsyncAPIConcurrentBetweenPartitionsSubscriber",
 ]:
     if is_manual and not group_id:
         raise SetupError("You must use `group_id` with manual commit mode.")
 
-    if is_manual and max_workers > 1:
-        raise SetupError("Max workers not work with manual commit mode.")
+    if commit_interval_ms is not None and not is_manual:
+        raise SetupError("`commit_interval_ms` works only with manual commit mode.")
+
+    # without commit manager `consumer.commit()` commits not processed messages too
+    if is_manual and commit_interval_ms is None and max_workers > 1:
+        raise SetupError(
+            "Max workers not work with manual commit mode. "
+            "Use `commit_interval_ms` to enable offsets commit manager."
+        )
+
+    if parallel_partitions and batch:
+        raise SetupError("You can't use `parallel_partitions` with batch consuming.")
+
+    if parallel_partitions and max_workers > 1:
+        raise SetupError("You can't use both `parallel_partitions` and `max_workers`.")
+
+    if parallel_partitions and is_manual and commit_interval_ms is None:
+        raise SetupError(
+            "Parallel partitions not work with manual commit mode. "
+            "Use `commit_interval_ms` to enable offsets commit manager."
+        )
+
+    if prefetch_records < 1:
+        raise SetupError("`prefetch_records` should be a positive number.")
 
     if not topics and not partitions and not pattern:
         raise SetupError(
@@ -173,6 +215,8 @@ def create_subscriber(
             connection_args=connection_args,
             partitions=partitions,
             is_manual=is_manual,
+            commit_interval_ms=commit_interval_ms,
+            commit_batch_size=commit_batch_size,
             no_ack=no_ack,
             no_reply=no_reply,
             retry=retry,
@@ -184,7 +228,29 @@ def create_subscriber(
         )
 
     else:
-        if max_workers > 1:
+        if parallel_partitions:
+            return AsyncAPIConcurrentBetweenPartitionsSubscriber(
+                *topics,
+                group_id=group_id,
+                listener=listener,
+                pattern=pattern,
+                connection_args=connection_args,
+                partitions=partitions,
+                is_manual=is_manual,
+                commit_interval_ms=commit_interval_ms,
+                commit_batch_size=commit_batch_size,
+                prefetch_records=prefetch_records,
+                no_ack=no_ack,
+                no_reply=no_reply,
+                retry=retry,
+                broker_dependencies=broker_dependencies,
+                broker_middlewares=broker_middlewares,
+                title_=title_,
+                description_=description_,
+                include_in_schema=include_in_schema,
+            )
+
+        elif max_workers > 1:
             return AsyncAPIConcurrentDefaultSubscriber(
                 *topics,
                 max_workers=max_workers,
@@ -194,6 +260,9 @@ def create_subscriber(
                 connection_args=connection_args,
                 partitions=partitions,
                 is_manual=is_manual,
+                commit_interval_ms=commit_interval_ms,
+                commit_batch_size=commit_batch_size,
+                prefetch_records=prefetch_records,
                 no_ack=no_ack,
                 no_reply=no_reply,
                 retry=retry,
@@ -212,6 +281,9 @@ def create_subscriber(
                 connection_args=connection_args,
                 partitions=partitions,
                 is_manual=is_manual,
+                commit_interval_ms=commit_interval_ms,
+                commit_batch_size=commit_batch_size,
+                prefetch_records=prefetch_records,
                 no_ack=no_ack,
                 no_reply=no_reply,
                 retry=retry,
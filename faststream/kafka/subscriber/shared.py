@@ -0,0 +1,362 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import anyio
+from aiokafka import ConsumerRebalanceListener
+from aiokafka.errors import ConsumerStoppedError, KafkaError
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaConsumer, TopicPartition
+
+    from faststream.kafka.subscriber.usecase import LogicSubscriber
+    from faststream.types import AnyDict
+
+
+class SharedConsumer:
+    """A single `AIOKafkaConsumer` serving all subscribers of one consumer group.
+
+    The consumer subscribes to the union of subscribers topics and one fetch loop
+    dispatches records to subscribers by a topic index. Every subscriber
+    processes its records by its own worker task, so a slow handler doesn't
+    stall other topics: its topics partitions are paused when the subscriber
+    has `buffer_size` not processed records and resumed when half of them
+    is processed.
+    """
+
+    consumer: Optional["AIOKafkaConsumer"]
+
+    def __init__(
+        self,
+        *,
+        builder: Callable[..., "AIOKafkaConsumer"],
+        group_id: Optional[str],
+        client_id: Optional[str],
+        connection_args: "AnyDict",
+        buffer_size: int = 100,
+    ) -> None:
+        self.builder = builder
+        self.group_id = group_id
+        self.client_id = client_id
+        self.connection_args = connection_args
+        self.buffer_size = buffer_size
+        # all subscribers share the same connection args
+        self.fetch_timeout_ms: int = connection_args.get("fetch_max_wait_ms", 500)
+
+        self.running = False
+        self.consumer = None
+
+        self.subscribers: List[LogicSubscriber[Any]] = []
+        self._topics_index: Dict[str, Tuple[LogicSubscriber[Any], ...]] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stop_task: Optional[asyncio.Task[None]] = None
+
+        self._queues: Dict[LogicSubscriber[Any], asyncio.Queue[Any]] = {}
+        self._workers: Dict[LogicSubscriber[Any], asyncio.Task[None]] = {}
+        self._paused: Set[LogicSubscriber[Any]] = set()
+
+    @property
+    def topics(self) -> List[str]:
+        return list(self._topics_index)
+
+    def add_subscriber(self, subscriber: "LogicSubscriber[Any]") -> None:
+        if subscriber not in self.subscribers:
+            self.subscribers.append(subscriber)
+            self._queues[subscriber] = asyncio.Queue()
+            self._rebuild_index()
+
+            if self.running:
+                self._start_worker(subscriber)
+
+    def remove_subscriber(self, subscriber: "LogicSubscriber[Any]") -> None:
+        if subscriber in self.subscribers:
+            self.subscribers.remove(subscriber)
+            self._rebuild_index()
+
+            self._cancel_worker(subscriber)
+            self._queues.pop(subscriber, None)
+            if subscriber in self._paused:
+                self._resume(subscriber)
+
+    def _rebuild_index(self) -> None:
+        index: Dict[str, List[LogicSubscriber[Any]]] = {}
+        for sub in self.subscribers:
+            for topic in sub.topics:
+                index.setdefault(topic, []).append(sub)
+
+        self._topics_index = {t: tuple(subs) for t, subs in index.items()}
+
+    async def start(self) -> None:
+        """Build the consumer, subscribe it to all registered topics and start fetching."""
+        if self.running:
+            self.resubscribe()
+            return
+
+        self.consumer = consumer = self.builder(
+            group_id=self.group_id,
+            client_id=self.client_id,
+            **self.connection_args,
+        )
+
+        consumer.subscribe(topics=self.topics, listener=_DropLagListener(self))
+
+        await consumer.start()
+        self.running = True
+
+        for sub in self.subscribers:
+            sub.consumer = consumer
+            self._start_worker(sub)
+
+        self._task = asyncio.create_task(self._consume())
+
+    def resubscribe(self) -> None:
+        """Update the running consumer subscription to the current topics union."""
+        assert self.consumer, "You should start consumer at first."  # nosec B101
+
+        for sub in self.subscribers:
+            sub.consumer = self.consumer
+
+        self.consumer.subscribe(
+            topics=self.topics,
+            listener=_DropLagListener(self),
+        )
+
+    async def stop(self) -> None:
+        self.running = False
+
+        own_tasks = {self._task, *self._workers.values()}
+
+        for sub in tuple(self._workers):
+            self._cancel_worker(sub)
+
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._task = None
+
+        self._paused.clear()
+        for queue in self._queues.values():
+            while not queue.empty():
+                queue.get_nowait()
+
+        if self.consumer is not None:
+            consumer, self.consumer = self.consumer, None
+
+            if asyncio.current_task() in own_tasks:
+                # called from a handler (e.g. by `StopConsume`):
+                # the current task can't wait for the consumer stop
+                self._stop_task = asyncio.create_task(consumer.stop())
+            else:
+                await consumer.stop()
+
+    def _start_worker(self, subscriber: "LogicSubscriber[Any]") -> None:
+        if (worker := self._workers.get(subscriber)) is None or worker.done():
+            self._workers[subscriber] = worker = asyncio.create_task(
+                self._work(subscriber, self._queues[subscriber])
+            )
+
+    def _cancel_worker(self, subscriber: "LogicSubscriber[Any]") -> None:
+        worker = self._workers.pop(subscriber, None)
+
+        # subscriber is closing from its own handler
+        if worker is not None and worker is not asyncio.current_task():
+            worker.cancel()
+
+    async def _consume(self) -> None:
+        assert self.consumer, "You should start consumer at first."  # nosec B101
+
+        connected = True
+        while self.running:
+            try:
+                messages = await self.consumer.getmany(
+                    timeout_ms=self.fetch_timeout_ms,
+                )
+
+            # pragma: no cover
+            except KafkaError:  # noqa: PERF203
+                if connected:
+                    connected = False
+                await anyio.sleep(5)
+
+            except ConsumerStoppedError:
+                return
+
+            else:
+                if not connected:  # pragma: no cover
+                    connected = True
+
+                for sub in self.subscribers:
+                    if sub.consumer_metrics:
+                        sub._observe_fetch(
+                            {
+                                tp: records
+                                for tp, records in messages.items()
+                                if tp.topic in sub.topics
+                            }
+                        )
+
+                for tp, records in messages.items():
+                    self.dispatch(tp.topic, records)
+
+                self._pause_overflowed()
+
+    def dispatch(self, topic: str, records: List[Any]) -> None:
+        """Put records to buffers of every subscriber of the topic."""
+        if not (subscribers := self._topics_index.get(topic)):
+            return
+
+        for sub in subscribers:
+            if (queue := self._queues.get(sub)) is not None:
+                for record in records:
+                    queue.put_nowait(record)
+
+    async def _work(
+        self,
+        subscriber: "LogicSubscriber[Any]",
+        queue: "asyncio.Queue[Any]",
+    ) -> None:
+        while self.running and subscriber in self.subscribers:
+            record = await queue.get()
+
+            await subscriber.consume_one(record)
+
+            if subscriber in self._paused and queue.qsize() <= self.buffer_size // 2:
+                self._resume(subscriber)
+
+    def _pause_overflowed(self) -> None:
+        for sub, queue in self._queues.items():
+            if queue.qsize() >= self.buffer_size:
+                self._paused.add(sub)
+
+        # repeat for paused subscribers: rebalance resets paused partitions
+        if self._paused and (partitions := self._partitions_of(self._paused)):
+            assert self.consumer  # nosec B101
+            self.consumer.pause(*partitions)
+
+    def _resume(self, subscriber: "LogicSubscriber[Any]") -> None:
+        self._paused.discard(subscriber)
+
+        if self.consumer is None:
+            return
+
+        # partitions can be still required to pause by other subscribers
+        still_paused = set(self._partitions_of(self._paused))
+        if partitions := [
+            tp for tp in self._partitions_of((subscriber,)) if tp not in still_paused
+        ]:
+            self.consumer.resume(*partitions)
+
+    def _partitions_of(
+        self,
+        subscribers: Iterable["LogicSubscriber[Any]"],
+    ) -> List["TopicPartition"]:
+        if self.consumer is None:
+            return []
+
+        topics = {t for sub in subscribers for t in sub.topics}
+        return [tp for tp in self.consumer.assignment() if tp.topic in topics]
+
+
+class SharedConsumersPool:
+    """Broker-level registry of consumers shared between subscribers.
+
+    Subscribers with the same `group_id`, `client_id` and connection args are
+    served by the same `SharedConsumer`.
+    """
+
+    def __init__(self) -> None:
+        self.running = False
+        self._consumers: Dict[Hashable, SharedConsumer] = {}
+
+    async def add_subscriber(self, subscriber: "LogicSubscriber[Any]") -> None:
+        """Register subscriber in a group consumer.
+
+        If the pool is already running (subscriber was added at runtime),
+        the group consumer is started or resubscribed immediately.
+        """
+        assert subscriber.builder, "You should setup subscriber at first."  # nosec B101
+
+        key = _make_key(
+            subscriber.group_id,
+            subscriber.client_id,
+            subscriber.connection_args,
+        )
+
+        if (shared := self._consumers.get(key)) is None:
+            shared = self._consumers[key] = SharedConsumer(
+                builder=subscriber.builder,
+                group_id=subscriber.group_id,
+                client_id=subscriber.client_id,
+                connection_args=subscriber.connection_args,
+            )
+
+        shared.add_subscriber(subscriber)
+
+        if self.running:
+            await shared.start()
+
+    async def remove_subscriber(self, subscriber: "LogicSubscriber[Any]") -> None:
+        for key, shared in tuple(self._consumers.items()):
+            if subscriber in shared.subscribers:
+                shared.remove_subscriber(subscriber)
+
+                if not shared.subscribers:
+                    await shared.stop()
+                    self._consumers.pop(key)
+
+                elif shared.running:
+                    shared.resubscribe()
+
+    async def start(self) -> None:
+        self.running = True
+        for shared in self._consumers.values():
+            await shared.start()
+
+    async def stop(self) -> None:
+        self.running = False
+        for shared in self._consumers.values():
+            await shared.stop()
+        self._consumers = {}
+
+
+def _make_key(
+    group_id: Optional[str],
+    client_id: Optional[str],
+    connection_args: "AnyDict",
+) -> Hashable:
+    return (
+        group_id,
+        client_id,
+        tuple(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in sorted(connection_args.items())
+        ),
+    )
+
+
+class _DropLagListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Drop revoked partitions lag metrics of the shared consumer subscribers."""
+
+    def __init__(self, shared: SharedConsumer) -> None:
+        self.shared = shared
+
+    async def on_partitions_revoked(self, revoked: Iterable["TopicPartition"]) -> None:
+        for tp in revoked:
+            for sub in self.shared._topics_index.get(tp.topic, ()):
+                if sub.consumer_metrics:
+                    sub.consumer_metrics.remove_lag(tp.topic, tp.partition)
+
+    async def on_partitions_assigned(
+        self,
+        assigned: Iterable["TopicPartition"],
+    ) -> None:
+        pass
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
+from collections import deque
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -13,12 +15,17 @@ from typing import (
 )
 
 import anyio
-from aiokafka import ConsumerRecord, TopicPartition
+from aiokafka import ConsumerRebalanceListener, ConsumerRecord, TopicPartition
 from aiokafka.errors import ConsumerStoppedError, KafkaError
 from typing_extensions import override
 
 from faststream.broker.publisher.fake import FakePublisher
-from faststream.broker.subscriber.mixins import ConcurrentMixin, TasksMixin
+from faststream.broker.subscriber.metrics import ConsumerMetrics
+from faststream.broker.subscriber.mixins import (
+    PartitionsConcurrentMixin,
+    PausableConcurrentMixin,
+    TasksMixin,
+)
 from faststream.broker.subscriber.usecase import SubscriberUsecase
 from faststream.broker.types import (
     AsyncCallable,
@@ -29,15 +36,20 @@ from faststream.broker.types import (
 from faststream.broker.utils import process_msg
 from faststream.kafka.message import KafkaAckableMessage, KafkaMessage
 from faststream.kafka.parser import AioKafkaBatchParser, AioKafkaParser
+from faststream.kafka.subscriber.commit import (
+    CommitOnRevokeListener,
+    OffsetsCommitManager,
+)
+from faststream.utils.functions import call_or_await
 from faststream.utils.path import compile_path
 
 if TYPE_CHECKING:
     from aiokafka import AIOKafkaConsumer
-    from aiokafka.abc import ConsumerRebalanceListener
     from fast_depends.dependencies import Depends
 
     from faststream.broker.message import StreamMessage
     from faststream.broker.publisher.proto import ProducerProto
+    from faststream.kafka.subscriber.shared import SharedConsumersPool
     from faststream.types import AnyDict, Decorator, LoggerProto
 
 
@@ -52,6 +64,12 @@ class LogicSubscriber(ABC, TasksMixin, SubscriberUsecase[MsgType]):
 
     client_id: Optional[str]
     batch: bool
+    is_manual: bool
+
+    connection_args: "AnyDict"
+    consumers_pool: Optional["SharedConsumersPool"]
+    commit_manager: Optional[OffsetsCommitManager]
+    consumer_metrics: ConsumerMetrics
 
     def __init__(
         self,
@@ -62,6 +80,8 @@ class LogicSubscriber(ABC, TasksMixin, SubscriberUsecase[MsgType]):
         listener: Optional["ConsumerRebalanceListener"],
         pattern: Optional[str],
         partitions: Iterable["TopicPartition"],
+        is_manual: bool,
+        commit_manager: Optional[OffsetsCommitManager],
         # Subscriber args
         default_parser: "AsyncCallable",
         default_decoder: "AsyncCallable",
@@ -95,14 +115,18 @@ class LogicSubscriber(ABC, TasksMixin, SubscriberUsecase[MsgType]):
         self.group_id = group_id
 
         self._pattern = pattern
-        self.__listener = listener
-        self.__connection_args = connection_args
+        self._listener = listener
+        self.connection_args = connection_args
+        self.is_manual = is_manual
+        self.commit_manager = commit_manager
 
         # Setup it later
         self.client_id = ""
         self.builder = None
+        self.consumers_pool = None
 
         self.consumer = None
+        self.consumer_metrics = ConsumerMetrics(broker="kafka", handler="")
 
     @override
     def setup(  # type: ignore[override]
@@ -110,6 +134,7 @@ class LogicSubscriber(ABC, TasksMixin, SubscriberUsecase[MsgType]):
         *,
         client_id: Optional[str],
         builder: Callable[..., "AIOKafkaConsumer"],
+        consumers_pool: Optional["SharedConsumersPool"],
         # basic args
         logger: Optional["LoggerProto"],
         producer: Optional["ProducerProto"],
@@ -126,6 +151,7 @@ class LogicSubscriber(ABC, TasksMixin, SubscriberUsecase[MsgType]):
     ) -> None:
         self.client_id = client_id
         self.builder = builder
+        self.consumers_pool = consumers_pool
 
         super().setup(
             logger=logger,
@@ -144,17 +170,29 @@ class LogicSubscriber(ABC, TasksMixin, SubscriberUsecase[MsgType]):
         """Start the consumer."""
         assert self.builder, "You should setup subscriber at first."  # nosec B101
 
+        self.consumer_metrics = ConsumerMetrics(
+            broker="kafka",
+            handler=",".join(self.topic_names),
+            middlewares=self._broker_middlewares,
+        )
+
+        if self.consumers_pool is not None and self.is_shareable:
+            # consumer will be set by the pool at group consumer startup
+            await self.consumers_pool.add_subscriber(self)
+            await super().start()
+            return
+
         self.consumer = consumer = self.builder(
             group_id=self.group_id,
             client_id=self.client_id,
-            **self.__connection_args,
+            **self.connection_args,
         )
 
         if self.topics or self._pattern:
             consumer.subscribe(
                 topics=self.topics,
                 pattern=self._pattern,
-                listener=self.__listener,
+                listener=self._make_listener(),
             )
 
         elif self.partitions:
@@ -163,16 +201,50 @@ class LogicSubscriber(ABC, TasksMixin, SubscriberUsecase[MsgType]):
         await consumer.start()
         await super().start()
 
+        if self.commit_manager is not None:
+            self.commit_manager.start(consumer)
+
         if self.calls:
             self.add_task(self._consume())
 
     async def close(self) -> None:
         await super().close()
 
-        if self.consumer is not None:
+        if self.consumers_pool is not None and self.is_shareable:
+            await self.consumers_pool.remove_subscriber(self)
+            self.consumer = None
+
+        elif self.consumer is not None:
+            if self.commit_manager is not None:
+                await self.commit_manager.stop()
+
             await self.consumer.stop()
             self.consumer = None
 
+    def _make_listener(self) -> Optional["ConsumerRebalanceListener"]:
+        """Wrap user rebalance listener by subscriber own ones."""
+        listener = self._listener
+        if self.commit_manager is not None:
+            listener = CommitOnRevokeListener(self.commit_manager, listener)
+
+        if self.consumer_metrics:
+            listener = _RebalanceMetricsListener(self.consumer_metrics, listener)
+
+        return listener
+
+    @property
+    def is_shareable(self) -> bool:
+        """Whether the subscriber can be served by a group shared consumer."""
+        return bool(
+            self.calls
+            and self.group_id
+            and self.topics
+            and not self._pattern
+            and self._listener is None
+            # manual `ack` commits the shared consumer positions of all subscribers
+            and not self.is_manual
+        )
+
     @override
     async def get_one(
         self,
@@ -217,7 +289,7 @@ class LogicSubscriber(ABC, TasksMixin, SubscriberUsecase[MsgType]):
         )
 
     @abstractmethod
-    async def get_msg(self) -> MsgType:
+    async def get_msg(self) -> Optional[MsgType]:
         raise NotImplementedError()
 
     async def _consume(self) -> None:
@@ -247,6 +319,24 @@ class LogicSubscriber(ABC, TasksMixin, SubscriberUsecase[MsgType]):
     async def consume_one(self, msg: MsgType) -> None:
         await self.consume(msg)
 
+    def _observe_fetch(
+        self,
+        messages: Dict["TopicPartition", List["ConsumerRecord"]],
+    ) -> None:
+        """Send fetched records count and partitions lag to metrics."""
+        assert self.consumer  # nosec B101
+
+        self.consumer_metrics.fetched(sum(map(len, messages.values())))
+
+        for tp, records in messages.items():
+            # highwater is updated by the same fetch response
+            if records and (highwater := self.consumer.highwater(tp)) is not None:
+                self.consumer_metrics.lag(
+                    tp.topic,
+                    tp.partition,
+                    highwater - records[-1].offset - 1,
+                )
+
     @staticmethod
     def get_routing_hash(
         topics: Iterable[str],
@@ -304,7 +394,10 @@ class DefaultSubscriber(LogicSubscriber["ConsumerRecord"]):
         connection_args: "AnyDict",
         partitions: Iterable["TopicPartition"],
         is_manual: bool,
+        commit_interval_ms: Optional[int],
+        commit_batch_size: int,
         # Subscriber args
+        prefetch_records: int,
         no_ack: bool,
         no_reply: bool,
         retry: bool,
@@ -315,6 +408,17 @@ class DefaultSubscriber(LogicSubscriber["ConsumerRecord"]):
         description_: Optional[str],
         include_in_schema: bool,
     ) -> None:
+        commit_manager = _make_commit_manager(
+            is_manual, commit_interval_ms, commit_batch_size
+        )
+
+        # `consumer.commit()` commits the fetched position, so prefetched but not
+        # processed records would be committed by manual ack
+        self.prefetch_records = (
+            1 if is_manual and commit_manager is None else prefetch_records
+        )
+        self._prefetched: Deque[ConsumerRecord] = deque()
+
         if pattern:
             reg, pattern = compile_path(
                 pattern,
@@ -337,6 +441,8 @@ class DefaultSubscriber(LogicSubscriber["ConsumerRecord"]):
             pattern=pattern,
             connection_args=connection_args,
             partitions=partitions,
+            is_manual=is_manual,
+            commit_manager=commit_manager,
             # subscriber args
             default_parser=parser.parse_message,
             default_decoder=parser.decode_message,
@@ -352,9 +458,70 @@ class DefaultSubscriber(LogicSubscriber["ConsumerRecord"]):
             include_in_schema=include_in_schema,
         )
 
-    async def get_msg(self) -> "ConsumerRecord":
+    async def get_msg(self) -> Optional["ConsumerRecord"]:
         assert self.consumer, "You should setup subscriber at first."  # nosec B101
-        return await self.consumer.getone()
+
+        if self.prefetch_records <= 1:
+            msg = await self.consumer.getone()
+
+            if self.consumer_metrics:
+                self._observe_fetch({TopicPartition(msg.topic, msg.partition): [msg]})
+
+            if self.commit_manager is not None:
+                self.commit_manager.track(msg)
+
+            return msg
+
+        if not self._prefetched:
+            messages = await self.consumer.getmany(
+                timeout_ms=self.connection_args.get("fetch_max_wait_ms", 500),
+                max_records=self.prefetch_records,
+            )
+
+            if self.consumer_metrics:
+                self._observe_fetch(messages)
+
+            for records in messages.values():
+                # track at fetch time: revoke forgets both tracked and buffered
+                # records of the partition
+                if self.commit_manager is not None:
+                    for record in records:
+                        self.commit_manager.track(record)
+
+                self._prefetched.extend(records)
+
+            if not self._prefetched:
+                return None
+
+        return self._prefetched.popleft()
+
+    async def close(self) -> None:
+        await super().close()
+        self._prefetched.clear()
+
+    def _make_listener(self) -> Optional["ConsumerRebalanceListener"]:
+        listener = super()._make_listener()
+
+        # aiokafka auto commit commits consumed positions, prefetched records
+        # included, before the revoke, so they are processed by this consumer only
+        if self.prefetch_records > 1 and self.commit_manager is not None:
+            listener = _DropPrefetchedListener(self, listener)
+
+        return listener
+
+    def drop_prefetched(self, partitions: Iterable["TopicPartition"]) -> None:
+        """Forget buffered records of partitions, they are fetched again.
+
+        Used for revoked partitions, which offsets are not committed yet,
+        and for partitions seeked back by `nack`.
+        """
+        revoked = set(partitions)
+
+        self._prefetched = deque(
+            r
+            for r in self._prefetched
+            if TopicPartition(r.topic, r.partition) not in revoked
+        )
 
     def get_log_context(
         self,
@@ -385,6 +552,8 @@ class BatchSubscriber(LogicSubscriber[Tuple["ConsumerRecord", ...]]):
         connection_args: "AnyDict",
         partitions: Iterable["TopicPartition"],
         is_manual: bool,
+        commit_interval_ms: Optional[int],
+        commit_batch_size: int,
         # Subscriber args
         no_ack: bool,
         no_reply: bool,
@@ -401,6 +570,10 @@ class BatchSubscriber(LogicSubscriber[Tuple["ConsumerRecord", ...]]):
         self.batch_timeout_ms = batch_timeout_ms
         self.max_records = max_records
 
+        commit_manager = _make_commit_manager(
+            is_manual, commit_interval_ms, commit_batch_size
+        )
+
         if pattern:
             reg, pattern = compile_path(
                 pattern,
@@ -423,6 +596,8 @@ class BatchSubscriber(LogicSubscriber[Tuple["ConsumerRecord", ...]]):
             pattern=pattern,
             connection_args=connection_args,
             partitions=partitions,
+            is_manual=is_manual,
+            commit_manager=commit_manager,
             # subscriber args
             default_parser=parser.parse_message,
             default_decoder=parser.decode_message,
@@ -438,6 +613,11 @@ class BatchSubscriber(LogicSubscriber[Tuple["ConsumerRecord", ...]]):
             include_in_schema=include_in_schema,
         )
 
+    @property
+    def is_shareable(self) -> bool:
+        # batches are fetched with subscriber own `max_records` and `batch_timeout_ms`
+        return False
+
     async def get_msg(self) -> Tuple["ConsumerRecord", ...]:
         assert self.consumer, "You should setup subscriber at first."  # nosec B101
 
@@ -446,11 +626,20 @@ class BatchSubscriber(LogicSubscriber[Tuple["ConsumerRecord", ...]]):
             max_records=self.max_records,
         )
 
+        if self.consumer_metrics:
+            self._observe_fetch(messages)
+
         if not messages:  # pragma: no cover
             await anyio.sleep(self.batch_timeout_ms / 1000)
             return ()
 
-        return tuple(chain(*messages.values()))
+        batch = tuple(chain(*messages.values()))
+
+        if self.commit_manager is not None:
+            for record in batch:
+                self.commit_manager.track(record)
+
+        return batch
 
     def get_log_context(
         self,
@@ -468,7 +657,10 @@ class BatchSubscriber(LogicSubscriber[Tuple["ConsumerRecord", ...]]):
         )
 
 
-class ConcurrentDefaultSubscriber(ConcurrentMixin[ConsumerRecord], DefaultSubscriber):
+class ConcurrentDefaultSubscriber(
+    PausableConcurrentMixin[ConsumerRecord],
+    DefaultSubscriber,
+):
     def __init__(
         self,
         *topics: str,
@@ -479,8 +671,11 @@ class ConcurrentDefaultSubscriber(ConcurrentMixin[ConsumerRecord], DefaultSubscr
         connection_args: "AnyDict",
         partitions: Iterable["TopicPartition"],
         is_manual: bool,
+        commit_interval_ms: Optional[int],
+        commit_batch_size: int,
         # Subscriber args
         max_workers: int,
+        prefetch_records: int,
         no_ack: bool,
         no_reply: bool,
         retry: bool,
@@ -499,6 +694,9 @@ class ConcurrentDefaultSubscriber(ConcurrentMixin[ConsumerRecord], DefaultSubscr
             connection_args=connection_args,
             partitions=partitions,
             is_manual=is_manual,
+            commit_interval_ms=commit_interval_ms,
+            commit_batch_size=commit_batch_size,
+            prefetch_records=prefetch_records,
             # Propagated args
             no_ack=no_ack,
             no_reply=no_reply,
@@ -518,3 +716,221 @@ class ConcurrentDefaultSubscriber(ConcurrentMixin[ConsumerRecord], DefaultSubscr
 
     async def consume_one(self, msg: "ConsumerRecord") -> None:
         await self._put_msg(msg)
+
+    async def pause_consuming(self) -> None:
+        if self.consumer is not None:
+            self.consumer.pause(*self._own_assignment())
+
+    async def resume_consuming(self) -> None:
+        if self.consumer is not None:
+            self.consumer.resume(*self._own_assignment())
+
+    def _own_assignment(self) -> List["TopicPartition"]:
+        assert self.consumer  # nosec B101
+        assignment = self.consumer.assignment()
+
+        if self.topics:
+            # consumer can be shared with other subscribers
+            return [tp for tp in assignment if tp.topic in self.topics]
+
+        return list(assignment)
+
+
+class ConcurrentBetweenPartitionsSubscriber(
+    PartitionsConcurrentMixin[ConsumerRecord],
+    DefaultSubscriber,
+):
+    """Consume records of assigned partitions concurrently keeping in-partition order."""
+
+    def __init__(
+        self,
+        *topics: str,
+        # Kafka information
+        group_id: Optional[str],
+        listener: Optional["ConsumerRebalanceListener"],
+        pattern: Optional[str],
+        connection_args: "AnyDict",
+        partitions: Iterable["TopicPartition"],
+        is_manual: bool,
+        commit_interval_ms: Optional[int],
+        commit_batch_size: int,
+        # Subscriber args
+        prefetch_records: int,
+        no_ack: bool,
+        no_reply: bool,
+        retry: bool,
+        broker_dependencies: Iterable["Depends"],
+        broker_middlewares: Sequence["BrokerMiddleware[ConsumerRecord]"],
+        # AsyncAPI args
+        title_: Optional[str],
+        description_: Optional[str],
+        include_in_schema: bool,
+    ) -> None:
+        super().__init__(
+            *topics,
+            group_id=group_id,
+            listener=_PartitionWorkersListener(self, listener),
+            pattern=pattern,
+            connection_args=connection_args,
+            partitions=partitions,
+            is_manual=is_manual,
+            commit_interval_ms=commit_interval_ms,
+            commit_batch_size=commit_batch_size,
+            prefetch_records=prefetch_records,
+            # Propagated args
+            no_ack=no_ack,
+            no_reply=no_reply,
+            retry=retry,
+            broker_middlewares=broker_middlewares,
+            broker_dependencies=broker_dependencies,
+            # AsyncAPI args
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        )
+
+    async def _consume(self) -> None:
+        assert self.consumer, "You should start subscriber at first."  # nosec B101
+
+        connected = True
+        while self.running:
+            try:
+                messages = await self.consumer.getmany(
+                    timeout_ms=self.connection_args.get("fetch_max_wait_ms", 500),
+                    # records are buffered by partition workers in any case
+                    max_records=max(self.prefetch_records, self.partition_buffer_size),
+                )
+
+            # pragma: no cover
+            except KafkaError:  # noqa: PERF203
+                if connected:
+                    connected = False
+                await anyio.sleep(5)
+
+            except ConsumerStoppedError:
+                return
+
+            else:
+                if not connected:  # pragma: no cover
+                    connected = True
+
+                if self.consumer_metrics:
+                    self._observe_fetch(messages)
+
+                for tp, records in messages.items():
+                    for record in records:
+                        if self.commit_manager is not None:
+                            self.commit_manager.track(record)
+
+                        await self._put_partition_msg(tp, record)
+
+    async def consume_one(self, msg: "ConsumerRecord") -> None:
+        await self._put_partition_msg(TopicPartition(msg.topic, msg.partition), msg)
+
+    async def pause_partition(self, partition: "TopicPartition") -> None:
+        if self.consumer is not None and partition in self.consumer.assignment():
+            self.consumer.pause(partition)
+
+    async def resume_partition(self, partition: "TopicPartition") -> None:
+        # partition can be already revoked while its worker is draining
+        if self.consumer is not None and partition in self.consumer.assignment():
+            self.consumer.resume(partition)
+
+
+class _PartitionWorkersListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Start and stop partition workers on rebalance and call user listener."""
+
+    def __init__(
+        self,
+        subscriber: "ConcurrentBetweenPartitionsSubscriber",
+        listener: Optional["ConsumerRebalanceListener"],
+    ) -> None:
+        self.subscriber = subscriber
+        self.listener = listener
+
+    async def on_partitions_revoked(self, revoked: Iterable["TopicPartition"]) -> None:
+        # finish revoked partitions records before the partitions reassignment
+        await self.subscriber.stop_partition_workers(revoked)
+
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_revoked, revoked)
+
+    async def on_partitions_assigned(
+        self,
+        assigned: Iterable["TopicPartition"],
+    ) -> None:
+        self.subscriber.start_partition_workers(assigned)
+
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_assigned, assigned)
+
+
+class _DropPrefetchedListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Drop prefetched records of revoked partitions and call wrapped listener."""
+
+    def __init__(
+        self,
+        subscriber: "DefaultSubscriber",
+        listener: Optional["ConsumerRebalanceListener"],
+    ) -> None:
+        self.subscriber = subscriber
+        self.listener = listener
+
+    async def on_partitions_revoked(self, revoked: Iterable["TopicPartition"]) -> None:
+        revoked = tuple(revoked)
+
+        self.subscriber.drop_prefetched(revoked)
+
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_revoked, revoked)
+
+    async def on_partitions_assigned(
+        self,
+        assigned: Iterable["TopicPartition"],
+    ) -> None:
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_assigned, assigned)
+
+
+class _RebalanceMetricsListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Observe rebalances count and duration and call wrapped listener."""
+
+    def __init__(
+        self,
+        metrics: ConsumerMetrics,
+        listener: Optional["ConsumerRebalanceListener"],
+    ) -> None:
+        self.metrics = metrics
+        self.listener = listener
+
+    async def on_partitions_revoked(self, revoked: Iterable["TopicPartition"]) -> None:
+        self.metrics.rebalance_started()
+
+        for tp in revoked:
+            self.metrics.remove_lag(tp.topic, tp.partition)
+
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_revoked, revoked)
+
+    async def on_partitions_assigned(
+        self,
+        assigned: Iterable["TopicPartition"],
+    ) -> None:
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_assigned, assigned)
+
+        self.metrics.rebalance_finished()
+
+
+def _make_commit_manager(
+    is_manual: bool,
+    commit_interval_ms: Optional[int],
+    commit_batch_size: int,
+) -> Optional[OffsetsCommitManager]:
+    if not is_manual or commit_interval_ms is None:
+        return None
+
+    return OffsetsCommitManager(
+        interval_ms=commit_interval_ms,
+        batch_size=commit_batch_size,
+    )
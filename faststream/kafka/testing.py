@@ -1,10 +1,13 @@
+import asyncio
 import re
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple
 from unittest.mock import AsyncMock, MagicMock
 
 import anyio
 from aiokafka import ConsumerRecord
+from aiokafka.structs import RecordMetadata
 from typing_extensions import override
 
 from faststream.broker.message import encode_message, gen_cor_id
@@ -140,6 +143,47 @@ class FakeProducer(AioKafkaFastProducer):
 
         return return_value
 
+    @override
+    async def send(
+        self,
+        message: "SendableMessage",
+        topic: str,
+        *,
+        correlation_id: str,
+        key: Optional[bytes] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        reply_to: str = "",
+    ) -> "asyncio.Future[RecordMetadata]":
+        """Publish a message and return already confirmed delivery future."""
+        await self.publish(
+            message,
+            topic,
+            key=key,
+            partition=partition,
+            timestamp_ms=timestamp_ms,
+            headers=headers,
+            correlation_id=correlation_id,
+            reply_to=reply_to,
+        )
+
+        future: asyncio.Future[RecordMetadata] = (
+            asyncio.get_running_loop().create_future()
+        )
+        future.set_result(
+            RecordMetadata(
+                topic=topic,
+                partition=partition or 0,
+                topic_partition=TopicPartition(topic, partition or 0),
+                offset=0,
+                timestamp=timestamp_ms or int(datetime.now().timestamp()),
+                timestamp_type=0,
+                log_start_offset=0,
+            )
+        )
+        return future
+
     @override
     async def request(  # type: ignore[override]
         self,
@@ -181,6 +225,7 @@ class FakeProducer(AioKafkaFastProducer):
         *msgs: "SendableMessage",
         topic: str,
         partition: Optional[int] = None,
+        keys: Optional[Sequence[Optional[bytes]]] = None,
         timestamp_ms: Optional[int] = None,
         headers: Optional[Dict[str, str]] = None,
         reply_to: str = "",
@@ -195,12 +240,13 @@ class FakeProducer(AioKafkaFastProducer):
                         message=message,
                         topic=topic,
                         partition=partition,
+                        key=key,
                         timestamp_ms=timestamp_ms,
                         headers=headers,
                         correlation_id=correlation_id,
                         reply_to=reply_to,
                     )
-                    for message in msgs
+                    for message, key in zip(msgs, keys or repeat(None))
                 )
 
                 if isinstance(handler, AsyncAPIBatchSubscriber):
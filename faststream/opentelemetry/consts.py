@@ -8,4 +8,5 @@ class MessageAction:
 OTEL_SCHEMA = "https://opentelemetry.io/schemas/1.11.0"
 ERROR_TYPE = "error.type"
 MESSAGING_DESTINATION_PUBLISH_NAME = "messaging.destination_publish.name"
+MESSAGING_CONSUMER_HANDLER = "messaging.consumer.handler"
 WITH_BATCH = "with_batch"
@@ -1,11 +1,23 @@
 import time
 from collections import defaultdict
 from copy import copy
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 from opentelemetry import baggage, context, metrics, trace
 from opentelemetry.baggage.propagation import W3CBaggagePropagator
 from opentelemetry.context import Context
+from opentelemetry.metrics import Observation
 from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.trace import Link, Span
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
@@ -15,6 +27,7 @@ from faststream import context as fs_context
 from faststream.opentelemetry.baggage import Baggage
 from faststream.opentelemetry.consts import (
     ERROR_TYPE,
+    MESSAGING_CONSUMER_HANDLER,
     MESSAGING_DESTINATION_PUBLISH_NAME,
     OTEL_SCHEMA,
     WITH_BATCH,
@@ -26,11 +39,12 @@ if TYPE_CHECKING:
     from contextvars import Token
     from types import TracebackType
 
-    from opentelemetry.metrics import Meter, MeterProvider
+    from opentelemetry.metrics import CallbackOptions, Meter, MeterProvider
     from opentelemetry.trace import Tracer, TracerProvider
     from opentelemetry.util.types import Attributes
 
     from faststream.broker.message import StreamMessage
+    from faststream.confluent.stats import ClientStats
     from faststream.types import AnyDict, AsyncFunc, AsyncFuncAny
 
 
@@ -40,7 +54,16 @@ _TRACE_PROPAGATOR = TraceContextTextMapPropagator()
 
 class _MetricsContainer:
     __slots__ = (
+        "_consumer_lags",
+        "consumer_fetch_messages",
+        "consumer_lag",
+        "consumer_last_fetch_time",
+        "consumer_rebalance_duration",
+        "consumer_rebalances",
         "include_messages_counters",
+        "librdkafka_broker_rtt",
+        "librdkafka_queue_messages",
+        "librdkafka_topic_batch_size",
         "process_counter",
         "process_duration",
         "publish_counter",
@@ -73,6 +96,51 @@ class _MetricsContainer:
                 description="Measures the number of published messages.",
             )
 
+        self.consumer_fetch_messages = meter.create_histogram(
+            name="messaging.consumer.fetch.messages",
+            unit="message",
+            description="Measures the number of messages fetched by a consumer poll.",
+        )
+        self.consumer_last_fetch_time = meter.create_gauge(
+            name="messaging.consumer.fetch.last_time",
+            unit="s",
+            description="Unix time of the last consumer poll.",
+        )
+        # observable to drop revoked partitions series
+        self._consumer_lags: Dict[Tuple[str, str, str, int], int] = {}
+        self.consumer_lag = meter.create_observable_gauge(
+            name="messaging.consumer.lag",
+            callbacks=[self._observe_consumer_lags],
+            unit="message",
+            description="Number of not consumed messages of a partition.",
+        )
+        self.consumer_rebalances = meter.create_counter(
+            name="messaging.consumer.rebalances",
+            unit="{rebalance}",
+            description="Measures the number of consumer partitions assignments.",
+        )
+        self.consumer_rebalance_duration = meter.create_histogram(
+            name="messaging.consumer.rebalance.duration",
+            unit="s",
+            description="Measures the time between partitions revoke and assignment.",
+        )
+
+        self.librdkafka_queue_messages = meter.create_gauge(
+            name="messaging.librdkafka.queue.messages",
+            unit="message",
+            description="Number of messages in librdkafka producer queue.",
+        )
+        self.librdkafka_broker_rtt = meter.create_gauge(
+            name="messaging.librdkafka.broker.rtt",
+            unit="s",
+            description="Average Kafka broker round-trip time.",
+        )
+        self.librdkafka_topic_batch_size = meter.create_gauge(
+            name="messaging.librdkafka.topic.batch.size",
+            unit="By",
+            description="Average produced batch size.",
+        )
+
     def observe_publish(
         self, attrs: "AnyDict", duration: float, msg_count: int
     ) -> None:
@@ -103,6 +171,91 @@ class _MetricsContainer:
                 attributes=counter_attrs,
             )
 
+    def observe_consumer_fetch(
+        self,
+        broker: str,
+        handler: str,
+        records: int,
+    ) -> None:
+        attrs = {
+            SpanAttributes.MESSAGING_SYSTEM: broker,
+            SpanAttributes.MESSAGING_DESTINATION_NAME: handler,
+        }
+        self.consumer_last_fetch_time.set(time.time(), attributes=attrs)
+
+        if records:
+            self.consumer_fetch_messages.record(records, attributes=attrs)
+
+    def set_consumer_lag(
+        self,
+        broker: str,
+        handler: str,
+        topic: str,
+        partition: int,
+        lag: int,
+    ) -> None:
+        self._consumer_lags[(broker, handler, topic, partition)] = lag
+
+    def remove_consumer_lag(
+        self,
+        broker: str,
+        handler: str,
+        topic: str,
+        partition: int,
+    ) -> None:
+        self._consumer_lags.pop((broker, handler, topic, partition), None)
+
+    def _observe_consumer_lags(
+        self,
+        options: "CallbackOptions",
+    ) -> Iterator["Observation"]:
+        for (broker, handler, topic, partition), lag in tuple(
+            self._consumer_lags.items()
+        ):
+            yield Observation(
+                lag,
+                attributes={
+                    SpanAttributes.MESSAGING_SYSTEM: broker,
+                    MESSAGING_CONSUMER_HANDLER: handler,
+                    SpanAttributes.MESSAGING_DESTINATION_NAME: topic,
+                    SpanAttributes.MESSAGING_KAFKA_DESTINATION_PARTITION: partition,
+                },
+            )
+
+    def observe_consumer_rebalance(
+        self,
+        broker: str,
+        handler: str,
+        duration: Optional[float],
+    ) -> None:
+        attrs = {
+            SpanAttributes.MESSAGING_SYSTEM: broker,
+            SpanAttributes.MESSAGING_DESTINATION_NAME: handler,
+        }
+        self.consumer_rebalances.add(1, attributes=attrs)
+
+        if duration is not None:
+            self.consumer_rebalance_duration.record(duration, attributes=attrs)
+
+    def observe_client_stats(self, broker: str, stats: "ClientStats") -> None:
+        attrs = {
+            SpanAttributes.MESSAGING_SYSTEM: broker,
+            SpanAttributes.MESSAGING_CLIENT_ID: stats.name,
+        }
+        self.librdkafka_queue_messages.set(stats.queue_messages, attributes=attrs)
+
+        for node, broker_stats in stats.brokers.items():
+            self.librdkafka_broker_rtt.set(
+                broker_stats.rtt_seconds,
+                attributes={**attrs, SpanAttributes.NET_PEER_NAME: node},
+            )
+
+        for topic, topic_stats in stats.topics.items():
+            self.librdkafka_topic_batch_size.set(
+                topic_stats.batch_size_bytes,
+                attributes={**attrs, SpanAttributes.MESSAGING_DESTINATION_NAME: topic},
+            )
+
 
 class BaseTelemetryMiddleware(BaseMiddleware):
     def __init__(
@@ -306,6 +459,16 @@ class TelemetryMiddleware:
         self._metrics = _MetricsContainer(self._meter, include_messages_counters)
         self._settings_provider_factory = settings_provider_factory
 
+    @property
+    def consumer_metrics(self) -> _MetricsContainer:
+        """Recorder of consumer-level metrics used by subscribers."""
+        return self._metrics
+
+    @property
+    def client_metrics(self) -> _MetricsContainer:
+        """Recorder of librdkafka statistics used by Confluent clients."""
+        return self._metrics
+
     def __call__(self, msg: Optional[Any]) -> BaseMiddleware:
         return BaseTelemetryMiddleware(
             tracer=self._tracer,
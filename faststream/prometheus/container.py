@@ -11,6 +11,21 @@ class MetricsContainer:
     __slots__ = (
         "_metrics_prefix",
         "_registry",
+        "consumer_fetched_records",
+        "consumer_lag",
+        "consumer_last_fetch_timestamp_seconds",
+        "consumer_rebalance_duration_seconds",
+        "consumer_rebalances_total",
+        "librdkafka_broker_outbuf_requests",
+        "librdkafka_broker_rtt_seconds",
+        "librdkafka_broker_waitresp_requests",
+        "librdkafka_queue_bytes",
+        "librdkafka_queue_messages",
+        "librdkafka_received_messages",
+        "librdkafka_reply_queue_ops",
+        "librdkafka_topic_batch_messages",
+        "librdkafka_topic_batch_size_bytes",
+        "librdkafka_transmitted_messages",
         "published_messages_duration_seconds",
         "published_messages_exceptions_total",
         "published_messages_total",
@@ -37,6 +52,18 @@ class MetricsContainer:
         float("inf"),
     )
 
+    DEFAULT_FETCH_BUCKETS = (
+        1.0,
+        5.0,
+        10.0,
+        50.0,
+        100.0,
+        500.0,
+        1000.0,
+        5000.0,
+        float("inf"),
+    )
+
     def __init__(
         self,
         registry: "CollectorRegistry",
@@ -152,5 +179,174 @@ class MetricsContainer:
             registry=registry,
         )
 
+        self.consumer_fetched_records = cast(
+            Histogram,
+            self._get_registered_metric(f"{metrics_prefix}_consumer_fetched_records"),
+        ) or Histogram(
+            name=f"{metrics_prefix}_consumer_fetched_records",
+            documentation="Histogram of records count fetched by a consumer poll by broker and handler",
+            labelnames=["app_name", "broker", "handler"],
+            registry=registry,
+            buckets=self.DEFAULT_FETCH_BUCKETS,
+        )
+
+        self.consumer_last_fetch_timestamp_seconds = cast(
+            Gauge,
+            self._get_registered_metric(
+                f"{metrics_prefix}_consumer_last_fetch_timestamp_seconds"
+            ),
+        ) or Gauge(
+            name=f"{metrics_prefix}_consumer_last_fetch_timestamp_seconds",
+            documentation="Unix time of the last consumer poll by broker and handler",
+            labelnames=["app_name", "broker", "handler"],
+            registry=registry,
+        )
+
+        self.consumer_lag = cast(
+            Gauge,
+            self._get_registered_metric(f"{metrics_prefix}_consumer_lag"),
+        ) or Gauge(
+            name=f"{metrics_prefix}_consumer_lag",
+            documentation="Gauge of not consumed records by broker, handler, topic and partition",
+            labelnames=["app_name", "broker", "handler", "topic", "partition"],
+            registry=registry,
+        )
+
+        self.consumer_rebalances_total = cast(
+            Counter,
+            self._get_registered_metric(f"{metrics_prefix}_consumer_rebalances_total"),
+        ) or Counter(
+            name=f"{metrics_prefix}_consumer_rebalances_total",
+            documentation="Count of consumer partitions assignments by broker and handler",
+            labelnames=["app_name", "broker", "handler"],
+            registry=registry,
+        )
+
+        self.consumer_rebalance_duration_seconds = cast(
+            Histogram,
+            self._get_registered_metric(
+                f"{metrics_prefix}_consumer_rebalance_duration_seconds"
+            ),
+        ) or Histogram(
+            name=f"{metrics_prefix}_consumer_rebalance_duration_seconds",
+            documentation="Histogram of time between partitions revoke and assignment in seconds by broker and handler",
+            labelnames=["app_name", "broker", "handler"],
+            registry=registry,
+        )
+
+        self.librdkafka_queue_messages = cast(
+            Gauge,
+            self._get_registered_metric(f"{metrics_prefix}_librdkafka_queue_messages"),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_queue_messages",
+            documentation="Gauge of messages in librdkafka producer queue by broker, client and client type",
+            labelnames=["app_name", "broker", "client", "client_type"],
+            registry=registry,
+        )
+
+        self.librdkafka_queue_bytes = cast(
+            Gauge,
+            self._get_registered_metric(f"{metrics_prefix}_librdkafka_queue_bytes"),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_queue_bytes",
+            documentation="Gauge of messages size in bytes in librdkafka producer queue by broker, client and client type",
+            labelnames=["app_name", "broker", "client", "client_type"],
+            registry=registry,
+        )
+
+        self.librdkafka_reply_queue_ops = cast(
+            Gauge,
+            self._get_registered_metric(f"{metrics_prefix}_librdkafka_reply_queue_ops"),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_reply_queue_ops",
+            documentation="Gauge of operations waiting in librdkafka reply queue by broker, client and client type",
+            labelnames=["app_name", "broker", "client", "client_type"],
+            registry=registry,
+        )
+
+        self.librdkafka_transmitted_messages = cast(
+            Gauge,
+            self._get_registered_metric(
+                f"{metrics_prefix}_librdkafka_transmitted_messages"
+            ),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_transmitted_messages",
+            documentation="Gauge of total messages transmitted to Kafka brokers by broker, client and client type",
+            labelnames=["app_name", "broker", "client", "client_type"],
+            registry=registry,
+        )
+
+        self.librdkafka_received_messages = cast(
+            Gauge,
+            self._get_registered_metric(
+                f"{metrics_prefix}_librdkafka_received_messages"
+            ),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_received_messages",
+            documentation="Gauge of total messages received from Kafka brokers by broker, client and client type",
+            labelnames=["app_name", "broker", "client", "client_type"],
+            registry=registry,
+        )
+
+        self.librdkafka_broker_rtt_seconds = cast(
+            Gauge,
+            self._get_registered_metric(
+                f"{metrics_prefix}_librdkafka_broker_rtt_seconds"
+            ),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_broker_rtt_seconds",
+            documentation="Gauge of average Kafka broker round-trip time in seconds by broker, client, client type and node",
+            labelnames=["app_name", "broker", "client", "client_type", "node"],
+            registry=registry,
+        )
+
+        self.librdkafka_broker_outbuf_requests = cast(
+            Gauge,
+            self._get_registered_metric(
+                f"{metrics_prefix}_librdkafka_broker_outbuf_requests"
+            ),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_broker_outbuf_requests",
+            documentation="Gauge of requests waiting to be sent to Kafka broker by broker, client, client type and node",
+            labelnames=["app_name", "broker", "client", "client_type", "node"],
+            registry=registry,
+        )
+
+        self.librdkafka_broker_waitresp_requests = cast(
+            Gauge,
+            self._get_registered_metric(
+                f"{metrics_prefix}_librdkafka_broker_waitresp_requests"
+            ),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_broker_waitresp_requests",
+            documentation="Gauge of requests waiting for Kafka broker response by broker, client, client type and node",
+            labelnames=["app_name", "broker", "client", "client_type", "node"],
+            registry=registry,
+        )
+
+        self.librdkafka_topic_batch_size_bytes = cast(
+            Gauge,
+            self._get_registered_metric(
+                f"{metrics_prefix}_librdkafka_topic_batch_size_bytes"
+            ),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_topic_batch_size_bytes",
+            documentation="Gauge of average produced batch size in bytes by broker, client, client type and topic",
+            labelnames=["app_name", "broker", "client", "client_type", "topic"],
+            registry=registry,
+        )
+
+        self.librdkafka_topic_batch_messages = cast(
+            Gauge,
+            self._get_registered_metric(
+                f"{metrics_prefix}_librdkafka_topic_batch_messages"
+            ),
+        ) or Gauge(
+            name=f"{metrics_prefix}_librdkafka_topic_batch_messages",
+            documentation="Gauge of average produced batch messages count by broker, client, client type and topic",
+            labelnames=["app_name", "broker", "client", "client_type", "topic"],
+            registry=registry,
+        )
+
     def _get_registered_metric(self, metric_name: str) -> Union["Collector", None]:
         return self._registry._names_to_collectors.get(metric_name)
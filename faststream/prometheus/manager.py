@@ -1,6 +1,12 @@
+from contextlib import suppress
+from typing import TYPE_CHECKING, Optional
+
 from faststream.prometheus.container import MetricsContainer
 from faststream.prometheus.types import ProcessingStatus, PublishingStatus
 
+if TYPE_CHECKING:
+    from faststream.confluent.stats import ClientStats
+
 
 class MetricsManager:
     __slots__ = ("_app_name", "_container")
@@ -129,3 +135,113 @@ class MetricsManager:
             destination=destination,
             exception_type=exception_type,
         ).inc()
+
+    def observe_consumer_fetch(
+        self,
+        broker: str,
+        handler: str,
+        records: int,
+    ) -> None:
+        self._container.consumer_last_fetch_timestamp_seconds.labels(
+            app_name=self._app_name,
+            broker=broker,
+            handler=handler,
+        ).set_to_current_time()
+
+        # empty polls only prove the consumer is alive
+        if records:
+            self._container.consumer_fetched_records.labels(
+                app_name=self._app_name,
+                broker=broker,
+                handler=handler,
+            ).observe(records)
+
+    def set_consumer_lag(
+        self,
+        broker: str,
+        handler: str,
+        topic: str,
+        partition: int,
+        lag: int,
+    ) -> None:
+        self._container.consumer_lag.labels(
+            app_name=self._app_name,
+            broker=broker,
+            handler=handler,
+            topic=topic,
+            partition=str(partition),
+        ).set(lag)
+
+    def remove_consumer_lag(
+        self,
+        broker: str,
+        handler: str,
+        topic: str,
+        partition: int,
+    ) -> None:
+        # partition may be revoked before the first fetch from it
+        with suppress(KeyError):
+            self._container.consumer_lag.remove(
+                self._app_name,
+                broker,
+                handler,
+                topic,
+                str(partition),
+            )
+
+    def observe_consumer_rebalance(
+        self,
+        broker: str,
+        handler: str,
+        duration: Optional[float],
+    ) -> None:
+        self._container.consumer_rebalances_total.labels(
+            app_name=self._app_name,
+            broker=broker,
+            handler=handler,
+        ).inc()
+
+        if duration is not None:
+            self._container.consumer_rebalance_duration_seconds.labels(
+                app_name=self._app_name,
+                broker=broker,
+                handler=handler,
+            ).observe(duration)
+
+    def observe_client_stats(self, broker: str, stats: "ClientStats") -> None:
+        container = self._container
+        labels = {
+            "app_name": self._app_name,
+            "broker": broker,
+            "client": stats.name,
+            "client_type": stats.type,
+        }
+
+        container.librdkafka_queue_messages.labels(**labels).set(stats.queue_messages)
+        container.librdkafka_queue_bytes.labels(**labels).set(stats.queue_bytes)
+        container.librdkafka_reply_queue_ops.labels(**labels).set(stats.reply_queue_ops)
+        container.librdkafka_transmitted_messages.labels(**labels).set(
+            stats.transmitted_messages
+        )
+        container.librdkafka_received_messages.labels(**labels).set(
+            stats.received_messages
+        )
+
+        for node, broker_stats in stats.brokers.items():
+            container.librdkafka_broker_rtt_seconds.labels(**labels, node=node).set(
+                broker_stats.rtt_seconds
+            )
+            container.librdkafka_broker_outbuf_requests.labels(**labels, node=node).set(
+                broker_stats.outbuf_requests
+            )
+            container.librdkafka_broker_waitresp_requests.labels(
+                **labels, node=node
+            ).set(broker_stats.waitresp_requests)
+
+        for topic, topic_stats in stats.topics.items():
+            container.librdkafka_topic_batch_size_bytes.labels(
+                **labels, topic=topic
+            ).set(topic_stats.batch_size_bytes)
+            container.librdkafka_topic_batch_messages.labels(**labels, topic=topic).set(
+                topic_stats.batch_messages
+            )
@@ -197,6 +197,16 @@ class BasePrometheusMiddleware:
             app_name=app_name,
         )
 
+    @property
+    def consumer_metrics(self) -> MetricsManager:
+        """Recorder of consumer-level metrics used by subscribers."""
+        return self._metrics_manager
+
+    @property
+    def client_metrics(self) -> MetricsManager:
+        """Recorder of librdkafka statistics used by Confluent clients."""
+        return self._metrics_manager
+
     def __call__(self, msg: Optional[Any]) -> BaseMiddleware:
         return PrometheusMiddleware(
             msg=msg,
@@ -5,6 +5,7 @@ from typing import (
     Any,
     Callable,
     Iterable,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -31,7 +32,11 @@ from faststream.broker.message import gen_cor_id
 from faststream.exceptions import NOT_CONNECTED_YET
 from faststream.redis.broker.logging import RedisLoggingBroker
 from faststream.redis.broker.registrator import RedisRegistrator
+from faststream.redis.multiplexer import PubSubMultiplexer
+from faststream.redis.parser import JSONMessageFormat
+from faststream.redis.publisher.pipeline import AutoPipeline
 from faststream.redis.publisher.producer import RedisFastProducer
+from faststream.redis.publisher.reply import RepliesConsumer
 from faststream.redis.security import parse_security
 from faststream.types import EMPTY
 
@@ -48,6 +53,7 @@ if TYPE_CHECKING:
         CustomCallable,
     )
     from faststream.redis.message import BaseMessage, RedisMessage
+    from faststream.redis.parser import MessageFormat
     from faststream.security import BaseSecurity
     from faststream.types import (
         AnyDict,
@@ -115,6 +121,52 @@ class RedisBroker(
         decode_responses: bool = False,
         parser_class: Type["BaseParser"] = DefaultParser,
         encoder_class: Type["Encoder"] = Encoder,
+        message_format: Annotated[
+            Type["MessageFormat"],
+            Doc(
+                "Envelope to pack published messages. "
+                "Consumers detect the format of incoming messages automatically."
+            ),
+        ] = JSONMessageFormat,
+        native_stream_fields: Annotated[
+            bool,
+            Doc(
+                "Store published stream entries headers as separate fields and "
+                "the body as a raw field instead of a single `message_format` "
+                "envelope field, so any stream consumer can read them."
+            ),
+        ] = False,
+        reply_channel: Annotated[
+            Optional[str],
+            Doc(
+                "Channel to receive RPC replies from. A single subscription routes "
+                "replies to `request` calls by `correlation_id`. "
+                "Generated unique channel is used by default."
+            ),
+        ] = None,
+        auto_pipeline: Annotated[
+            bool,
+            Doc(
+                "Coalesce concurrent `publish` calls into a single non-transactional "
+                "pipeline round trip. Each call still gets its own result or error."
+            ),
+        ] = False,
+        auto_pipeline_linger: Annotated[
+            float,
+            Doc(
+                "Seconds to wait for more publish calls before sending the pipeline "
+                "if `auto_pipeline` is enabled. By default, calls made in the same "
+                "event loop iteration are coalesced."
+            ),
+        ] = 0.0,
+        pubsub_buffer_size: Annotated[
+            int,
+            Doc(
+                "Max not processed messages buffered per channel subscription "
+                "(including RPC replies). Next messages are dropped until the "
+                "subscriber takes them, as Redis does for slow PubSub clients."
+            ),
+        ] = 1000,
         # broker args
         graceful_timeout: Annotated[
             Optional[float],
@@ -197,6 +249,13 @@ class RedisBroker(
         ] = (),
     ) -> None:
         self._producer = None
+        self._pubsub: Optional[PubSubMultiplexer] = None
+        self.message_format = message_format
+        self.native_stream_fields = native_stream_fields
+        self._reply_channel = reply_channel or f"faststream-replies-{gen_cor_id()}"
+        self._auto_pipeline = auto_pipeline
+        self._auto_pipeline_linger = auto_pipeline_linger
+        self._pubsub_buffer_size = pubsub_buffer_size
 
         if asyncapi_url is None:
             asyncapi_url = url
@@ -329,10 +388,26 @@ class RedisBroker(
         )
 
         client: Redis[bytes] = Redis.from_pool(pool)  # type: ignore[attr-defined]
+        self._pubsub = PubSubMultiplexer(
+            client,
+            buffer_size=self._pubsub_buffer_size,
+            logger=self.logger,
+        )
         self._producer = RedisFastProducer(
             connection=client,
             parser=self._parser,
             decoder=self._decoder,
+            message_format=self.message_format,
+            native_stream_fields=self.native_stream_fields,
+            replies=RepliesConsumer(
+                channel=self._reply_channel,
+                pubsub=self._pubsub,
+            ),
+            pipeline=(
+                AutoPipeline(client, linger=self._auto_pipeline_linger)
+                if self._auto_pipeline
+                else None
+            ),
         )
         return client
 
@@ -342,6 +417,13 @@ class RedisBroker(
         exc_val: Optional[BaseException] = None,
         exc_tb: Optional["TracebackType"] = None,
     ) -> None:
+        if self._producer is not None:
+            await self._producer.stop()
+
+        if self._pubsub is not None:
+            await self._pubsub.close()
+            self._pubsub = None
+
         if self._connection is not None:
             await self._connection.aclose()  # type: ignore[attr-defined]
 
@@ -362,6 +444,7 @@ class RedisBroker(
         return {
             **super()._subscriber_setup_extra,
             "connection": self._connection,
+            "pubsub": self._pubsub,
         }
 
     @override
@@ -492,9 +575,20 @@ class RedisBroker(
             Doc("Messages bodies to send."),
         ],
         list: Annotated[
-            str,
+            Optional[str],
             Doc("Redis List object name to send messages."),
-        ],
+        ] = None,
+        stream: Annotated[
+            Optional[str],
+            Doc("Redis Stream object name to send messages."),
+        ] = None,
+        maxlen: Annotated[
+            Optional[int],
+            Doc(
+                "Redis Stream maxlen publish option. "
+                "Remove eldest message if maxlen exceeded."
+            ),
+        ] = None,
         correlation_id: Annotated[
             Optional[str],
             Doc(
@@ -502,8 +596,11 @@ class RedisBroker(
                 "**correlation_id** is a useful option to trace messages."
             ),
         ] = None,
-    ) -> None:
-        """Publish multiple messages to Redis List by one request."""
+    ) -> Optional[List[bytes]]:
+        """Publish multiple messages to Redis List or Stream by one request.
+
+        Stream messages are sent by pipelined `XADD` commands, created entries IDs are returned.
+        """
         assert self._producer, NOT_CONNECTED_YET  # nosec B101
 
         correlation_id = correlation_id or gen_cor_id()
@@ -513,11 +610,14 @@ class RedisBroker(
         for m in self._middlewares[::-1]:
             call = partial(m(None).publish_scope, call)
 
-        await call(
+        ids: Optional[List[bytes]] = await call(
             *msgs,
             list=list,
+            stream=stream,
+            maxlen=maxlen,
             correlation_id=correlation_id,
         )
+        return ids
 
     @override
     async def ping(self, timeout: Optional[float]) -> bool:
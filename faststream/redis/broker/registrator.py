@@ -76,6 +76,13 @@ class RedisRegistrator(ABCBroker[UnifyRedisDict]):
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc(
+                "Number of workers to process Stream messages concurrently. "
+                "Consumer group acknowledgements are sent in batches."
+            ),
+        ] = 1,
         retry: Annotated[
             bool,
             Doc("Whether to `nack` message at processing exception."),
@@ -118,6 +125,7 @@ class RedisRegistrator(ABCBroker[UnifyRedisDict]):
                     no_ack=no_ack,
                     no_reply=no_reply,
                     retry=retry,
+                    max_workers=max_workers,
                     broker_middlewares=self._middlewares,
                     broker_dependencies=self._dependencies,
                     # AsyncAPI
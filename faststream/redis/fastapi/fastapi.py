@@ -31,6 +31,7 @@ from faststream.broker.fastapi.router import StreamRouter
 from faststream.broker.utils import default_filter
 from faststream.redis.broker.broker import RedisBroker as RB
 from faststream.redis.message import UnifyRedisDict
+from faststream.redis.parser import JSONMessageFormat
 from faststream.redis.publisher.asyncapi import AsyncAPIPublisher
 from faststream.redis.schemas import ListSub, PubSub, StreamSub
 from faststream.redis.subscriber.asyncapi import AsyncAPISubscriber
@@ -54,6 +55,7 @@ if TYPE_CHECKING:
         SubscriberMiddleware,
     )
     from faststream.redis.message import UnifyRedisMessage
+    from faststream.redis.parser import MessageFormat
     from faststream.security import BaseSecurity
     from faststream.types import AnyDict, LoggerProto
 
@@ -87,6 +89,52 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
         decode_responses: bool = False,
         parser_class: Type["BaseParser"] = DefaultParser,
         encoder_class: Type["Encoder"] = Encoder,
+        message_format: Annotated[
+            Type["MessageFormat"],
+            Doc(
+                "Envelope to pack published messages. "
+                "Consumers detect the format of incoming messages automatically."
+            ),
+        ] = JSONMessageFormat,
+        native_stream_fields: Annotated[
+            bool,
+            Doc(
+                "Store published stream entries headers as separate fields and "
+                "the body as a raw field instead of a single `message_format` "
+                "envelope field, so any stream consumer can read them."
+            ),
+        ] = False,
+        reply_channel: Annotated[
+            Optional[str],
+            Doc(
+                "Channel to receive RPC replies from. A single subscription routes "
+                "replies to `request` calls by `correlation_id`. "
+                "Generated unique channel is used by default."
+            ),
+        ] = None,
+        auto_pipeline: Annotated[
+            bool,
+            Doc(
+                "Coalesce concurrent `publish` calls into a single non-transactional "
+                "pipeline round trip. Each call still gets its own result or error."
+            ),
+        ] = False,
+        auto_pipeline_linger: Annotated[
+            float,
+            Doc(
+                "Seconds to wait for more publish calls before sending the pipeline "
+                "if `auto_pipeline` is enabled. By default, calls made in the same "
+                "event loop iteration are coalesced."
+            ),
+        ] = 0.0,
+        pubsub_buffer_size: Annotated[
+            int,
+            Doc(
+                "Max not processed messages buffered per channel subscription "
+                "(including RPC replies). Next messages are dropped until the "
+                "subscriber takes them, as Redis does for slow PubSub clients."
+            ),
+        ] = 1000,
         # broker base args
         graceful_timeout: Annotated[
             Optional[float],
@@ -393,6 +441,12 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
             parser_class=parser_class,
             connection_class=connection_class,
             encoder_class=encoder_class,
+            message_format=message_format,
+            native_stream_fields=native_stream_fields,
+            reply_channel=reply_channel,
+            auto_pipeline=auto_pipeline,
+            auto_pipeline_linger=auto_pipeline_linger,
+            pubsub_buffer_size=pubsub_buffer_size,
             graceful_timeout=graceful_timeout,
             decoder=decoder,
             parser=parser,
@@ -478,6 +532,13 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc(
+                "Number of workers to process Stream messages concurrently. "
+                "Consumer group acknowledgements are sent in batches."
+            ),
+        ] = 1,
         retry: Annotated[
             bool,
             Doc("Whether to `nack` message at processing exception."),
@@ -644,6 +705,7 @@ class RedisRouter(StreamRouter[UnifyRedisDict]):
                 middlewares=middlewares,
                 filter=filter,
                 retry=retry,
+                max_workers=max_workers,
                 no_ack=no_ack,
                 no_reply=no_reply,
                 title=title,
@@ -15,6 +15,7 @@ from faststream.broker.message import StreamMessage as BrokerStreamMessage
 if TYPE_CHECKING:
     from redis.asyncio import Redis
 
+    from faststream.redis.subscriber.ack import StreamAckBatcher
     from faststream.types import DecodedMessage
 
 
@@ -98,6 +99,9 @@ class RedisBatchListMessage(BrokerStreamMessage[BatchListMessage]):
 DATA_KEY = "__data__"
 bDATA_KEY = DATA_KEY.encode()  # noqa: N816
 
+JSON_HEADERS_KEY = "__json_headers__"
+bJSON_HEADERS_KEY = JSON_HEADERS_KEY.encode()  # noqa: N816
+
 
 class StreamMessage(TypedDict):
     channel: str
@@ -123,11 +127,10 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
         self,
         redis: Optional["Redis[bytes]"] = None,
         group: Optional[str] = None,
+        acks: Optional["StreamAckBatcher"] = None,
+        claim_pending: bool = False,
     ) -> None:
-        if not self.committed and group is not None and redis is not None:
-            ids = self.raw_message["message_ids"]
-            channel = self.raw_message["channel"]
-            await redis.xack(channel, group, *ids)  # type: ignore[no-untyped-call]
+        await self._xack(redis, group, acks)
         await super().ack()
 
     @override
@@ -135,6 +138,8 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
         self,
         redis: Optional["Redis[bytes]"] = None,
         group: Optional[str] = None,
+        acks: Optional["StreamAckBatcher"] = None,
+        claim_pending: bool = False,
     ) -> None:
         await super().nack()
 
@@ -143,9 +148,33 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
         self,
         redis: Optional["Redis[bytes]"] = None,
         group: Optional[str] = None,
+        acks: Optional["StreamAckBatcher"] = None,
+        claim_pending: bool = False,
     ) -> None:
+        # rejected entry should not be claimed from the group PEL again,
+        # without claiming it stays pending as before
+        if claim_pending:
+            await self._xack(redis, group, acks)
         await super().reject()
 
+    async def _xack(
+        self,
+        redis: Optional["Redis[bytes]"],
+        group: Optional[str],
+        acks: Optional["StreamAckBatcher"],
+    ) -> None:
+        if self.committed or group is None:
+            return
+
+        ids = self.raw_message["message_ids"]
+
+        if acks is not None:
+            acks.add(ids)
+
+        elif redis is not None:
+            channel = self.raw_message["channel"]
+            await redis.xack(channel, group, *ids)  # type: ignore[no-untyped-call]
+
 
 class RedisStreamMessage(_RedisStreamMessageMixin[DefaultStreamMessage]):
     pass
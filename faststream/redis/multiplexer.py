@@ -0,0 +1,189 @@
+import asyncio
+import logging
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import anyio
+from redis.exceptions import ConnectionError, TimeoutError
+
+from faststream.redis.message import PubSubMessage
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import PubSub, Redis
+
+    from faststream.types import LoggerProto
+
+
+class PubSubMultiplexer:
+    """Serves all broker channel subscriptions by a single PubSub connection.
+
+    Every `subscribe` call returns an in-memory queue. A single reader task
+    blocks on the connection by `PubSub.listen` and dispatches incoming
+    messages to queues of the message channel (`message`) or of the matched
+    pattern (`pmessage`) in subscription order as soon as they arrive.
+
+    The reader never waits for a subscription: messages for a queue holding
+    `buffer_size` not taken messages are dropped, as PubSub does for
+    disconnected clients, so a slow subscriber can't delay other channels
+    (including RPC replies). Dropped messages are counted by `dropped` and
+    logged when the overflow starts and ends.
+    """
+
+    def __init__(
+        self,
+        connection: "Redis[bytes]",
+        *,
+        buffer_size: int = 1000,
+        logger: Optional["LoggerProto"] = None,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.dropped = 0
+
+        self._connection = connection
+        self._logger = logger
+        # dropped messages count of the current queue overflow
+        self._overflowed: Dict[asyncio.Queue[PubSubMessage], int] = {}
+        self._pubsub: Optional[PubSub] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+        self._channels: Dict[bytes, List[asyncio.Queue[PubSubMessage]]] = {}
+        self._patterns: Dict[bytes, List[asyncio.Queue[PubSubMessage]]] = {}
+
+    async def subscribe(
+        self,
+        channel: str,
+        *,
+        pattern: bool = False,
+        buffer_size: Optional[int] = None,
+    ) -> "asyncio.Queue[PubSubMessage]":
+        """Subscribe to the channel (pattern) and return its messages queue."""
+        if self._pubsub is None:
+            self._pubsub = self._connection.pubsub(ignore_subscribe_messages=True)
+
+        queue: asyncio.Queue[PubSubMessage] = asyncio.Queue(
+            self.buffer_size if buffer_size is None else buffer_size
+        )
+
+        subscriptions = self._patterns if pattern else self._channels
+        queues = subscriptions.setdefault(channel.encode(), [])
+        queues.append(queue)
+
+        if len(queues) == 1:
+            if pattern:
+                await self._pubsub.psubscribe(channel)
+            else:
+                await self._pubsub.subscribe(channel)
+
+        if self._task is None or self._task.done():
+            # reader stops by itself after the last channel unsubscription
+            self._task = asyncio.create_task(self._read(self._pubsub))
+
+        return queue
+
+    async def unsubscribe(
+        self,
+        channel: str,
+        queue: "asyncio.Queue[PubSubMessage]",
+        *,
+        pattern: bool = False,
+    ) -> None:
+        subscriptions = self._patterns if pattern else self._channels
+        key = channel.encode()
+
+        queues = subscriptions.get(key, [])
+        if queue in queues:
+            queues.remove(queue)
+        self._overflowed.pop(queue, None)
+
+        if (
+            not queues
+            and subscriptions.pop(key, None) is not None
+            and self._pubsub is not None
+        ):
+            with suppress(Exception):
+                if pattern:
+                    await self._pubsub.punsubscribe(channel)
+                else:
+                    await self._pubsub.unsubscribe(channel)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._pubsub is not None:
+            await self._pubsub.aclose()  # type: ignore[attr-defined]
+            self._pubsub = None
+
+        self._channels = {}
+        self._patterns = {}
+        self._overflowed = {}
+
+    async def _read(self, psub: "PubSub") -> None:
+        while psub.subscribed:
+            try:
+                message: Any
+                async for message in psub.listen():
+                    self._dispatch(message)
+
+            except TimeoutError:  # noqa: PERF203
+                # `socket_timeout` passed without messages
+                continue
+
+            except ConnectionError:
+                await anyio.sleep(1)
+
+            except Exception as e:
+                # the reader serves all subscriptions, so it never stops by error
+                if self._logger is not None:
+                    self._logger.log(
+                        logging.ERROR,
+                        "PubSub reader failed, restarting",
+                        exc_info=e,
+                    )
+                await anyio.sleep(1)
+
+    def _dispatch(self, message: "Dict[str, Any]") -> None:
+        if message["type"] == "pmessage":
+            queues = self._patterns.get(message["pattern"], ())
+        else:
+            queues = self._channels.get(message["channel"], ())
+
+        msg = PubSubMessage(
+            type=message["type"],
+            data=message["data"],
+            channel=message["channel"].decode(),
+            pattern=message["pattern"],
+        )
+
+        for queue in tuple(queues):
+            try:
+                queue.put_nowait(msg)
+
+            except asyncio.QueueFull:  # noqa: PERF203
+                self.dropped += 1
+
+                # log once per overflow, not per dropped message
+                if queue not in self._overflowed:
+                    self._overflowed[queue] = 0
+
+                    if self._logger is not None:
+                        self._logger.log(
+                            logging.WARNING,
+                            f"`{msg['channel']}` subscriber buffer is full "
+                            f"({queue.maxsize} messages), dropping messages",
+                        )
+
+                self._overflowed[queue] += 1
+
+            else:
+                if (
+                    dropped := self._overflowed.pop(queue, None)
+                ) is not None and self._logger is not None:
+                    self._logger.log(
+                        logging.WARNING,
+                        f"`{msg['channel']}` subscriber buffer overflow is over, "
+                        f"{dropped} messages were dropped",
+                    )
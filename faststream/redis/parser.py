@@ -1,3 +1,6 @@
+import struct
+from abc import ABC, abstractmethod
+from contextlib import suppress
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -18,13 +21,17 @@ from faststream.broker.message import (
     gen_cor_id,
 )
 from faststream.constants import ContentTypes
+from faststream.exceptions import SetupError
 from faststream.redis.message import (
+    DATA_KEY,
+    JSON_HEADERS_KEY,
     RedisBatchListMessage,
     RedisBatchStreamMessage,
     RedisListMessage,
     RedisMessage,
     RedisStreamMessage,
     bDATA_KEY,
+    bJSON_HEADERS_KEY,
 )
 from faststream.types import AnyDict, DecodedMessage, SendableMessage
 
@@ -37,6 +44,78 @@ if TYPE_CHECKING:
 MsgType = TypeVar("MsgType", bound=Mapping[str, Any])
 
 
+class MessageFormat(ABC):
+    """Envelope packing message body and headers to a single Redis value."""
+
+    @classmethod
+    @abstractmethod
+    def encode(cls, data: bytes, headers: "AnyDict") -> bytes:
+        raise NotImplementedError()
+
+    @classmethod
+    @abstractmethod
+    def parse(cls, data: bytes) -> Tuple[bytes, "AnyDict"]:
+        raise NotImplementedError()
+
+
+class JSONMessageFormat(MessageFormat):
+    """`{"data": ..., "headers": ...}` JSON envelope.
+
+    Body is stored as a JSON string, so it should be UTF-8 decodable.
+    """
+
+    @classmethod
+    def encode(cls, data: bytes, headers: "AnyDict") -> bytes:
+        return dump_json(
+            {
+                "data": data,
+                "headers": headers,
+            }
+        )
+
+    @classmethod
+    def parse(cls, data: bytes) -> Tuple[bytes, "AnyDict"]:
+        parsed_data = json_loads(data)
+        return parsed_data["data"].encode(), parsed_data["headers"]
+
+
+class BinaryMessageFormatV1(MessageFormat):
+    """Binary envelope keeping the body as is.
+
+    Layout: identity bytes, format version, headers block size (uint32 BE),
+    JSON headers block and raw body bytes.
+    """
+
+    IDENTITY_HEADER = b"\x89FST"
+    VERSION = 1
+
+    _prefix = struct.Struct(">4sBI")
+
+    @classmethod
+    def encode(cls, data: bytes, headers: "AnyDict") -> bytes:
+        headers_block = dump_json(headers)
+        return b"".join(
+            (
+                cls._prefix.pack(cls.IDENTITY_HEADER, cls.VERSION, len(headers_block)),
+                headers_block,
+                data,
+            )
+        )
+
+    @classmethod
+    def parse(cls, data: bytes) -> Tuple[bytes, "AnyDict"]:
+        identity, version, headers_size = cls._prefix.unpack_from(data)
+
+        if identity != cls.IDENTITY_HEADER or version != cls.VERSION:
+            raise ValueError(f"Unsupported message format version: {version}")
+
+        body_start = cls._prefix.size + headers_size
+        return (
+            data[body_start:],
+            json_loads(data[cls._prefix.size : body_start]),
+        )
+
+
 class RawMessage:
     """A class to represent a raw Redis message."""
 
@@ -90,6 +169,7 @@ class RawMessage:
         reply_to: Optional[str],
         headers: Optional["AnyDict"],
         correlation_id: str,
+        message_format: Type[MessageFormat] = JSONMessageFormat,
     ) -> bytes:
         msg = cls.build(
             message=message,
@@ -98,29 +178,68 @@ class RawMessage:
             correlation_id=correlation_id,
         )
 
-        return dump_json(
-            {
-                "data": msg.data,
-                "headers": msg.headers,
-            }
+        return message_format.encode(msg.data, msg.headers)
+
+    @classmethod
+    def encode_stream_fields(
+        cls,
+        *,
+        message: Union[Sequence["SendableMessage"], "SendableMessage"],
+        reply_to: Optional[str],
+        headers: Optional["AnyDict"],
+        correlation_id: str,
+    ) -> "AnyDict":
+        """Build stream entry fields: headers as separate fields and the raw body.
+
+        Redis stores field values as strings, so non-str/bytes headers are dumped
+        to JSON and their names are listed in the `__json_headers__` field.
+        """
+        msg = cls.build(
+            message=message,
+            reply_to=reply_to,
+            headers=headers,
+            correlation_id=correlation_id,
         )
 
+        if DATA_KEY in msg.headers or JSON_HEADERS_KEY in msg.headers:
+            raise SetupError(
+                f"`{DATA_KEY}` and `{JSON_HEADERS_KEY}` headers names are reserved by native stream fields."
+            )
+
+        fields: AnyDict = {}
+        json_headers: List[str] = []
+        for k, v in msg.headers.items():
+            if isinstance(v, (str, bytes)):
+                fields[k] = v
+            else:
+                fields[k] = dump_json(v)
+                json_headers.append(k)
+
+        if json_headers:
+            fields[JSON_HEADERS_KEY] = dump_json(json_headers)
+
+        fields[DATA_KEY] = msg.data
+        return fields
+
     @staticmethod
     def parse(data: bytes) -> Tuple[bytes, "AnyDict"]:
-        headers: AnyDict
+        """Detect the message format and unpack it.
+
+        Messages without FastStream envelope are returned as is.
+        """
+        message_format: Type[MessageFormat] = (
+            BinaryMessageFormatV1
+            if isinstance(data, bytes)
+            and data.startswith(BinaryMessageFormatV1.IDENTITY_HEADER)
+            else JSONMessageFormat
+        )
 
         try:
-            # FastStream message format
-            parsed_data = json_loads(data)
-            data = parsed_data["data"].encode()
-            headers = parsed_data["headers"]
+            return message_format.parse(data)
 
         except Exception:
             # Raw Redis message format
-            data = data
-            headers = {}
-
-        return data, headers
+            return data, {}
 
 
 class SimpleParser:
@@ -218,8 +337,7 @@ class RedisStreamParser(SimpleParser):
     def _parse_data(
         cls, message: Mapping[str, Any]
     ) -> Tuple[bytes, "AnyDict", List["AnyDict"]]:
-        data = message["data"]
-        return (*RawMessage.parse(data.get(bDATA_KEY) or dump_json(data)), [])
+        return (*_parse_stream_fields(message["data"]), [])
 
 
 class RedisBatchStreamParser(SimpleParser):
@@ -233,7 +351,10 @@ class RedisBatchStreamParser(SimpleParser):
         batch_headers: List[AnyDict] = []
 
         for x in message["data"]:
-            msg_data, msg_headers = _decode_batch_body_item(x.get(bDATA_KEY, x))
+            if bDATA_KEY in x:
+                msg_data, msg_headers = _load_batch_body(*_parse_stream_fields(x))
+            else:
+                msg_data, msg_headers = _decode_batch_body_item(x)
             body.append(msg_data)
             batch_headers.append(msg_headers)
 
@@ -249,8 +370,39 @@ class RedisBatchStreamParser(SimpleParser):
         )
 
 
+def _parse_stream_fields(fields: Mapping[bytes, Any]) -> Tuple[bytes, "AnyDict"]:
+    if (data := fields.get(bDATA_KEY)) is None:
+        # not FastStream stream entry
+        return RawMessage.parse(dump_json(fields))
+
+    if len(fields) > 1:
+        # native fields layout: headers are stored as separate fields,
+        # entries written by other producers may contain any bytes
+        headers = {
+            k.decode(errors="replace"): v.decode(errors="replace")
+            for k, v in fields.items()
+            if k not in {bDATA_KEY, bJSON_HEADERS_KEY}
+        }
+
+        json_headers: Any = ()
+        with suppress(ValueError):
+            json_headers = json_loads(fields.get(bJSON_HEADERS_KEY, b"[]"))
+
+        for k in json_headers if isinstance(json_headers, list) else ():
+            if k in headers:
+                with suppress(ValueError):
+                    headers[k] = json_loads(headers[k])
+
+        return data, headers
+
+    return RawMessage.parse(data)
+
+
 def _decode_batch_body_item(msg_content: bytes) -> Tuple[Any, "AnyDict"]:
-    msg_body, headers = RawMessage.parse(msg_content)
+    return _load_batch_body(*RawMessage.parse(msg_content))
+
+
+def _load_batch_body(msg_body: bytes, headers: "AnyDict") -> Tuple[Any, "AnyDict"]:
     try:
         return json_loads(msg_body), headers
     except Exception:
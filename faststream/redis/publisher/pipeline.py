@@ -0,0 +1,114 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import Redis
+
+    from faststream.types import AnyDict
+
+    PipelineCommand = Tuple[str, Tuple[Any, ...], AnyDict, asyncio.Future[Any]]
+
+
+class AutoPipeline:
+    """Coalesces concurrent commands into non-transactional pipelines.
+
+    Commands called in the same event loop iteration (or during `linger`
+    seconds after the first one) are sent by a single pipeline round trip.
+    Each caller gets its own command result or error.
+    """
+
+    def __init__(
+        self,
+        connection: "Redis[bytes]",
+        *,
+        linger: float = 0.0,
+        max_commands: int = 1000,
+    ) -> None:
+        self._connection = connection
+        self.linger = linger
+        self.max_commands = max_commands
+
+        self._commands: List[PipelineCommand] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    async def publish(self, channel: str, message: bytes) -> int:
+        return await self._call("publish", channel, message)  # type: ignore[no-any-return]
+
+    async def rpush(self, name: str, *values: bytes) -> int:
+        return await self._call("rpush", name, *values)  # type: ignore[no-any-return]
+
+    async def xadd(
+        self,
+        name: str,
+        fields: "AnyDict",
+        maxlen: Optional[int] = None,
+    ) -> bytes:
+        return await self._call("xadd", name=name, fields=fields, maxlen=maxlen)  # type: ignore[no-any-return]
+
+    async def _call(self, command: str, *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+
+        self._commands.append((command, args, kwargs, future))
+
+        if len(self._commands) >= self.max_commands:
+            self._flush()
+
+        elif self._flush_handle is None:
+            self._flush_handle = (
+                loop.call_later(self.linger, self._flush)
+                if self.linger > 0
+                else loop.call_soon(self._flush)
+            )
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        commands, self._commands = self._commands, []
+
+        if commands:
+            task = asyncio.create_task(self._execute(commands))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(self, commands: List["PipelineCommand"]) -> None:
+        pipe = self._connection.pipeline(transaction=False)
+        for command, args, kwargs, _ in commands:
+            getattr(pipe, command)(*args, **kwargs)
+
+        try:
+            results = await pipe.execute(raise_on_error=False)
+
+        except Exception as e:
+            for *_, future in commands:
+                if not future.done():
+                    future.set_exception(e)
+
+        else:
+            for (*_, future), result in zip(commands, results):
+                if future.done():  # cancelled by caller
+                    continue
+
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def close(self) -> None:
+        """Send pending commands and wait for all pipelines completion."""
+        self._flush()
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
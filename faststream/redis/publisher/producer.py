@@ -1,19 +1,27 @@
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Type, Union
 
 import anyio
 from typing_extensions import override
 
+from faststream.broker.message import gen_cor_id
 from faststream.broker.publisher.proto import ProducerProto
 from faststream.broker.utils import resolve_custom_func
 from faststream.exceptions import WRONG_PUBLISH_ARGS, SetupError
 from faststream.redis.message import DATA_KEY
-from faststream.redis.parser import RawMessage, RedisPubSubParser
+from faststream.redis.multiplexer import PubSubMultiplexer
+from faststream.redis.parser import (
+    JSONMessageFormat,
+    MessageFormat,
+    RawMessage,
+    RedisPubSubParser,
+)
+from faststream.redis.publisher.pipeline import AutoPipeline
+from faststream.redis.publisher.reply import RepliesConsumer
 from faststream.redis.schemas import INCORRECT_SETUP_MSG
 from faststream.utils.functions import timeout_scope
-from faststream.utils.nuid import NUID
 
 if TYPE_CHECKING:
-    from redis.asyncio.client import PubSub, Redis
+    from redis.asyncio.client import Redis
 
     from faststream.broker.types import (
         AsyncCallable,
@@ -34,8 +42,26 @@ class RedisFastProducer(ProducerProto):
         connection: "Redis[bytes]",
         parser: Optional["CustomCallable"],
         decoder: Optional["CustomCallable"],
+        message_format: Type[MessageFormat] = JSONMessageFormat,
+        native_stream_fields: bool = False,
+        replies: Optional[RepliesConsumer] = None,
+        pipeline: Optional[AutoPipeline] = None,
     ) -> None:
         self._connection = connection
+        self._pipeline = pipeline
+
+        # PubSub connection owned by the producer if replies are not shared
+        self._pubsub: Optional[PubSubMultiplexer] = None
+        if replies is None:
+            self._pubsub = PubSubMultiplexer(connection)
+            replies = RepliesConsumer(
+                channel=f"faststream-replies-{gen_cor_id()}",
+                pubsub=self._pubsub,
+            )
+        self._replies = replies
+
+        self.message_format = message_format
+        self.native_stream_fields = native_stream_fields
 
         default = RedisPubSubParser()
         self._parser = resolve_custom_func(
@@ -47,6 +73,15 @@ class RedisFastProducer(ProducerProto):
             default.decode_message,
         )
 
+    async def stop(self) -> None:
+        await self._replies.stop()
+
+        if self._pubsub is not None:
+            await self._pubsub.close()
+
+        if self._pipeline is not None:
+            await self._pipeline.close()
+
     @override
     async def publish(  # type: ignore[override]
         self,
@@ -66,64 +101,47 @@ class RedisFastProducer(ProducerProto):
         if not any((channel, list, stream)):
             raise SetupError(INCORRECT_SETUP_MSG)
 
-        psub: Optional[PubSub] = None
-        if rpc:
-            if reply_to:
-                raise WRONG_PUBLISH_ARGS
-            nuid = NUID()
-            rpc_nuid = str(nuid.next(), "utf-8")
-            reply_to = rpc_nuid
-            psub = self._connection.pubsub()
-            await psub.subscribe(reply_to)
-
-        msg = RawMessage.encode(
-            message=message,
-            reply_to=reply_to,
-            headers=headers,
-            correlation_id=correlation_id,
-        )
-
-        if channel is not None:
-            await self._connection.publish(channel, msg)
-        elif list is not None:
-            await self._connection.rpush(list, msg)
-        elif stream is not None:
-            await self._connection.xadd(
-                name=stream,
-                fields={DATA_KEY: msg},
+        if not rpc:
+            await self._send(
+                message,
+                channel=channel,
+                list=list,
+                stream=stream,
                 maxlen=maxlen,
+                headers=headers,
+                reply_to=reply_to,
+                correlation_id=correlation_id,
             )
-        else:
-            raise AssertionError("unreachable")
-
-        if psub is None:
             return None
 
-        else:
-            m = None
-            with timeout_scope(rpc_timeout, raise_timeout):
-                # skip subscribe message
-                await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=rpc_timeout or 0.0,
-                )
+        if reply_to:
+            raise WRONG_PUBLISH_ARGS
 
-                # get real response
-                m = await psub.get_message(
-                    ignore_subscribe_messages=True,
-                    timeout=rpc_timeout or 0.0,
-                )
+        await self._replies.start()
 
-            await psub.unsubscribe()
-            await psub.aclose()  # type: ignore[attr-defined]
+        m = None
+        with self._replies.wait(correlation_id) as response:
+            await self._send(
+                message,
+                channel=channel,
+                list=list,
+                stream=stream,
+                maxlen=maxlen,
+                headers=headers,
+                reply_to=self._replies.channel,
+                correlation_id=correlation_id,
+            )
+
+            with timeout_scope(rpc_timeout, raise_timeout):
+                m = await response
 
-            if m is None:
-                if raise_timeout:
-                    raise TimeoutError()
-                else:
-                    return None
+        if m is None:
+            if raise_timeout:
+                raise TimeoutError()
             else:
-                return await self._decoder(await self._parser(m))
+                return None
+        else:
+            return await self._decoder(await self._parser(m))
 
     @override
     async def request(  # type: ignore[override]
@@ -141,66 +159,136 @@ class RedisFastProducer(ProducerProto):
         if not any((channel, list, stream)):
             raise SetupError(INCORRECT_SETUP_MSG)
 
-        nuid = NUID()
-        reply_to = str(nuid.next(), "utf-8")
-        psub = self._connection.pubsub()
-        await psub.subscribe(reply_to)
+        await self._replies.start()
+
+        with self._replies.wait(correlation_id) as response:
+            await self._send(
+                message,
+                channel=channel,
+                list=list,
+                stream=stream,
+                maxlen=maxlen,
+                headers=headers,
+                reply_to=self._replies.channel,
+                correlation_id=correlation_id,
+            )
+
+            with anyio.fail_after(timeout):
+                return await response
+
+    async def _send(
+        self,
+        message: "SendableMessage",
+        *,
+        channel: Optional[str],
+        list: Optional[str],
+        stream: Optional[str],
+        maxlen: Optional[int],
+        headers: Optional["AnyDict"],
+        reply_to: str,
+        correlation_id: str,
+    ) -> None:
+        connection: Union[Redis[bytes], AutoPipeline] = (
+            self._pipeline or self._connection
+        )
+
+        if stream is not None:
+            await connection.xadd(
+                name=stream,
+                fields=self._stream_fields(
+                    message,
+                    reply_to=reply_to,
+                    headers=headers,
+                    correlation_id=correlation_id,
+                ),
+                maxlen=maxlen,
+            )
+            return
 
         msg = RawMessage.encode(
             message=message,
             reply_to=reply_to,
             headers=headers,
             correlation_id=correlation_id,
+            message_format=self.message_format,
         )
 
         if channel is not None:
-            await self._connection.publish(channel, msg)
+            await connection.publish(channel, msg)
         elif list is not None:
-            await self._connection.rpush(list, msg)
-        elif stream is not None:
-            await self._connection.xadd(
-                name=stream,
-                fields={DATA_KEY: msg},
-                maxlen=maxlen,
-            )
+            await connection.rpush(list, msg)
         else:
             raise AssertionError("unreachable")
 
-        with anyio.fail_after(timeout) as scope:
-            # skip subscribe message
-            await psub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=timeout or 0.0,
+    def _stream_fields(
+        self,
+        message: "SendableMessage",
+        *,
+        reply_to: Optional[str],
+        headers: Optional["AnyDict"],
+        correlation_id: str,
+    ) -> "AnyDict":
+        if self.native_stream_fields:
+            return RawMessage.encode_stream_fields(
+                message=message,
+                reply_to=reply_to,
+                headers=headers,
+                correlation_id=correlation_id,
             )
 
-            # get real response
-            response_msg = await psub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=timeout or 0.0,
+        return {
+            DATA_KEY: RawMessage.encode(
+                message=message,
+                reply_to=reply_to,
+                headers=headers,
+                correlation_id=correlation_id,
+                message_format=self.message_format,
             )
-
-        await psub.unsubscribe()
-        await psub.aclose()  # type: ignore[attr-defined]
-
-        if scope.cancel_called:
-            raise TimeoutError
-
-        return response_msg
+        }
 
     async def publish_batch(
         self,
         *msgs: "SendableMessage",
-        list: str,
         correlation_id: str,
+        list: Optional[str] = None,
+        stream: Optional[str] = None,
+        maxlen: Optional[int] = None,
         headers: Optional["AnyDict"] = None,
-    ) -> None:
+    ) -> Optional[List[bytes]]:
+        """Send messages to List by one `RPUSH` or to Stream by pipelined `XADD`s.
+
+        Returns created Stream entries IDs.
+        """
+        if stream is not None:
+            pipe = self._connection.pipeline(transaction=False)
+
+            for msg in msgs:
+                pipe.xadd(
+                    name=stream,
+                    fields=self._stream_fields(
+                        msg,
+                        reply_to=None,
+                        headers=headers,
+                        correlation_id=correlation_id,
+                    ),
+                    maxlen=maxlen,
+                )
+
+            ids: List[bytes] = await pipe.execute()
+            return ids
+
+        if list is None:
+            raise SetupError(INCORRECT_SETUP_MSG)
+
         batch = (
             RawMessage.encode(
                 message=msg,
                 correlation_id=correlation_id,
                 reply_to=None,
                 headers=headers,
+                message_format=self.message_format,
             )
             for msg in msgs
         )
         await self._connection.rpush(list, *batch)
+        return None
@@ -0,0 +1,97 @@
+import asyncio
+from contextlib import contextmanager, suppress
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    Optional,
+)
+
+from faststream.redis.parser import RawMessage
+
+if TYPE_CHECKING:
+    from faststream.redis.message import PubSubMessage
+    from faststream.redis.multiplexer import PubSubMultiplexer
+
+
+class RepliesConsumer:
+    """Routes RPC replies to waiting requests by `correlation_id`.
+
+    A single long-lived subscription to the per-process reply channel serves
+    all concurrent requests of the broker. The subscription is made through the
+    broker shared PubSub connection. Replies without a waiting request
+    (e.g. arrived after timeout) are dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        channel: str,
+        pubsub: "PubSubMultiplexer",
+    ) -> None:
+        self.channel = channel
+
+        self._pubsub = pubsub
+
+        self._subscription: Optional[asyncio.Queue[PubSubMessage]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._futures: Dict[str, asyncio.Future[PubSubMessage]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._subscription is not None
+
+    async def start(self) -> None:
+        """Subscribe to the reply channel if it is not subscribed yet."""
+        async with self._lock:
+            if self._subscription is not None:
+                return
+
+            queue = await self._pubsub.subscribe(self.channel)
+
+            self._subscription = queue
+            self._task = asyncio.create_task(self._consume(queue))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._subscription is not None:
+            await self._pubsub.unsubscribe(self.channel, self._subscription)
+            self._subscription = None
+
+        for future in self._futures.values():
+            future.cancel()
+        self._futures = {}
+
+    @contextmanager
+    def wait(self, correlation_id: str) -> Iterator["asyncio.Future[PubSubMessage]"]:
+        """Register a reply future and drop it on exit even if it is not resolved."""
+        future: asyncio.Future[PubSubMessage] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._futures[correlation_id] = future
+
+        try:
+            yield future
+        finally:
+            if self._futures.get(correlation_id) is future:
+                del self._futures[correlation_id]
+
+    def resolve(self, message: "PubSubMessage") -> None:
+        _, headers = RawMessage.parse(message["data"])
+
+        if (
+            (correlation_id := headers.get("correlation_id")) is not None
+            and (future := self._futures.pop(correlation_id, None)) is not None
+            and not future.done()
+        ):
+            future.set_result(message)
+
+    async def _consume(self, queue: "asyncio.Queue[PubSubMessage]") -> None:
+        while True:
+            self.resolve(await queue.get())
@@ -3,7 +3,16 @@ from contextlib import AsyncExitStack
 from copy import deepcopy
 from functools import partial
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
 
 from typing_extensions import Annotated, Doc, deprecated, override
 
@@ -768,3 +777,68 @@ class StreamPublisher(LogicPublisher):
             return await return_msg(parsed_msg)
 
         raise AssertionError("unreachable")
+
+
+class StreamBatchPublisher(StreamPublisher):
+    @override
+    async def publish(  # type: ignore[override]
+        self,
+        message: Annotated[
+            Iterable["SendableMessage"],
+            Doc("Messages bodies to send."),
+        ] = (),
+        stream: Annotated[
+            Optional[str],
+            Doc("Redis Stream object name to send messages."),
+        ] = None,
+        *,
+        correlation_id: Annotated[
+            Optional[str],
+            Doc(
+                "Manual message **correlation_id** setter. "
+                "**correlation_id** is a useful option to trace messages."
+            ),
+        ] = None,
+        headers: Annotated[
+            Optional["AnyDict"],
+            Doc("Message headers to store metainformation."),
+        ] = None,
+        maxlen: Annotated[
+            Optional[int],
+            Doc(
+                "Redis Stream maxlen publish option. "
+                "Remove eldest message if maxlen exceeded."
+            ),
+        ] = None,
+        # publisher specific
+        _extra_middlewares: Annotated[
+            Iterable["PublisherMiddleware"],
+            Doc("Extra middlewares to wrap publishing process."),
+        ] = (),
+        **kwargs: Any,  # option to suppress reply_to
+    ) -> List[bytes]:
+        """Send messages by pipelined `XADD` commands and return created entries IDs."""
+        assert self._producer, NOT_CONNECTED_YET  # nosec B101
+
+        stream_sub = StreamSub.validate(stream or self.stream)
+        correlation_id = correlation_id or gen_cor_id()
+
+        call: AsyncFunc = self._producer.publish_batch
+
+        for m in chain(
+            self._middlewares[::-1],
+            (
+                _extra_middlewares
+                or (m(None).publish_scope for m in self._broker_middlewares[::-1])
+            ),
+        ):
+            call = partial(m, call)
+
+        ids: List[bytes] = await call(
+            *message,
+            stream=stream_sub.name,
+            maxlen=maxlen or stream_sub.maxlen,
+            correlation_id=correlation_id,
+            headers=headers or self.headers,
+        )
+        return ids
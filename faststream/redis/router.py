@@ -164,6 +164,13 @@ class RedisRoute(SubscriberRoute):
                 "Argument will be removed in **FastStream 0.6.0**."
             ),
         ] = default_filter,
+        max_workers: Annotated[
+            int,
+            Doc(
+                "Number of workers to process Stream messages concurrently. "
+                "Consumer group acknowledgements are sent in batches."
+            ),
+        ] = 1,
         retry: Annotated[
             bool,
             Doc("Whether to `nack` message at processing exception."),
@@ -207,6 +214,7 @@ class RedisRoute(SubscriberRoute):
             middlewares=middlewares,
             filter=filter,
             retry=retry,
+            max_workers=max_workers,
             no_ack=no_ack,
             no_reply=no_reply,
             title=title,
@@ -19,7 +19,7 @@ class ListSub(NameRequired):
         list_name: str,
         batch: bool = False,
         max_records: int = 10,
-        polling_interval: float = 0.1,
+        polling_interval: float = 1.0,
     ) -> None:
         super().__init__(list_name)
 
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from faststream.broker.schemas import NameRequired
 from faststream.utils.path import compile_path
 
@@ -6,6 +8,7 @@ class PubSub(NameRequired):
     """A class to represent a Redis PubSub channel."""
 
     __slots__ = (
+        "buffer_size",
         "name",
         "path_regex",
         "pattern",
@@ -17,6 +20,7 @@ class PubSub(NameRequired):
         channel: str,
         pattern: bool = False,
         polling_interval: float = 1.0,
+        buffer_size: Optional[int] = None,
     ) -> None:
         reg, path = compile_path(
             channel,
@@ -32,6 +36,7 @@ class PubSub(NameRequired):
         self.path_regex = reg
         self.pattern = channel if pattern else None
         self.polling_interval = polling_interval
+        self.buffer_size = buffer_size
 
     def __hash__(self) -> int:
         return hash(f"pubsub:{self.name}")
@@ -4,6 +4,10 @@ from typing import Optional
 from faststream.broker.schemas import NameRequired
 from faststream.exceptions import SetupError
 
+# acks are sent by batches up to 100ms later, so smaller idle time claims
+# entries which are processed already or still in progress
+MIN_IDLE_TIME_MS = 1000
+
 
 class StreamSub(NameRequired):
     """A class to represent a Redis Stream subscriber."""
@@ -13,8 +17,10 @@ class StreamSub(NameRequired):
         "consumer",
         "group",
         "last_id",
+        "max_deliveries",
         "max_records",
         "maxlen",
+        "min_idle_time",
         "name",
         "no_ack",
         "polling_interval",
@@ -31,10 +37,24 @@ class StreamSub(NameRequired):
         last_id: Optional[str] = None,
         maxlen: Optional[int] = None,
         max_records: Optional[int] = None,
+        min_idle_time: Optional[int] = None,
+        max_deliveries: Optional[int] = None,
     ) -> None:
         if (group and not consumer) or (not group and consumer):
             raise SetupError("You should specify `group` and `consumer` both")
 
+        if min_idle_time is not None and not group:
+            raise SetupError("`min_idle_time` can be used only with consumer group")
+
+        if min_idle_time is not None and min_idle_time < MIN_IDLE_TIME_MS:
+            raise SetupError(
+                f"`min_idle_time` should be at least {MIN_IDLE_TIME_MS} ms, "
+                "set it above your handler max processing time"
+            )
+
+        if max_deliveries is not None and min_idle_time is None:
+            raise SetupError("`max_deliveries` can be used only with `min_idle_time`")
+
         if group and consumer and no_ack:
             warnings.warn(
                 message="`no_ack` has no effect with consumer group",
@@ -55,6 +75,8 @@ class StreamSub(NameRequired):
         self.last_id = last_id
         self.maxlen = maxlen
         self.max_records = max_records
+        self.min_idle_time = min_idle_time
+        self.max_deliveries = max_deliveries
 
     def __hash__(self) -> int:
         if self.group is not None:
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Iterable, List, Optional, Set
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import Redis
+
+    from faststream.types import LoggerProto
+
+
+class StreamAckBatcher:
+    """Collects consumer group acknowledgements and sends them by multi-id `XACK`.
+
+    Ids are flushed when `max_size` acknowledgements are collected or
+    `interval` seconds after the first not flushed one. Not sent ids are
+    returned to the batch and retried by the timer with exponential backoff
+    up to `max_backoff` seconds. `close` makes the last attempt and drops ids
+    it can't send: they stay pending and are redelivered by Redis.
+    """
+
+    def __init__(
+        self,
+        connection: "Redis[bytes]",
+        *,
+        stream: str,
+        group: str,
+        max_size: int = 100,
+        interval: float = 0.1,
+        max_backoff: float = 5.0,
+        logger: Optional["LoggerProto"] = None,
+    ) -> None:
+        self.stream = stream
+        self.group = group
+        self.max_size = max_size
+        self.interval = interval
+        self.max_backoff = max_backoff
+
+        self._connection = connection
+        self._logger = logger
+        self._ids: List[bytes] = []
+        self._failures = 0
+        self._closed = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    def add(self, ids: Iterable[bytes]) -> None:
+        self._ids.extend(ids)
+
+        if self._closed:
+            return
+
+        # failed connection is retried by the timer only
+        if len(self._ids) >= self.max_size and not self._failures:
+            self._flush()
+
+        else:
+            self._schedule(self.interval)
+
+    def _schedule(self, delay: float) -> None:
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                delay, self._flush
+            )
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        ids, self._ids = self._ids, []
+
+        if ids:
+            task = asyncio.create_task(self._xack(ids))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _xack(self, ids: List[bytes]) -> None:
+        try:
+            await self._connection.xack(self.stream, self.group, *ids)  # type: ignore[no-untyped-call]
+
+        except Exception:
+            self._ids[:0] = ids
+
+            if not self._closed:
+                self._failures += 1
+
+                # postpone the flush scheduled by ids added meanwhile
+                if self._flush_handle is not None:
+                    self._flush_handle.cancel()
+                    self._flush_handle = None
+
+                self._schedule(min(self.interval * 2**self._failures, self.max_backoff))
+
+        else:
+            self._failures = 0
+
+    async def close(self) -> None:
+        """Send collected acknowledgements once, drop them if it fails."""
+        self._closed = True
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        ids, self._ids = self._ids, []
+        if not ids:
+            return
+
+        try:
+            await self._connection.xack(self.stream, self.group, *ids)  # type: ignore[no-untyped-call]
+
+        except Exception as e:
+            if self._logger is not None:
+                self._logger.log(
+                    logging.ERROR,
+                    f"Failed to acknowledge {len(ids)} `{self.stream}` entries, "
+                    "they will be redelivered",
+                    exc_info=e,
+                )
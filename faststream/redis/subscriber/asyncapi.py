@@ -15,6 +15,7 @@ from faststream.redis.subscriber.usecase import (
     BatchListSubscriber,
     BatchStreamSubscriber,
     ChannelSubscriber,
+    ConcurrentStreamSubscriber,
     ListSubscriber,
     LogicSubscriber,
     StreamSubscriber,
@@ -78,6 +79,12 @@ class AsyncAPIStreamSubscriber(StreamSubscriber, _StreamSubscriberMixin):
     pass
 
 
+class AsyncAPIConcurrentStreamSubscriber(
+    ConcurrentStreamSubscriber, _StreamSubscriberMixin
+):
+    pass
+
+
 class AsyncAPIStreamBatchSubscriber(BatchStreamSubscriber, _StreamSubscriberMixin):
     pass
 
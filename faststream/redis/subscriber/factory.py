@@ -7,6 +7,7 @@ from faststream.redis.schemas import INCORRECT_SETUP_MSG, ListSub, PubSub, Strea
 from faststream.redis.schemas.proto import validate_options
 from faststream.redis.subscriber.asyncapi import (
     AsyncAPIChannelSubscriber,
+    AsyncAPIConcurrentStreamSubscriber,
     AsyncAPIListBatchSubscriber,
     AsyncAPIListSubscriber,
     AsyncAPIStreamBatchSubscriber,
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
 
 SubsciberType: TypeAlias = Union[
     "AsyncAPIChannelSubscriber",
+    "AsyncAPIConcurrentStreamSubscriber",
     "AsyncAPIStreamBatchSubscriber",
     "AsyncAPIStreamSubscriber",
     "AsyncAPIListBatchSubscriber",
@@ -34,6 +36,7 @@ def create_subscriber(
     list: Union["ListSub", str, None],
     stream: Union["StreamSub", str, None],
     # Subscriber args
+    max_workers: int = 1,
     no_ack: bool = False,
     no_reply: bool = False,
     retry: bool = False,
@@ -46,6 +49,13 @@ def create_subscriber(
 ) -> SubsciberType:
     validate_options(channel=channel, list=list, stream=stream)
 
+    stream_sub = StreamSub.validate(stream)
+
+    if max_workers > 1 and (stream_sub is None or stream_sub.batch):
+        raise SetupError(
+            "The `max_workers` option can be used only with a not batch Stream subscriber."
+        )
+
     if (channel_sub := PubSub.validate(channel)) is not None:
         return AsyncAPIChannelSubscriber(
             channel=channel_sub,
@@ -61,7 +71,7 @@ def create_subscriber(
             include_in_schema=include_in_schema,
         )
 
-    elif (stream_sub := StreamSub.validate(stream)) is not None:
+    elif stream_sub is not None:
         if stream_sub.batch:
             return AsyncAPIStreamBatchSubscriber(
                 stream=stream_sub,
@@ -76,6 +86,21 @@ def create_subscriber(
                 description_=description_,
                 include_in_schema=include_in_schema,
             )
+        elif max_workers > 1:
+            return AsyncAPIConcurrentStreamSubscriber(
+                max_workers=max_workers,
+                stream=stream_sub,
+                # basic args
+                no_ack=no_ack,
+                no_reply=no_reply,
+                retry=retry,
+                broker_dependencies=broker_dependencies,
+                broker_middlewares=broker_middlewares,
+                # AsyncAPI args
+                title_=title_,
+                description_=description_,
+                include_in_schema=include_in_schema,
+            )
         else:
             return AsyncAPIStreamSubscriber(
                 stream=stream_sub,
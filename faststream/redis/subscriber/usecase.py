@@ -1,8 +1,10 @@
 import asyncio
+import logging
 import math
 from abc import abstractmethod
 from contextlib import suppress
 from copy import deepcopy
+from time import monotonic
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -17,12 +19,13 @@ from typing import (
 )
 
 import anyio
-from redis.asyncio.client import PubSub as RPubSub
 from redis.asyncio.client import Redis
+from redis.asyncio.connection import ConnectionPool
 from redis.exceptions import ResponseError
 from typing_extensions import TypeAlias, override
 
 from faststream.broker.publisher.fake import FakePublisher
+from faststream.broker.subscriber.mixins import ConcurrentMixin
 from faststream.broker.subscriber.usecase import SubscriberUsecase
 from faststream.broker.utils import process_msg
 from faststream.redis.message import (
@@ -36,6 +39,7 @@ from faststream.redis.message import (
     RedisStreamMessage,
     UnifyRedisDict,
 )
+from faststream.redis.multiplexer import PubSubMultiplexer
 from faststream.redis.parser import (
     RedisBatchListParser,
     RedisBatchStreamParser,
@@ -44,6 +48,7 @@ from faststream.redis.parser import (
     RedisStreamParser,
 )
 from faststream.redis.schemas import ListSub, PubSub, StreamSub
+from faststream.redis.subscriber.ack import StreamAckBatcher
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Depends
@@ -99,6 +104,8 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
         )
 
         self._client = None
+        self._pubsub: Optional[PubSubMultiplexer] = None
+        self._logger: Optional[LoggerProto] = None
         self.task: Optional[asyncio.Task[None]] = None
 
     @override
@@ -106,6 +113,7 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
         self,
         *,
         connection: Optional["Redis[bytes]"],
+        pubsub: Optional["PubSubMultiplexer"] = None,
         # basic args
         logger: Optional["LoggerProto"],
         producer: Optional["ProducerProto"],
@@ -121,6 +129,8 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
         _call_decorators: Iterable["Decorator"],
     ) -> None:
         self._client = connection
+        self._pubsub = pubsub
+        self._logger = logger
 
         super().setup(
             logger=logger,
@@ -218,7 +228,7 @@ class LogicSubscriber(SubscriberUsecase[UnifyRedisDict]):
 
 
 class ChannelSubscriber(LogicSubscriber):
-    subscription: Optional[RPubSub]
+    subscription: Optional["asyncio.Queue[PubSubMessage]"]
 
     def __init__(
         self,
@@ -253,6 +263,7 @@ class ChannelSubscriber(LogicSubscriber):
 
         self.channel = channel
         self.subscription = None
+        self._own_pubsub = False
 
     def __hash__(self) -> int:
         return hash(self.channel)
@@ -273,20 +284,33 @@ class ChannelSubscriber(LogicSubscriber):
 
         assert self._client, "You should setup subscriber at first."  # nosec B101
 
-        self.subscription = psub = self._client.pubsub()
+        if self._pubsub is None:
+            # not connected broker (e.g. TestClient) has no shared PubSub
+            self._pubsub = PubSubMultiplexer(self._client, logger=self._logger)
+            self._own_pubsub = True
 
-        if self.channel.pattern:
-            await psub.psubscribe(self.channel.name)
-        else:
-            await psub.subscribe(self.channel.name)
+        self.subscription = queue = await self._pubsub.subscribe(
+            self.channel.name,
+            pattern=bool(self.channel.pattern),
+            buffer_size=self.channel.buffer_size,
+        )
 
-        await super().start(psub)
+        await super().start(queue)
 
     async def close(self) -> None:
-        if self.subscription is not None:
-            await self.subscription.unsubscribe()
-            await self.subscription.aclose()  # type: ignore[attr-defined]
-            self.subscription = None
+        if self.subscription is not None and self._pubsub is not None:
+            await self._pubsub.unsubscribe(
+                self.channel.name,
+                self.subscription,
+                pattern=bool(self.channel.pattern),
+            )
+
+            if self._own_pubsub:
+                await self._pubsub.close()
+                self._pubsub = None
+                self._own_pubsub = False
+
+        self.subscription = None
 
         await super().close()
 
@@ -301,13 +325,10 @@ class ChannelSubscriber(LogicSubscriber):
             not self.calls
         ), "You can't use `get_one` method if subscriber has registered handlers."
 
-        sleep_interval = timeout / 10
-
         message: Optional[PubSubMessage] = None
 
         with anyio.move_on_after(timeout):
-            while (message := await self._get_message(self.subscription)) is None:  # noqa: ASYNC110
-                await anyio.sleep(sleep_interval)
+            message = await self.subscription.get()
 
         msg: Optional[RedisMessage] = await process_msg(  # type: ignore[assignment]
             msg=message,
@@ -317,25 +338,20 @@ class ChannelSubscriber(LogicSubscriber):
         )
         return msg
 
-    async def _get_message(self, psub: RPubSub) -> Optional[PubSubMessage]:
-        raw_msg = await psub.get_message(
-            ignore_subscribe_messages=True,
-            timeout=self.channel.polling_interval,
-        )
-
-        if raw_msg:
-            return PubSubMessage(
-                type=raw_msg["type"],
-                data=raw_msg["data"],
-                channel=raw_msg["channel"].decode(),
-                pattern=raw_msg["pattern"],
-            )
-
-        return None
+    @override
+    async def _consume(  # type: ignore[override]
+        self,
+        queue: "asyncio.Queue[PubSubMessage]",
+        *,
+        start_signal: "anyio.Event",
+    ) -> None:
+        # messages are pushed to the queue, so the first read can block forever
+        start_signal.set()
+        await super()._consume(queue, start_signal=start_signal)
 
-    async def _get_msgs(self, psub: RPubSub) -> None:
-        if msg := await self._get_message(psub):
-            await self.consume(msg)  # type: ignore[arg-type]
+    async def _get_msgs(self, queue: "asyncio.Queue[PubSubMessage]") -> None:
+        msg = await queue.get()
+        await self.consume(msg)  # type: ignore[arg-type]
 
     def add_prefix(self, prefix: str) -> None:
         new_ch = deepcopy(self.channel)
@@ -377,6 +393,7 @@ class _ListHandlerMixin(LogicSubscriber):
         )
 
         self.list_sub = list
+        self._blocking_client: Optional[Redis[bytes]] = None
 
     def __hash__(self) -> int:
         return hash(self.list_sub)
@@ -407,7 +424,38 @@ class _ListHandlerMixin(LogicSubscriber):
 
         assert self._client, "You should setup subscriber at first."  # nosec B101
 
-        await super().start(self._client)
+        # blocking pops hold the connection, so they don't share it with publishers
+        pool = self._client.connection_pool
+        connection_kwargs = pool.connection_kwargs.copy()
+
+        if (socket_timeout := connection_kwargs.get("socket_timeout")) is not None:
+            # Redis replies to an idle pop after its timeout only
+            connection_kwargs["socket_timeout"] = (
+                socket_timeout + self.list_sub.polling_interval
+            )
+
+        self._blocking_client = client = Redis.from_pool(  # type: ignore[attr-defined]
+            ConnectionPool(
+                connection_class=pool.connection_class,
+                max_connections=1,
+                **connection_kwargs,
+            )
+        )
+
+        await super().start(client)
+
+    async def close(self) -> None:
+        task = self.task
+
+        await super().close()
+
+        if task is not None:
+            with suppress(asyncio.CancelledError, Exception):
+                await task
+
+        if self._blocking_client is not None:
+            await self._blocking_client.aclose()  # type: ignore[attr-defined]
+            self._blocking_client = None
 
     @override
     async def get_one(  # type: ignore[override]
@@ -420,14 +468,24 @@ class _ListHandlerMixin(LogicSubscriber):
             not self.calls
         ), "You can't use `get_one` method if subscriber has registered handlers."
 
-        sleep_interval = timeout / 10
-        raw_message = None
+        client = self._blocking_client or self._client
+        raw_message: Optional[bytes] = None
 
-        with anyio.move_on_after(timeout):
-            while (  # noqa: ASYNC110
-                raw_message := await self._client.lpop(name=self.list_sub.name)
-            ) is None:
-                await anyio.sleep(sleep_interval)
+        # Redis blocking timeouts have milliseconds precision
+        if timeout < 0.001:
+            raw_message = await client.lpop(name=self.list_sub.name)
+
+        else:
+            deadline = monotonic() + timeout
+
+            # a single pop fits the blocking connection read timeout
+            while (left := deadline - monotonic()) >= 0.001:
+                if popped := await client.blpop(
+                    [self.list_sub.name],
+                    timeout=min(left, self.list_sub.polling_interval),
+                ):
+                    raw_message = popped[1]
+                    break
 
         if not raw_message:
             return None
@@ -484,20 +542,20 @@ class ListSubscriber(_ListHandlerMixin):
         )
 
     async def _get_msgs(self, client: "Redis[bytes]") -> None:
-        raw_msg = await client.lpop(name=self.list_sub.name)
+        popped = await client.blpop(
+            [self.list_sub.name],
+            timeout=self.list_sub.polling_interval,
+        )
 
-        if raw_msg:
+        if popped:
             msg = DefaultListMessage(
                 type="list",
-                data=raw_msg,
+                data=popped[1],
                 channel=self.list_sub.name,
             )
 
             await self.consume(msg)  # type: ignore[arg-type]
 
-        else:
-            await anyio.sleep(self.list_sub.polling_interval)
-
 
 class BatchListSubscriber(_ListHandlerMixin):
     def __init__(
@@ -532,11 +590,10 @@ class BatchListSubscriber(_ListHandlerMixin):
             include_in_schema=include_in_schema,
         )
 
+        self._blmpop_supported = True
+
     async def _get_msgs(self, client: "Redis[bytes]") -> None:
-        raw_msgs = await client.lpop(
-            name=self.list_sub.name,
-            count=self.list_sub.max_records,
-        )
+        raw_msgs = await self._pop_batch(client)
 
         if raw_msgs:
             msg = BatchListMessage(
@@ -547,8 +604,38 @@ class BatchListSubscriber(_ListHandlerMixin):
 
             await self.consume(msg)  # type: ignore[arg-type]
 
-        else:
-            await anyio.sleep(self.list_sub.polling_interval)
+    async def _pop_batch(self, client: "Redis[bytes]") -> Optional[List[bytes]]:
+        """Wait for messages by `BLMPOP` or `BLPOP` + `LPOP` before Redis 7.0."""
+        name = self.list_sub.name
+        timeout = self.list_sub.polling_interval
+
+        if self._blmpop_supported:
+            try:
+                popped = await client.blmpop(  # type: ignore[attr-defined]
+                    timeout,
+                    1,
+                    name,
+                    direction="LEFT",
+                    count=self.list_sub.max_records,
+                )
+
+            except ResponseError as e:
+                if "unknown command" not in str(e).lower():
+                    raise
+                self._blmpop_supported = False
+
+            else:
+                return popped[1] if popped else None
+
+        if not (first := await client.blpop([name], timeout=timeout)):
+            return None
+
+        rest = (
+            await client.lpop(name=name, count=self.list_sub.max_records - 1)
+            if self.list_sub.max_records > 1
+            else None
+        )
+        return [first[1], *(rest or ())]
 
 
 class _StreamHandlerMixin(LogicSubscriber):
@@ -587,6 +674,10 @@ class _StreamHandlerMixin(LogicSubscriber):
         self.stream_sub = stream
         self.last_id = stream.last_id
 
+        self._claim_cursor = "0-0"
+        self._next_claim_at = 0.0
+        self._claimed_last = False
+
     def __hash__(self) -> int:
         return hash(self.stream_sub)
 
@@ -611,6 +702,7 @@ class _StreamHandlerMixin(LogicSubscriber):
         self.extra_watcher_options.update(
             redis=client,
             group=self.stream_sub.group,
+            claim_pending=self.stream_sub.min_idle_time is not None,
         )
 
         stream = self.stream_sub
@@ -663,12 +755,19 @@ class _StreamHandlerMixin(LogicSubscriber):
                     ...,
                 ],
             ]:
+                self._claimed_last = self._claim_is_due()
+                if self._claimed_last:
+                    return self._claim_pending(client)
+
                 return client.xreadgroup(
                     groupname=stream.group,
                     consumername=stream.consumer,
                     streams={stream.name: ">"},
                     count=stream.max_records,
-                    block=stream.polling_interval,
+                    # don't wait for new entries until PEL scan is finished
+                    block=(
+                        stream.polling_interval if self._claim_cursor == "0-0" else None
+                    ),
                     noack=stream.no_ack,
                 )
 
@@ -699,6 +798,85 @@ class _StreamHandlerMixin(LogicSubscriber):
 
         await super().start(read)
 
+    def _claim_is_due(self) -> bool:
+        if self.stream_sub.min_idle_time is None:
+            return False
+
+        if self._claim_cursor != "0-0":
+            # not finished PEL scan batches alternate with new entries ones
+            return not self._claimed_last
+
+        return monotonic() >= self._next_claim_at
+
+    async def _claim_pending(
+        self,
+        client: "Redis[bytes]",
+    ) -> Tuple[Tuple[TopicName, Tuple[Tuple[Offset, Dict[bytes, bytes]], ...]], ...]:
+        """Take over entries idle in the group PEL for `min_idle_time` by `XAUTOCLAIM`.
+
+        Entries delivered more than `max_deliveries` times (`XPENDING`
+        delivery counter) are acknowledged and dropped without processing.
+        """
+        stream = self.stream_sub
+        assert stream.min_idle_time is not None  # nosec B101
+
+        cursor, entries, *_ = await client.xautoclaim(
+            name=stream.name,
+            groupname=stream.group,
+            consumername=stream.consumer,
+            min_idle_time=stream.min_idle_time,
+            start_id=self._claim_cursor,
+            count=stream.max_records or 100,
+        )
+
+        self._claim_cursor = cursor.decode()
+        if self._claim_cursor == "0-0":
+            self._next_claim_at = monotonic() + stream.min_idle_time / 1000
+
+        # deleted from the stream entries have no fields
+        entries = [(message_id, fields) for message_id, fields in entries if fields]
+
+        if entries and stream.max_deliveries is not None:
+            # XPENDING has no ids filter, so each claimed entry is queried by its
+            # own range: a range over all of them may be truncated by other ones
+            pipe = client.pipeline(transaction=False)
+            for message_id, _ in entries:
+                pipe.xpending_range(
+                    name=stream.name,
+                    groupname=stream.group,
+                    min=message_id,
+                    max=message_id,
+                    count=1,
+                )
+
+            deliveries = {
+                p["message_id"]: p["times_delivered"]
+                for pending in await pipe.execute()
+                for p in pending
+            }
+
+            if dropped := [
+                message_id
+                for message_id, _ in entries
+                if deliveries.get(message_id, 0) > stream.max_deliveries
+            ]:
+                await client.xack(stream.name, stream.group, *dropped)  # type: ignore[no-untyped-call]
+
+                if self._logger is not None:
+                    self._logger.log(
+                        logging.ERROR,
+                        f"Dropped {len(dropped)} `{stream.name}` entries delivered "
+                        f"more than {stream.max_deliveries} times: "
+                        f"{b', '.join(dropped).decode()}",
+                    )
+
+                entries = [e for e in entries if e[0] not in dropped]
+
+        if not entries:
+            return ()
+
+        return ((stream.name.encode(), tuple(entries)),)
+
     @override
     async def get_one(  # type: ignore[override]
         self,
@@ -811,6 +989,114 @@ class StreamSubscriber(_StreamHandlerMixin):
                     await self.consume(msg)  # type: ignore[arg-type]
 
 
+class ConcurrentStreamSubscriber(
+    ConcurrentMixin[UnifyRedisDict],
+    StreamSubscriber,
+):
+    """Stream subscriber processing read entries by `max_workers` concurrent tasks.
+
+    The next entries are read only when there is a free worker. Consumer group
+    acknowledgements are collected and sent by a single `XACK` per batch.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        stream: StreamSub,
+        # Subscriber args
+        no_ack: bool,
+        no_reply: bool,
+        retry: bool,
+        broker_dependencies: Iterable["Depends"],
+        broker_middlewares: Sequence["BrokerMiddleware[UnifyRedisDict]"],
+        # AsyncAPI args
+        title_: Optional[str],
+        description_: Optional[str],
+        include_in_schema: bool,
+    ) -> None:
+        super().__init__(
+            max_workers=max_workers,
+            stream=stream,
+            # Propagated options
+            no_ack=no_ack,
+            no_reply=no_reply,
+            retry=retry,
+            broker_middlewares=broker_middlewares,
+            broker_dependencies=broker_dependencies,
+            # AsyncAPI
+            title_=title_,
+            description_=description_,
+            include_in_schema=include_in_schema,
+        )
+
+        self._acks: Optional[StreamAckBatcher] = None
+
+    @override
+    async def start(self) -> None:
+        if self.task:
+            return
+
+        assert self._client, "You should setup subscriber at first."  # nosec B101
+
+        if self.stream_sub.group and self.stream_sub.consumer:
+            self._acks = StreamAckBatcher(
+                self._client,
+                stream=self.stream_sub.name,
+                group=self.stream_sub.group,
+                max_size=max(self.max_workers, self.stream_sub.max_records or 0),
+                logger=self._logger,
+            )
+            self.extra_watcher_options["acks"] = self._acks
+
+        self.start_consume_task()
+
+        await super().start()
+
+    async def close(self) -> None:
+        await super().close()
+
+        if self._acks is not None:
+            await self._acks.close()
+            self._acks = None
+            self.extra_watcher_options.pop("acks", None)
+
+    async def _get_msgs(
+        self,
+        read: Callable[
+            [str],
+            Awaitable[
+                Tuple[
+                    Tuple[
+                        TopicName,
+                        Tuple[
+                            Tuple[
+                                Offset,
+                                Dict[bytes, bytes],
+                            ],
+                            ...,
+                        ],
+                    ],
+                    ...,
+                ],
+            ],
+        ],
+    ) -> None:
+        for stream_name, msgs in await read(self.last_id):
+            if msgs:
+                self.last_id = msgs[-1][0].decode()
+
+                for message_id, raw_msg in msgs:
+                    msg = DefaultStreamMessage(
+                        type="stream",
+                        channel=stream_name.decode(),
+                        message_ids=[message_id],
+                        data=raw_msg,
+                    )
+
+                    await self._put_msg(msg)  # type: ignore[arg-type]
+
+
 class BatchStreamSubscriber(_StreamHandlerMixin):
     def __init__(
         self,
@@ -2,11 +2,13 @@ import re
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     List,
     Optional,
     Protocol,
     Sequence,
     Tuple,
+    Type,
     Union,
     cast,
 )
@@ -27,7 +29,11 @@ from faststream.redis.message import (
     PubSubMessage,
     bDATA_KEY,
 )
-from faststream.redis.parser import RawMessage, RedisPubSubParser
+from faststream.redis.parser import (
+    JSONMessageFormat,
+    RawMessage,
+    RedisPubSubParser,
+)
 from faststream.redis.publisher.producer import RedisFastProducer
 from faststream.redis.schemas import INCORRECT_SETUP_MSG
 from faststream.redis.subscriber.usecase import (
@@ -40,6 +46,7 @@ from faststream.testing.broker import TestBroker
 from faststream.utils.functions import timeout_scope
 
 if TYPE_CHECKING:
+    from faststream.redis.parser import MessageFormat
     from faststream.redis.publisher.asyncapi import AsyncAPIPublisher
     from faststream.types import AnyDict, SendableMessage
 
@@ -85,13 +92,13 @@ class TestRedisBroker(TestBroker[RedisBroker]):
 
         pub_sub = AsyncMock()
 
-        async def get_msg(*args: Any, timeout: float, **kwargs: Any) -> None:
-            await anyio.sleep(timeout)
-            return None
+        async def listen() -> AsyncIterator[None]:
+            await anyio.Event().wait()
+            yield None
 
-        pub_sub.get_message = get_msg
+        pub_sub.listen = listen
 
-        connection.pubsub.side_effect = lambda: pub_sub
+        connection.pubsub.side_effect = lambda **kwargs: pub_sub
         return connection
 
 
@@ -130,8 +137,9 @@ class FakeProducer(RedisFastProducer):
 
         correlation_id = correlation_id or gen_cor_id()
 
-        body = build_message(
-            message=message,
+        body = self._build_body(
+            message,
+            stream=stream,
             reply_to=reply_to,
             correlation_id=correlation_id,
             headers=headers,
@@ -171,8 +179,9 @@ class FakeProducer(RedisFastProducer):
     ) -> "PubSubMessage":
         correlation_id = correlation_id or gen_cor_id()
 
-        body = build_message(
-            message=message,
+        body = self._build_body(
+            message,
+            stream=stream,
             correlation_id=correlation_id,
             headers=headers,
         )
@@ -197,31 +206,119 @@ class FakeProducer(RedisFastProducer):
     async def publish_batch(
         self,
         *msgs: "SendableMessage",
-        list: str,
+        list: Optional[str] = None,
+        stream: Optional[str] = None,
+        maxlen: Optional[int] = None,
         headers: Optional["AnyDict"] = None,
         correlation_id: Optional[str] = None,
-    ) -> None:
+    ) -> Optional[List[bytes]]:
+        correlation_id = correlation_id or gen_cor_id()
+
+        if stream is not None:
+            return await self._publish_stream_batch(
+                *msgs,
+                stream=stream,
+                headers=headers,
+                correlation_id=correlation_id,
+            )
+
         data_to_send = [
             build_message(
                 m,
-                correlation_id=correlation_id or gen_cor_id(),
+                correlation_id=correlation_id,
                 headers=headers,
+                message_format=self.broker.message_format,
             )
             for m in msgs
         ]
 
         visitor = ListVisitor()
         for handler in self.broker._subscribers.values():  # pragma: no branch
-            if visitor.visit(list=list, sub=handler):
+            if visited_list := visitor.visit(list=list, sub=handler):
                 casted_handler = cast(_ListHandlerMixin, handler)
 
                 if casted_handler.list_sub.batch:
-                    msg = visitor.get_message(list, data_to_send, casted_handler)
+                    msg = visitor.get_message(
+                        visited_list, data_to_send, casted_handler
+                    )
 
                     await self._execute_handler(msg, handler)
 
         return None
 
+    async def _publish_stream_batch(
+        self,
+        *msgs: "SendableMessage",
+        stream: str,
+        headers: Optional["AnyDict"],
+        correlation_id: str,
+    ) -> List[bytes]:
+        bodies = [
+            self._build_body(
+                m,
+                stream=stream,
+                correlation_id=correlation_id,
+                headers=headers,
+            )
+            for m in msgs
+        ]
+
+        visitor = StreamVisitor()
+        for handler in self.broker._subscribers.values():  # pragma: no branch
+            if visitor.visit(stream=stream, sub=handler):
+                casted_handler = cast(_StreamHandlerMixin, handler)
+
+                if casted_handler.stream_sub.batch:
+                    await self._execute_handler(
+                        BatchStreamMessage(
+                            type="bstream",
+                            channel=stream,
+                            data=[
+                                b if isinstance(b, dict) else {bDATA_KEY: b}
+                                for b in bodies
+                            ],
+                            message_ids=[],
+                        ),
+                        handler,
+                    )
+
+                else:
+                    for body in bodies:
+                        msg = visitor.get_message(stream, body, casted_handler)
+                        await self._execute_handler(msg, handler)
+
+        return [f"0-{i}".encode() for i in range(1, len(bodies) + 1)]
+
+    def _build_body(
+        self,
+        message: "SendableMessage",
+        *,
+        stream: Optional[str],
+        correlation_id: str,
+        reply_to: str = "",
+        headers: Optional["AnyDict"] = None,
+    ) -> Any:
+        if stream is not None and self.broker.native_stream_fields:
+            fields = RawMessage.encode_stream_fields(
+                message=message,
+                reply_to=reply_to,
+                headers=headers,
+                correlation_id=correlation_id,
+            )
+            # stream entries are read as bytes mapping
+            return {
+                k.encode(): v if isinstance(v, bytes) else str(v).encode()
+                for k, v in fields.items()
+            }
+
+        return build_message(
+            message=message,
+            reply_to=reply_to,
+            correlation_id=correlation_id,
+            headers=headers,
+            message_format=self.broker.message_format,
+        )
+
     async def _execute_handler(
         self, msg: Any, handler: "LogicSubscriber"
     ) -> "PubSubMessage":
@@ -233,6 +330,7 @@ class FakeProducer(RedisFastProducer):
                 message=result.body,
                 headers=result.headers,
                 correlation_id=result.correlation_id or "",
+                message_format=self.broker.message_format,
             ),
             channel="",
             pattern=None,
@@ -245,12 +343,14 @@ def build_message(
     correlation_id: str,
     reply_to: str = "",
     headers: Optional["AnyDict"] = None,
+    message_format: Type["MessageFormat"] = JSONMessageFormat,
 ) -> bytes:
     data = RawMessage.encode(
         message=message,
         reply_to=reply_to,
         headers=headers,
         correlation_id=correlation_id,
+        message_format=message_format,
     )
     return data
 
@@ -374,7 +474,7 @@ class StreamVisitor(Visitor):
             return BatchStreamMessage(
                 type="bstream",
                 channel=channel,
-                data=[{bDATA_KEY: body}],
+                data=[body if isinstance(body, dict) else {bDATA_KEY: body}],
                 message_ids=[],
             )
 
@@ -382,7 +482,7 @@ class StreamVisitor(Visitor):
             return DefaultStreamMessage(
                 type="stream",
                 channel=channel,
-                data={bDATA_KEY: body},
+                data=body if isinstance(body, dict) else {bDATA_KEY: body},
                 message_ids=[],
             )
 
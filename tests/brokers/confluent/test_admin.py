@@ -0,0 +1,57 @@
+from concurrent.futures import Future
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from faststream.confluent.admin import AdminService
+
+
+class FakeAdminClient:
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.topics = {"existing": object()}
+        self.list_calls = 0
+        self.create_calls: List[List[str]] = []
+
+    def list_topics(self, timeout: float) -> Any:
+        self.list_calls += 1
+        return MagicMock(topics=dict(self.topics))
+
+    def create_topics(self, new_topics: List[Any], **kwargs: Any) -> Dict[str, Future]:
+        self.create_calls.append([t.topic for t in new_topics])
+
+        fs = {}
+        for t in new_topics:
+            self.topics[t.topic] = object()
+            fs[t.topic] = f = Future()
+            f.set_result(None)
+        return fs
+
+
+@pytest.mark.asyncio
+class TestAdminService:
+    async def test_single_client(self) -> None:
+        with patch("faststream.confluent.admin.AdminClient", new=FakeAdminClient):
+            admin = AdminService({"bootstrap.servers": "localhost"})
+
+            assert admin.client is admin.client
+
+    async def test_create_missing_topics_at_once(self) -> None:
+        with patch("faststream.confluent.admin.AdminClient", new=FakeAdminClient):
+            admin = AdminService({"bootstrap.servers": "localhost"})
+
+            await admin.create_topics(["existing", "a", "b", "a"])
+            await admin.create_topics(["a", "b"])
+
+        assert admin.client.create_calls == [["a", "b"]]
+        assert admin.client.list_calls == 1
+        assert await admin.list_topics() == {"existing", "a", "b"}
+
+    async def test_metadata_ttl(self) -> None:
+        with patch("faststream.confluent.admin.AdminClient", new=FakeAdminClient):
+            admin = AdminService({"bootstrap.servers": "localhost"}, metadata_ttl=0)
+
+            await admin.list_topics()
+            await admin.list_topics()
+
+        assert admin.client.list_calls == 2
@@ -0,0 +1,385 @@
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from unittest.mock import patch
+
+import anyio
+import pytest
+from confluent_kafka import KafkaException
+
+from faststream.confluent.client import (
+    AsyncConfluentConsumer,
+    AsyncConfluentProducer,
+    BatchBuilder,
+)
+from faststream.confluent.config import ConfluentFastConfig
+from faststream.confluent.schemas import TopicPartition
+from faststream.exceptions import SetupError
+
+
+class FakeProducer:
+    """Calls delivery callbacks from `poll`/`flush` like librdkafka."""
+
+    def __init__(self, config: Dict[str, Any], logger: Any = None) -> None:
+        self.callbacks: queue.Queue[Callable[..., None]] = queue.Queue()
+        self.poll_threads = set()
+        self.queue_limit = 0
+        self.buffer_errors = 0
+
+    def produce(self, topic: str, on_delivery: Callable[..., None], **kwargs: Any):
+        if self.queue_limit and self.callbacks.qsize() >= self.queue_limit:
+            self.buffer_errors += 1
+            raise BufferError("Local: Queue full")
+
+        self.callbacks.put(on_delivery)
+
+    def _serve(self, timeout: Optional[float]) -> int:
+        served = 0
+        try:
+            callback = self.callbacks.get(timeout=timeout)
+            while True:
+                self.poll_threads.add(threading.get_ident())
+                callback(None, None)
+                served += 1
+                callback = self.callbacks.get_nowait()
+        except queue.Empty:
+            return served
+
+    def poll(self, timeout: float) -> int:
+        return self._serve(timeout)
+
+    def flush(self) -> int:
+        return self._serve(None if self.callbacks.qsize() else 0)
+
+
+class FakeMessage:
+    def __init__(self, value: bytes, partition: int = 0, offset: int = 0) -> None:
+        self._value = value
+        self._partition = partition
+        self._offset = offset
+
+    def value(self) -> bytes:
+        return self._value
+
+    def topic(self) -> str:
+        return "topic"
+
+    def partition(self) -> int:
+        return self._partition
+
+    def offset(self) -> int:
+        return self._offset
+
+    def error(self) -> None:
+        return None
+
+
+class FakeConsumer:
+    """Returns messages from an in-memory queue, paused partitions are not fetched."""
+
+    def __init__(self, config: Dict[str, Any], logger: Any = None) -> None:
+        self.config = config
+        self.stored: Dict[Tuple[str, int], int] = {}
+        self.messages: queue.Queue[FakeMessage] = queue.Queue()
+        self.poll_threads = set()
+        self.polls = 0
+        self.paused = threading.Event()
+        self.resumed = threading.Event()
+
+    def subscribe(self, topics: Any, **kwargs: Any) -> None:
+        pass
+
+    def assignment(self) -> Any:
+        return []
+
+    def pause(self, partitions: Any) -> None:
+        self.resumed.clear()
+        self.paused.set()
+
+    def resume(self, partitions: Any) -> None:
+        self.paused.clear()
+        self.resumed.set()
+
+    def poll(self, timeout: float) -> Optional[FakeMessage]:
+        self.poll_threads.add(threading.get_ident())
+        self.polls += 1
+
+        if self.paused.is_set():
+            time.sleep(timeout)
+            return None
+
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def consume(self, num_messages: int, timeout: float) -> Any:
+        messages = []
+        while (
+            len(messages) < num_messages
+            and not self.paused.is_set()
+            and not self.messages.empty()
+        ):
+            messages.append(self.messages.get_nowait())
+        return messages
+
+    def store_offsets(self, offsets: Any) -> None:
+        for tp in offsets:
+            self.stored[(tp.topic, tp.partition)] = tp.offset
+
+    def commit(self, **kwargs: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+class TestDeliveryReports:
+    async def test_concurrent_deliveries(self) -> None:
+        with patch("faststream.confluent.client.Producer", new=FakeProducer):
+            producer = AsyncConfluentProducer(
+                logger=None,
+                config=ConfluentFastConfig(None),
+            )
+
+        try:
+            futures = [producer.produce("topic", b"msg") for _ in range(100)]
+            await asyncio.wait_for(asyncio.gather(*futures), timeout=3)
+
+            assert threading.get_ident() not in producer.producer.poll_threads
+        finally:
+            await producer.stop()
+
+    async def test_delivery_error(self) -> None:
+        with patch("faststream.confluent.client.Producer", new=FakeProducer):
+            producer = AsyncConfluentProducer(
+                logger=None,
+                config=ConfluentFastConfig(None),
+            )
+
+        try:
+            producer.producer.produce = lambda topic, on_delivery, **kwargs: (
+                on_delivery("broker error", None)
+            )
+
+            with pytest.raises(KafkaException):
+                await asyncio.wait_for(producer.produce("topic", b"msg"), timeout=3)
+        finally:
+            await producer.stop()
+
+
+@pytest.mark.asyncio
+class TestSendBatch:
+    async def test_batch_confirmed(self) -> None:
+        with patch("faststream.confluent.client.Producer", new=FakeProducer):
+            producer = AsyncConfluentProducer(
+                logger=None,
+                config=ConfluentFastConfig(None),
+            )
+
+        try:
+            batch = BatchBuilder()
+            for i in range(100):
+                batch.append(value=str(i).encode())
+
+            await asyncio.wait_for(
+                producer.send_batch(batch, "topic", partition=None),
+                timeout=3,
+            )
+
+            assert producer.producer.callbacks.empty()
+        finally:
+            await producer.stop()
+
+    async def test_batch_queue_full(self) -> None:
+        with patch("faststream.confluent.client.Producer", new=FakeProducer):
+            producer = AsyncConfluentProducer(
+                logger=None,
+                config=ConfluentFastConfig(None),
+            )
+
+        try:
+            producer.producer.queue_limit = 5
+
+            batch = BatchBuilder()
+            for i in range(100):
+                batch.append(value=str(i).encode())
+
+            await asyncio.wait_for(
+                producer.send_batch(batch, "topic", partition=None),
+                timeout=3,
+            )
+
+            assert producer.producer.buffer_errors
+            assert producer.producer.callbacks.empty()
+        finally:
+            await producer.stop()
+
+    async def test_batch_delivery_error(self) -> None:
+        with patch("faststream.confluent.client.Producer", new=FakeProducer):
+            producer = AsyncConfluentProducer(
+                logger=None,
+                config=ConfluentFastConfig(None),
+            )
+
+        try:
+            calls = 0
+
+            def produce(topic: str, on_delivery: Callable[..., None], **kwargs: Any):
+                nonlocal calls
+                calls += 1
+                on_delivery("broker error" if calls == 2 else None, None)
+
+            producer.producer.produce = produce
+
+            batch = BatchBuilder()
+            for i in range(3):
+                batch.append(value=str(i).encode())
+
+            with pytest.raises(KafkaException):
+                await asyncio.wait_for(
+                    producer.send_batch(batch, "topic", partition=None),
+                    timeout=3,
+                )
+
+            assert calls == 3
+        finally:
+            await producer.stop()
+
+
+@pytest.mark.asyncio
+class TestBackgroundFetch:
+    async def _start_consumer(self, **kwargs: Any) -> AsyncConfluentConsumer:
+        with patch("faststream.confluent.client.Consumer", new=FakeConsumer):
+            consumer = AsyncConfluentConsumer(
+                "topic",
+                partitions=(),
+                logger=None,
+                config=ConfluentFastConfig(None),
+                allow_auto_create_topics=False,
+                background_fetch=True,
+                **kwargs,
+            )
+
+        await consumer.start()
+        return consumer
+
+    async def test_getmany(self) -> None:
+        consumer = await self._start_consumer()
+
+        try:
+            for i in range(10):
+                consumer.consumer.messages.put(FakeMessage(str(i).encode()))
+
+            messages = await consumer.getmany(timeout=3, max_records=100)
+
+            assert [m.value() for m in messages] == [str(i).encode() for i in range(10)]
+            assert threading.get_ident() not in consumer.consumer.poll_threads
+        finally:
+            await consumer.stop()
+
+    async def test_paused_by_full_buffer(self) -> None:
+        consumer = await self._start_consumer(
+            fetch_batch_size=1,
+            fetch_queue_size=2,
+        )
+
+        try:
+            for i in range(5):
+                consumer.consumer.messages.put(FakeMessage(str(i).encode()))
+
+            assert await anyio.to_thread.run_sync(consumer.consumer.paused.wait, 3)
+            assert consumer._fetched.qsize() == 2
+
+            messages = [await consumer.getone(timeout=3) for _ in range(5)]
+
+            assert [m.value() for m in messages] == [str(i).encode() for i in range(5)]
+            assert consumer.consumer.resumed.is_set()
+        finally:
+            await consumer.stop()
+
+    async def test_pause_holds_fetching(self) -> None:
+        consumer = await self._start_consumer()
+
+        try:
+            await consumer.pause()
+            assert await anyio.to_thread.run_sync(consumer.consumer.paused.wait, 3)
+
+            consumer.consumer.messages.put(FakeMessage(b"hello"))
+
+            assert await consumer.getone(timeout=0.3) is None
+
+            await consumer.resume()
+
+            msg = await consumer.getone(timeout=3)
+            assert msg is not None
+            assert msg.value() == b"hello"
+        finally:
+            await consumer.stop()
+
+    async def test_paused_keeps_polling(self) -> None:
+        consumer = await self._start_consumer()
+
+        try:
+            await consumer.pause()
+            assert await anyio.to_thread.run_sync(consumer.consumer.paused.wait, 3)
+
+            polls = consumer.consumer.polls
+            await asyncio.sleep(0.5)
+
+            # heartbeats and rebalance callbacks are served by poll
+            assert consumer.consumer.polls > polls
+        finally:
+            await consumer.stop()
+
+    async def test_buffered_offsets_not_stored(self) -> None:
+        consumer = await self._start_consumer()
+
+        try:
+            assert consumer.consumer.config["enable.auto.offset.store"] is False
+
+            for i in range(4):
+                consumer.consumer.messages.put(FakeMessage(str(i).encode(), offset=i))
+
+            msg = await consumer.getone(timeout=3)
+            assert msg.offset() == 0
+            assert len(consumer._pending) == 3
+
+            # auto commit can't commit buffered and not processed messages
+            assert consumer.consumer.stored == {("topic", 0): 1}
+
+            await consumer.getmany(timeout=3, max_records=2)
+            assert consumer.consumer.stored == {("topic", 0): 3}
+
+            consumer._drop_fetched([TopicPartition("topic", 0)])
+            assert consumer.consumer.stored == {("topic", 0): 3}
+        finally:
+            await consumer.stop()
+
+    async def test_revoke_drops_fetched(self) -> None:
+        consumer = await self._start_consumer(fetch_batch_size=2)
+
+        try:
+            await consumer.pause()
+            assert await anyio.to_thread.run_sync(consumer.consumer.paused.wait, 3)
+
+            consumer._pending.extend((FakeMessage(b"1", 0), FakeMessage(b"2", 1)))
+            consumer._buffered += 2
+            consumer._fetched.put_nowait([FakeMessage(b"3", 1)])
+            consumer._fetched.put_nowait([FakeMessage(b"4", 0), FakeMessage(b"5", 1)])
+
+            consumer._drop_fetched([TopicPartition("topic", 1)])
+
+            assert consumer._buffered == 1
+            assert [m.value() for m in consumer._pending] == [b"1"]
+            assert [m.value() for m in await consumer.getmany(timeout=3)] == [b"1"]
+            assert [m.value() for m in await consumer.getmany(timeout=3)] == [b"4"]
+        finally:
+            await consumer.stop()
+
+    async def test_manual_commit_rejected(self) -> None:
+        with pytest.raises(SetupError):
+            await self._start_consumer(enable_auto_commit=False)
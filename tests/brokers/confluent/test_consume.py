@@ -359,3 +359,90 @@ class TestConsume(ConfluentTestcaseConfig, BrokerRealConsumeTestcase):
         assert event.is_set()
         assert event2.is_set()
         assert mock.call_count == 2, mock.call_count
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_concurrent_consume_pause(self, queue: str, mock: MagicMock):
+        release = asyncio.Event()
+        paused = asyncio.Event()
+        done = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue, max_workers=2)
+        sub = consume_broker.subscriber(*args, **kwargs)
+
+        @sub
+        async def handler(msg):
+            await release.wait()
+            mock(msg)
+            if mock.call_count == 6:
+                done.set()
+
+        pauses, resumes = [], []
+        pause_consuming, resume_consuming = sub.pause_consuming, sub.resume_consuming
+
+        async def pause_spy() -> None:
+            pauses.append(sub.in_flight)
+            await pause_consuming()
+            paused.set()
+
+        async def resume_spy() -> None:
+            resumes.append(sub.in_flight)
+            await resume_consuming()
+
+        with patch.object(sub, "pause_consuming", pause_spy), patch.object(
+            sub, "resume_consuming", resume_spy
+        ):
+            async with self.patch_broker(consume_broker) as br:
+                await br.start()
+
+                for i in range(6):
+                    await br.publish(i, queue)
+
+                await asyncio.wait_for(paused.wait(), timeout=10)
+                release.set()
+                await asyncio.wait_for(done.wait(), timeout=10)
+
+                assert not sub.paused
+
+        assert (sub.high_watermark, sub.low_watermark) == (4, 2)
+        assert pauses[0] == sub.high_watermark, pauses
+        assert resumes[0] == sub.low_watermark, resumes
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_parallel_partitions_consume(
+        self,
+        queue: str,
+        mock: MagicMock,
+        event: asyncio.Event,
+    ) -> None:
+        consume_broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(
+            queue,
+            group_id="test",
+            auto_offset_reset="earliest",
+            parallel_partitions=True,
+        )
+
+        @consume_broker.subscriber(*args, **kwargs)
+        async def handler(msg):
+            mock(msg)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("hello", queue)),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=10,
+            )
+
+            mock.assert_called_once_with("hello")
+
+        assert event.is_set()
@@ -9,3 +9,17 @@ def test_max_workers_with_manual(queue: str) -> None:
 
     with pytest.raises(SetupError):
         broker.subscriber(queue, max_workers=3, auto_commit=False)
+
+
+def test_parallel_partitions_with_max_workers(queue: str) -> None:
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, max_workers=3, parallel_partitions=True)
+
+
+def test_parallel_partitions_with_batch(queue: str) -> None:
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, batch=True, parallel_partitions=True)
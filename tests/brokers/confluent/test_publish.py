@@ -141,3 +141,36 @@ class TestPublish(ConfluentTestcaseConfig, BrokerPublishTestcase):
 
         assert event.is_set()
         mock.assert_called_once_with(body=b"1")
+
+    @pytest.mark.asyncio
+    async def test_publish_many(self, queue: str, mock: Mock):
+        pub_broker = self.get_broker()
+
+        event = asyncio.Event()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @pub_broker.subscriber(*args, **kwargs)
+        async def handler(msg):
+            mock(msg)
+            if mock.call_count == 10:
+                event.set()
+
+        publisher = pub_broker.publisher(queue, partition=0)
+
+        async def source():
+            for i in range(10):
+                yield i
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            result = await publisher.publish_many(source(), max_in_flight=3)
+
+            await asyncio.wait(
+                (asyncio.create_task(event.wait()),),
+                timeout=self.timeout,
+            )
+
+        assert [r.offset() for r in result] == list(range(10))
+        assert [c.args[0] for c in mock.call_args_list] == list(range(10))
@@ -105,6 +105,73 @@ class TestTestclient(ConfluentTestcaseConfig, BrokerTestclientTestcase):
             await br.publish_batch("hello", topic=queue)
             m.mock.assert_called_once_with(["hello"])
 
+    async def test_batch_pub_mixed_content_types(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg):
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch({"a": 1}, "hello", b"raw", topic=queue)
+            m.mock.assert_called_once_with([{"a": 1}, "hello", b"raw"])
+
+    async def test_batch_pub_json(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg):
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch({"a": 1}, [1, 2], topic=queue)
+            m.mock.assert_called_once_with([{"a": 1}, [1, 2]])
+
+    async def test_publish_many(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def m(msg):
+            pass
+
+        publisher = broker.publisher(queue)
+
+        async with self.patch_broker(broker):
+            result = await publisher.publish_many(["hello", {"a": 1}], max_in_flight=1)
+
+            assert [m.mock.call_args_list[i].args[0] for i in range(2)] == [
+                "hello",
+                {"a": 1},
+            ]
+            assert [r.offset() for r in result] == [0, 0]
+            publisher.mock.assert_called_with({"a": 1})
+
+    async def test_batch_pub_with_keys(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker(apply_types=True)
+
+        keys = []
+
+        @broker.subscriber(queue)
+        async def m(msg: KafkaMessage):
+            keys.append(msg.raw_message.key())
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch(1, 2, topic=queue, keys=[b"a", b"b"])
+
+        assert keys == [b"a", b"b"]
+
     async def test_batch_publisher_mock(
         self,
         queue: str,
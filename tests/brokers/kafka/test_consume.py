@@ -1,12 +1,14 @@
 import asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRecord
 
-from faststream.exceptions import AckMessage
+from faststream import context
+from faststream.exceptions import AckMessage, StopConsume
 from faststream.kafka import KafkaBroker, TopicPartition
 from faststream.kafka.annotations import KafkaMessage
+from faststream.kafka.subscriber.commit import OffsetsCommitManager
 from tests.brokers.base.consume import BrokerRealConsumeTestcase
 from tests.tools import spy_decorator
 
@@ -206,6 +208,47 @@ class TestConsume(BrokerRealConsumeTestcase):
 
         assert event.is_set()
 
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_consume_ack_manual_with_commit_manager(
+        self,
+        queue: str,
+        event: asyncio.Event,
+    ):
+        consume_broker = self.get_broker(apply_types=True)
+
+        @consume_broker.subscriber(
+            queue,
+            group_id="test",
+            auto_commit=False,
+            commit_interval_ms=100,
+            max_workers=2,
+        )
+        async def handler(msg: KafkaMessage):
+            await msg.ack()
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(
+                AIOKafkaConsumer, "commit", spy_decorator(AIOKafkaConsumer.commit)
+            ) as m:
+                await asyncio.wait(
+                    (
+                        asyncio.create_task(br.publish("hello", queue)),
+                        asyncio.create_task(event.wait()),
+                    ),
+                    timeout=10,
+                )
+                await asyncio.sleep(0.3)
+
+                m.mock.assert_called_once()
+                ((_, offsets), _) = m.mock.call_args
+                assert list(offsets.values()) == [1]
+
+        assert event.is_set()
+
     @pytest.mark.asyncio
     @pytest.mark.slow
     async def test_consume_ack_raise(
@@ -352,6 +395,56 @@ class TestConsume(BrokerRealConsumeTestcase):
         assert event2.is_set()
         assert mock.call_count == 2, mock.call_count
 
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_concurrent_consume_pause(self, queue: str, mock: MagicMock):
+        release = asyncio.Event()
+        paused = asyncio.Event()
+        done = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue, max_workers=2)
+        sub = consume_broker.subscriber(*args, **kwargs)
+
+        @sub
+        async def handler(msg):
+            await release.wait()
+            mock(msg)
+            if mock.call_count == 6:
+                done.set()
+
+        pauses, resumes = [], []
+        pause_consuming, resume_consuming = sub.pause_consuming, sub.resume_consuming
+
+        async def pause_spy() -> None:
+            pauses.append(sub.in_flight)
+            await pause_consuming()
+            paused.set()
+
+        async def resume_spy() -> None:
+            resumes.append(sub.in_flight)
+            await resume_consuming()
+
+        with patch.object(sub, "pause_consuming", pause_spy), patch.object(
+            sub, "resume_consuming", resume_spy
+        ):
+            async with self.patch_broker(consume_broker) as br:
+                await br.start()
+
+                for i in range(6):
+                    await br.publish(i, queue)
+
+                await asyncio.wait_for(paused.wait(), timeout=10)
+                release.set()
+                await asyncio.wait_for(done.wait(), timeout=10)
+
+                assert not sub.paused
+
+        assert (sub.high_watermark, sub.low_watermark) == (4, 2)
+        assert pauses[0] == sub.high_watermark, pauses
+        assert resumes[0] == sub.low_watermark, resumes
+
     @pytest.mark.asyncio
     async def test_consume_without_value(
         self,
@@ -405,3 +498,348 @@ class TestConsume(BrokerRealConsumeTestcase):
             )
 
             mock.assert_called_once_with([b""])
+
+    @pytest.mark.asyncio
+    async def test_consume_with_prefetch(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        consume_broker = self.get_broker()
+
+        event = asyncio.Event()
+
+        @consume_broker.subscriber(
+            queue, auto_offset_reset="earliest", prefetch_records=2
+        )
+        async def handler(msg):
+            mock(msg)
+            if mock.call_count == 5:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await br.publish_batch(*range(5), topic=queue)
+
+            await asyncio.wait(
+                (asyncio.create_task(event.wait()),),
+                timeout=10,
+            )
+
+        assert [c.args[0] for c in mock.call_args_list] == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_shared_consumer(
+        self,
+        queue: str,
+    ) -> None:
+        consume_broker = KafkaBroker(shared_consumers=True)
+
+        event = asyncio.Event()
+        event2 = asyncio.Event()
+
+        @consume_broker.subscriber(queue, group_id="test", auto_offset_reset="earliest")
+        async def handler(msg):
+            event.set()
+
+        @consume_broker.subscriber(
+            f"{queue}1", group_id="test", auto_offset_reset="earliest"
+        )
+        async def handler2(msg):
+            event2.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            sub, sub2 = br._subscribers.values()
+            assert sub.consumer is sub2.consumer
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish(1, queue)),
+                    asyncio.create_task(br.publish(1, f"{queue}1")),
+                    asyncio.create_task(event.wait()),
+                    asyncio.create_task(event2.wait()),
+                ),
+                timeout=10,
+            )
+
+        assert event.is_set()
+        assert event2.is_set()
+
+    @pytest.mark.asyncio
+    async def test_shared_consumer_slow_handler(
+        self,
+        queue: str,
+    ) -> None:
+        consume_broker = KafkaBroker(shared_consumers=True)
+
+        release = asyncio.Event()
+        event = asyncio.Event()
+
+        @consume_broker.subscriber(queue, group_id="test", auto_offset_reset="earliest")
+        async def handler(msg):
+            await release.wait()
+
+        @consume_broker.subscriber(
+            f"{queue}1", group_id="test", auto_offset_reset="earliest"
+        )
+        async def handler2(msg):
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await br.publish(1, queue)
+            await br.publish(1, f"{queue}1")
+
+            # the first subscriber handler doesn't block the second one
+            await asyncio.wait_for(event.wait(), timeout=10)
+            release.set()
+
+        assert event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_shared_consumer_stop_consume(
+        self,
+        queue: str,
+        event: asyncio.Event,
+    ) -> None:
+        consume_broker = KafkaBroker(shared_consumers=True)
+
+        @consume_broker.subscriber(queue, group_id="test", auto_offset_reset="earliest")
+        async def handler(msg):
+            event.set()
+            raise StopConsume()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            sub = next(iter(br._subscribers.values()))
+            consumer = sub.consumer
+
+            with patch.object(
+                AIOKafkaConsumer, "stop", spy_decorator(AIOKafkaConsumer.stop)
+            ) as m:
+                await asyncio.wait(
+                    (
+                        asyncio.create_task(br.publish(1, queue)),
+                        asyncio.create_task(event.wait()),
+                    ),
+                    timeout=10,
+                )
+                await asyncio.sleep(0.5)
+
+                m.mock.assert_called_once_with(consumer)
+
+            assert not sub.running
+
+        assert event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_shared_consumer_skips_manual_ack(
+        self,
+        queue: str,
+    ) -> None:
+        consume_broker = KafkaBroker(shared_consumers=True)
+
+        @consume_broker.subscriber(queue, group_id="test")
+        async def handler(msg): ...
+
+        @consume_broker.subscriber(f"{queue}1", group_id="test", auto_commit=False)
+        async def handler2(msg): ...
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            sub, sub2 = br._subscribers.values()
+            assert sub.consumer is not sub2.consumer
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_parallel_partitions_consume(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        event = asyncio.Event()
+        event2 = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            queue,
+            f"{queue}1",
+            group_id="test",
+            auto_offset_reset="earliest",
+            parallel_partitions=True,
+        )
+        async def handler(msg):
+            mock(msg)
+            if msg == "first":
+                event.set()
+                # blocks the first partition only
+                await asyncio.sleep(10)
+            else:
+                event2.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await br.publish("first", queue)
+            await br.publish("second", queue)
+            await br.publish("third", f"{queue}1")
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(event.wait()),
+                    asyncio.create_task(event2.wait()),
+                ),
+                timeout=10,
+            )
+
+        assert event.is_set()
+        assert event2.is_set()
+        # the second message is waiting for the first one at its partition
+        assert [c.args[0] for c in mock.call_args_list] == ["first", "third"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    async def test_parallel_partitions_pause(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        release = asyncio.Event()
+        done = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        sub = consume_broker.subscriber(
+            queue,
+            group_id="test",
+            auto_offset_reset="earliest",
+            parallel_partitions=True,
+        )
+        sub.partition_buffer_size = 2
+
+        @sub
+        async def handler(msg):
+            await release.wait()
+            mock(msg)
+            if mock.call_count == 5:
+                done.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(
+                sub, "pause_partition", spy_decorator(sub.pause_partition)
+            ) as pause, patch.object(
+                sub, "resume_partition", spy_decorator(sub.resume_partition)
+            ) as resume:
+                for i in range(5):
+                    await br.publish(i, queue, partition=0)
+
+                await asyncio.sleep(3)
+                # the fetch loop is not blocked by the full partition buffer
+                pause.mock.assert_called_with(TopicPartition(queue, 0))
+                assert not resume.mock.called
+
+                release.set()
+                await asyncio.wait_for(done.wait(), timeout=10)
+
+                resume.mock.assert_called_with(TopicPartition(queue, 0))
+
+        assert [c.args[0] for c in mock.call_args_list] == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_revoke_drops_prefetched(queue: str) -> None:
+    broker = KafkaBroker()
+
+    sub = broker.subscriber(
+        queue,
+        group_id="group",
+        prefetch_records=10,
+        auto_commit=False,
+        commit_interval_ms=1000,
+    )
+    sub.commit_manager.on_revoke = AsyncMock()
+
+    records = [
+        ConsumerRecord(queue, partition, offset, 0, 0, None, b"", None, 0, 0, ())
+        for partition in (0, 1)
+        for offset in range(2)
+    ]
+    sub._prefetched.extend(records)
+
+    await sub._make_listener().on_partitions_revoked([TopicPartition(queue, 0)])
+
+    assert list(sub._prefetched) == records[2:]
+
+
+@pytest.mark.asyncio
+async def test_revoke_keeps_autocommitted_prefetched(queue: str) -> None:
+    broker = KafkaBroker()
+
+    sub = broker.subscriber(queue, prefetch_records=10)
+
+    # aiokafka commits prefetched records positions before the revoke,
+    # so they must be processed here
+    assert sub._make_listener() is None
+
+
+@pytest.mark.asyncio
+async def test_nack_drops_prefetched(queue: str) -> None:
+    broker = KafkaBroker()
+
+    sub = broker.subscriber(queue, prefetch_records=10)
+    sub.consumer = MagicMock()
+
+    records = [
+        ConsumerRecord(queue, partition, offset, 0, 0, None, b"", None, 0, 0, ())
+        for partition in (0, 1)
+        for offset in range(3)
+    ]
+    sub._prefetched.extend(records[1:3] + records[3:])
+
+    with context.scope("handler_", sub):
+        message = await sub._parser(records[0])
+
+    await message.nack()
+
+    sub.consumer.seek.assert_called_once_with(
+        partition=TopicPartition(queue, 0), offset=0
+    )
+    assert list(sub._prefetched) == records[3:]
+
+
+@pytest.mark.asyncio
+async def test_commit_manager_skips_revoked(queue: str) -> None:
+    tp0, tp1 = TopicPartition(queue, 0), TopicPartition(queue, 1)
+
+    consumer = MagicMock()
+    consumer.assignment.return_value = {tp0, tp1}
+    consumer.commit = AsyncMock()
+
+    manager = OffsetsCommitManager(interval_ms=10_000, batch_size=100)
+    manager.consumer = consumer
+
+    records = [
+        ConsumerRecord(queue, partition, 0, 0, 0, None, b"", None, 0, 0, ())
+        for partition in (0, 1)
+    ]
+    for record in records:
+        manager.track(record)
+
+    consumer.assignment.return_value = {tp0}
+    await manager.on_revoke([tp1])
+
+    for record in records:
+        manager.ack(record)
+
+    await manager.commit()
+
+    consumer.commit.assert_awaited_once_with({tp0: 1})
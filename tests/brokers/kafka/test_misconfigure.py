@@ -1,7 +1,10 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from faststream.exceptions import SetupError
 from faststream.kafka import KafkaBroker
+from faststream.kafka.publisher.producer import AioKafkaFastProducer
 
 
 def test_max_workers_with_manual(queue: str) -> None:
@@ -9,3 +12,53 @@ def test_max_workers_with_manual(queue: str) -> None:
 
     with pytest.raises(SetupError):
         broker.subscriber(queue, max_workers=3, auto_commit=False)
+
+
+def test_parallel_partitions_with_max_workers(queue: str) -> None:
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, max_workers=3, parallel_partitions=True)
+
+
+def test_parallel_partitions_with_batch(queue: str) -> None:
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, batch=True, parallel_partitions=True)
+
+
+def test_wrong_prefetch_records(queue: str) -> None:
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, prefetch_records=0)
+
+
+def test_commit_interval_with_auto_commit(queue: str) -> None:
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, commit_interval_ms=100)
+
+
+def test_max_workers_with_commit_manager(queue: str) -> None:
+    broker = KafkaBroker()
+
+    broker.subscriber(
+        queue,
+        group_id="test",
+        max_workers=3,
+        auto_commit=False,
+        commit_interval_ms=100,
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_keys_mismatch() -> None:
+    producer = AioKafkaFastProducer(MagicMock(), parser=None, decoder=None)
+
+    with pytest.raises(ValueError, match="key for each"):
+        await producer.publish_batch(
+            1, 2, correlation_id="1", topic="test", keys=[b"1"]
+        )
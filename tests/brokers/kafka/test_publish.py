@@ -5,6 +5,7 @@ import pytest
 
 from faststream import Context
 from faststream.kafka import KafkaBroker, KafkaResponse
+from faststream.kafka.annotations import KafkaMessage
 from tests.brokers.base.publish import BrokerPublishTestcase
 
 
@@ -133,3 +134,89 @@ class TestPublish(BrokerPublishTestcase):
             body=b"1",
             key=b"1",
         )
+
+    @pytest.mark.asyncio
+    async def test_publish_many(self, queue: str, mock: Mock):
+        pub_broker = self.get_broker()
+
+        event = asyncio.Event()
+
+        @pub_broker.subscriber(queue, auto_offset_reset="earliest")
+        async def handler(msg):
+            mock(msg)
+            if mock.call_count == 10:
+                event.set()
+
+        publisher = pub_broker.publisher(queue, partition=0)
+
+        async def source():
+            for i in range(10):
+                yield i
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            result = await publisher.publish_many(source(), max_in_flight=3)
+
+            await asyncio.wait(
+                (asyncio.create_task(event.wait()),),
+                timeout=3,
+            )
+
+        assert [r.offset for r in result] == list(range(10))
+        assert [c.args[0] for c in mock.call_args_list] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_with_keys(self, queue: str, mock: Mock):
+        pub_broker = self.get_broker(apply_types=True)
+
+        event = asyncio.Event()
+
+        @pub_broker.subscriber(queue, auto_offset_reset="earliest")
+        async def handler(msg: KafkaMessage):
+            mock(msg.raw_message.key)
+            if mock.call_count == 2:
+                event.set()
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            await br.publish_batch(1, 2, topic=queue, keys=[b"a", b"b"])
+
+            await asyncio.wait(
+                (asyncio.create_task(event.wait()),),
+                timeout=3,
+            )
+
+        assert {c.args[0] for c in mock.call_args_list} == {b"a", b"b"}
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_with_str_keys(self, queue: str, mock: Mock):
+        pub_broker = self.get_broker(apply_types=True)
+
+        event = asyncio.Event()
+
+        @pub_broker.subscriber(queue, auto_offset_reset="earliest")
+        async def handler(msg: KafkaMessage):
+            mock(msg.raw_message.key, msg.raw_message.partition)
+            if mock.call_count == 2:
+                event.set()
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            await br.publish_batch(1, 2, topic=queue, keys=["a", "a"])
+
+            await asyncio.wait(
+                (asyncio.create_task(event.wait()),),
+                timeout=3,
+            )
+
+            partition = br._producer._producer._partition(
+                queue, None, b"a", None, b"a", None
+            )
+
+        assert [c.args for c in mock.call_args_list] == [
+            (b"a", partition),
+            (b"a", partition),
+        ]
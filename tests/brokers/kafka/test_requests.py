@@ -1,7 +1,11 @@
+import asyncio
+
 import pytest
+from aiokafka import ConsumerRecord
 
 from faststream import BaseMiddleware
 from faststream.kafka import KafkaBroker, KafkaRouter, TestKafkaBroker
+from faststream.kafka.publisher.reply import RepliesConsumer
 from tests.brokers.base.requests import RequestsTestcase
 
 
@@ -15,7 +19,7 @@ class Mid(BaseMiddleware):
 
 
 @pytest.mark.asyncio
-class TestRequestTestClient(RequestsTestcase):
+class KafkaRequestsTestcase(RequestsTestcase):
     def get_middleware(self, **kwargs):
         return Mid
 
@@ -25,5 +29,83 @@ class TestRequestTestClient(RequestsTestcase):
     def get_router(self, **kwargs):
         return KafkaRouter(**kwargs)
 
+    async def test_concurrent_requests(self, queue: str):
+        broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(msg: int) -> int:
+            await asyncio.sleep(0.01 * (5 - msg))
+            return msg * 10
+
+        async with self.patch_broker(broker):
+            await broker.start()
+
+            responses = await asyncio.gather(
+                *(
+                    broker.request(
+                        i, queue, timeout=self.timeout, correlation_id=str(i)
+                    )
+                    for i in range(5)
+                )
+            )
+
+        for i, response in enumerate(responses):
+            assert response.correlation_id == str(i)
+            assert await response.decode() == i * 10
+
+
+@pytest.mark.kafka
+class TestRealRequests(KafkaRequestsTestcase):
+    pass
+
+
+class TestRequestTestClient(KafkaRequestsTestcase):
     def patch_broker(self, broker, **kwargs):
         return TestKafkaBroker(broker, **kwargs)
+
+
+def _reply(correlation_id: str) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic="replies",
+        partition=0,
+        offset=0,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=b"",
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=[("correlation_id", correlation_id.encode())],
+    )
+
+
+@pytest.mark.asyncio
+class TestRepliesConsumer:
+    def get_replies(self) -> RepliesConsumer:
+        return RepliesConsumer(topic="replies", builder=None, producer=None)
+
+    async def test_resolve_by_correlation_id(self):
+        replies = self.get_replies()
+
+        with replies.wait("1") as first, replies.wait("2") as second:
+            replies.resolve(_reply("2"))
+
+            assert not first.done()
+            assert (await second).headers == [("correlation_id", b"2")]
+
+    async def test_orphaned_reply_dropped(self):
+        replies = self.get_replies()
+
+        with replies.wait("1") as response:
+            pass
+
+        replies.resolve(_reply("1"))
+
+        assert not response.done()
+        assert not replies._futures
+
+    async def test_default_reply_topic_is_stable(self):
+        assert KafkaBroker()._reply_topic == KafkaBroker()._reply_topic
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from unittest.mock import patch
 
 import pytest
@@ -143,6 +144,139 @@ class TestTestclient(BrokerTestclientTestcase):
             await br.publish_batch("hello", topic=queue)
             m.mock.assert_called_once_with(["hello"])
 
+    async def test_batch_pub_mixed_content_types(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg):
+            pass
+
+        async with TestKafkaBroker(broker) as br:
+            await br.publish_batch({"a": 1}, "hello", b"raw", topic=queue)
+            m.mock.assert_called_once_with([{"a": 1}, "hello", b"raw"])
+
+    async def test_batch_pub_json(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg):
+            pass
+
+        async with TestKafkaBroker(broker) as br:
+            await br.publish_batch({"a": 1}, [1, 2], topic=queue)
+            m.mock.assert_called_once_with([{"a": 1}, [1, 2]])
+
+    @pytest.mark.parametrize(
+        "bodies",
+        [
+            pytest.param((b"1,2", b"3"), id="split"),
+            pytest.param((b"1,2", b"[3", b"4]"), id="split and merged"),
+            pytest.param((b'"a', b'b"'), id="string"),
+        ],
+    )
+    async def test_batch_pub_malformed_json(
+        self,
+        queue: str,
+        bodies,
+    ):
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg):
+            pass
+
+        async with TestKafkaBroker(broker) as br:
+            with pytest.raises(json.JSONDecodeError):
+                await br.publish_batch(
+                    *bodies,
+                    topic=queue,
+                    headers={"content-type": "application/json"},
+                )
+
+            assert not m.mock.called
+
+    async def test_publish_many(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def m(msg):
+            pass
+
+        publisher = broker.publisher(queue)
+
+        async with TestKafkaBroker(broker):
+            result = await publisher.publish_many(["hello", {"a": 1}], max_in_flight=1)
+
+            assert [m.mock.call_args_list[i].args[0] for i in range(2)] == [
+                "hello",
+                {"a": 1},
+            ]
+            assert [r.offset for r in result] == [0, 0]
+            publisher.mock.assert_called_with({"a": 1})
+
+    async def test_publish_many_empty_window(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+        publisher = broker.publisher(queue)
+
+        async with TestKafkaBroker(broker):
+            with pytest.raises(ValueError, match="max_in_flight must be >= 1"):
+                await publisher.publish_many(["hello"], max_in_flight=0)
+
+    async def test_publish_many_middleware_scope(
+        self,
+        queue: str,
+    ):
+        results = []
+
+        class Middleware(BaseMiddleware):
+            async def publish_scope(self, call_next, msg, *args, **kwargs):
+                result = await super().publish_scope(call_next, msg, *args, **kwargs)
+                results.append(result)
+                return result
+
+        broker = KafkaBroker(middlewares=(Middleware,))
+
+        @broker.subscriber(queue)
+        async def m(msg):
+            pass
+
+        publisher = broker.publisher(queue)
+
+        async with TestKafkaBroker(broker):
+            metadata = await publisher.publish_many([1, 2])
+
+        # middleware scope covers the delivery, not only the enqueue
+        assert results == metadata
+
+    async def test_batch_pub_with_keys(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker(apply_types=True)
+
+        keys = []
+
+        @broker.subscriber(queue)
+        async def m(msg: KafkaMessage):
+            keys.append(msg.raw_message.key)
+
+        async with TestKafkaBroker(broker) as br:
+            await br.publish_batch(1, 2, topic=queue, keys=[b"a", b"b"])
+
+        assert keys == [b"a", b"b"]
+
     async def test_batch_publisher_mock(
         self,
         queue: str,
@@ -1,11 +1,13 @@
 import asyncio
-from typing import List
-from unittest.mock import MagicMock, patch
+from typing import Dict, List, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from redis.asyncio import Redis
 
 from faststream.redis import ListSub, PubSub, RedisBroker, RedisMessage, StreamSub
+from faststream.redis.message import RedisStreamMessage
+from faststream.redis.subscriber.ack import StreamAckBatcher
 from tests.brokers.base.consume import BrokerRealConsumeTestcase
 from tests.tools import spy_decorator
 
@@ -42,6 +44,34 @@ class TestConsume(BrokerRealConsumeTestcase):
 
         mock.assert_called_once_with(b"hello")
 
+    async def test_consume_socket_timeout(
+        self,
+        event: asyncio.Event,
+        mock: MagicMock,
+        queue: str,
+    ):
+        # PubSub reader outlives idle reads longer than the socket timeout
+        consume_broker = RedisBroker(socket_timeout=0.1)
+
+        @consume_broker.subscriber(queue)
+        async def handler(msg):
+            mock(msg)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+            await asyncio.sleep(0.5)
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br._connection.publish(queue, "hello")),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=3,
+            )
+
+        mock.assert_called_once_with(b"hello")
+
     async def test_pattern_with_path(
         self,
         event: asyncio.Event,
@@ -67,6 +97,34 @@ class TestConsume(BrokerRealConsumeTestcase):
 
         mock.assert_called_once_with("hello")
 
+    async def test_shared_pubsub_connection(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ):
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(queue)
+        async def handler(msg):
+            mock.first(msg)
+
+        @consume_broker.subscriber(PubSub(f"{queue}.*", pattern=True))
+        async def pattern_handler(msg):
+            mock.pattern(msg)
+
+        with patch.object(Redis, "pubsub", spy_decorator(Redis.pubsub)) as m:
+            async with self.patch_broker(consume_broker) as br:
+                await br.start()
+
+                await br.publish("hello", queue)
+                await br.publish("hi", f"{queue}.1")
+
+                await asyncio.sleep(0.5)
+
+        m.mock.assert_called_once()
+        mock.first.assert_called_once_with("hello")
+        mock.pattern.assert_called_once_with("hi")
+
     async def test_pattern_without_path(
         self,
         event: asyncio.Event,
@@ -342,6 +400,91 @@ class TestConsumeList:
             assert message is not None
             assert await message.decode() == "test_message"
 
+    async def test_consume_list_blocking(
+        self,
+        queue: str,
+        event: asyncio.Event,
+        mock: MagicMock,
+    ):
+        consume_broker = self.get_broker()
+
+        # message is delivered right away, not after the idle timeout
+        @consume_broker.subscriber(list=ListSub(queue, polling_interval=30))
+        async def handler(msg):
+            mock(msg)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+            await asyncio.sleep(0.1)
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("hello", list=queue)),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=3,
+            )
+
+        mock.assert_called_once_with("hello")
+
+    async def test_consume_list_socket_timeout(
+        self,
+        queue: str,
+        event: asyncio.Event,
+        mock: MagicMock,
+    ):
+        # idle pops are longer than the broker socket timeout
+        consume_broker = RedisBroker(socket_timeout=0.1)
+
+        @consume_broker.subscriber(list=ListSub(queue, polling_interval=0.5))
+        async def handler(msg):
+            mock(msg)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+            await asyncio.sleep(1.0)
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("hello", list=queue)),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=3,
+            )
+
+        mock.assert_called_once_with("hello")
+
+    async def test_consume_list_batch_blocking(
+        self,
+        queue: str,
+        event: asyncio.Event,
+        mock: MagicMock,
+    ):
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(
+            list=ListSub(queue, batch=True, max_records=5, polling_interval=30)
+        )
+        async def handler(msg):
+            mock(msg)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+            await asyncio.sleep(0.1)
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("hello", list=queue)),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=3,
+            )
+
+        mock.assert_called_once_with(["hello"])
+
     async def test_get_one_timeout(
         self,
         queue: str,
@@ -357,6 +500,38 @@ class TestConsumeList:
             mock.assert_called_once_with(None)
 
 
+@pytest.mark.asyncio
+class TestListBlockingClient:
+    async def test_read_timeout(self) -> None:
+        broker = RedisBroker(socket_timeout=0.5)
+        subscriber = broker.subscriber(list=ListSub("test", polling_interval=2))
+
+        await broker.connect()
+        await subscriber.start()
+
+        try:
+            pool = subscriber._blocking_client.connection_pool
+            assert pool.connection_kwargs["socket_timeout"] == 2.5
+            assert pool.max_connections == 1
+        finally:
+            await subscriber.close()
+            await broker.close()
+
+    async def test_no_socket_timeout(self) -> None:
+        broker = RedisBroker()
+        subscriber = broker.subscriber(list=ListSub("test", polling_interval=2))
+
+        await broker.connect()
+        await subscriber.start()
+
+        try:
+            pool = subscriber._blocking_client.connection_pool
+            assert pool.connection_kwargs.get("socket_timeout") is None
+        finally:
+            await subscriber.close()
+            await broker.close()
+
+
 @pytest.mark.redis
 @pytest.mark.asyncio
 class TestConsumeStream:
@@ -638,6 +813,142 @@ class TestConsumeStream:
 
         assert event.is_set()
 
+    async def test_concurrent_consume(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ):
+        event = asyncio.Event()
+        event2 = asyncio.Event()
+
+        consume_broker = self.get_broker()
+
+        @consume_broker.subscriber(stream=queue, max_workers=2)
+        async def handler(msg):
+            mock()
+            if event.is_set():
+                event2.set()
+            else:
+                event.set()
+
+            await asyncio.sleep(0.1)
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            for i in range(5):
+                await br.publish(i, stream=queue)
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(event.wait()),
+                    asyncio.create_task(event2.wait()),
+                ),
+                timeout=3,
+            )
+
+            assert event.is_set()
+            assert event2.is_set()
+            assert mock.call_count == 2, mock.call_count
+
+    async def test_concurrent_consume_batch_ack(
+        self,
+        queue: str,
+    ):
+        consume_broker = self.get_broker()
+
+        consumed = asyncio.Queue()
+
+        @consume_broker.subscriber(
+            stream=StreamSub(queue, group="group", consumer=queue, max_records=3),
+            max_workers=3,
+        )
+        async def handler(msg):
+            await consumed.put(msg)
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(Redis, "xack", spy_decorator(Redis.xack)) as m:
+                await br._connection.xadd(queue, {"__data__": b"0"})
+                await br._connection.xadd(queue, {"__data__": b"1"})
+                await br._connection.xadd(queue, {"__data__": b"2"})
+
+                await asyncio.wait_for(
+                    asyncio.gather(*(consumed.get() for _ in range(3))),
+                    timeout=3,
+                )
+                await asyncio.sleep(0.3)
+
+                m.mock.assert_called_once()
+                assert len(m.mock.call_args.args) == 6  # self, stream, group, 3 ids
+
+            pending = await br._connection.xpending(queue, "group")
+            assert pending["pending"] == 0
+
+    async def test_claim_pending(
+        self,
+        queue: str,
+        event: asyncio.Event,
+        mock: MagicMock,
+    ):
+        consume_broker = self.get_broker(apply_types=True)
+
+        @consume_broker.subscriber(
+            stream=StreamSub(queue, group="group", consumer="alive", min_idle_time=1000)
+        )
+        async def handler(msg):
+            mock(msg)
+            event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            # entry delivered to crashed consumer
+            await br._connection.xgroup_create(queue, "group", id="0", mkstream=True)
+            await br.publish("hello", stream=queue)
+            await br._connection.xreadgroup("group", "crashed", {queue: ">"})
+
+            await br.start()
+
+            await asyncio.wait((asyncio.create_task(event.wait()),), timeout=3)
+
+            mock.assert_called_once_with("hello")
+
+            await asyncio.sleep(0.1)
+            pending = await br._connection.xpending(queue, "group")
+            assert pending["pending"] == 0
+
+    async def test_claim_pending_max_deliveries(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ):
+        consume_broker = self.get_broker(apply_types=True)
+
+        @consume_broker.subscriber(
+            stream=StreamSub(
+                queue,
+                group="group",
+                consumer="alive",
+                min_idle_time=1000,
+                max_deliveries=1,
+            )
+        )
+        async def handler(msg):
+            mock(msg)
+
+        async with self.patch_broker(consume_broker) as br:
+            await br._connection.xgroup_create(queue, "group", id="0", mkstream=True)
+            await br.publish("hello", stream=queue)
+            await br._connection.xreadgroup("group", "crashed", {queue: ">"})
+
+            await br.start()
+            await asyncio.sleep(1.5)
+
+            pending = await br._connection.xpending(queue, "group")
+            assert pending["pending"] == 0
+
+        assert not mock.called
+
     async def test_get_one(
         self,
         queue: str,
@@ -682,3 +993,192 @@ class TestConsumeStream:
 
             mock(await subscriber.get_one(timeout=1e-24))
             mock.assert_called_once_with(None)
+
+
+class FakeAckConnection:
+    def __init__(self, fails: int = 0) -> None:
+        self.fails = fails
+        self.calls: List[tuple] = []
+        self.attempts = 0
+
+    async def xack(self, name, groupname, *ids):
+        self.attempts += 1
+
+        if self.fails:
+            self.fails -= 1
+            raise ConnectionError()
+
+        self.calls.append((name, groupname, *ids))
+        return len(ids)
+
+
+@pytest.mark.asyncio
+class TestStreamAckBatcher:
+    async def test_flush_by_size(self):
+        connection = FakeAckConnection()
+        acks = StreamAckBatcher(
+            connection, stream="stream", group="group", max_size=2, interval=10
+        )
+
+        acks.add([b"1"])
+        acks.add([b"2"])
+        acks.add([b"3"])
+        await asyncio.sleep(0)
+
+        assert connection.calls == [("stream", "group", b"1", b"2")]
+
+        await acks.close()
+        assert connection.calls[-1] == ("stream", "group", b"3")
+
+    async def test_flush_by_interval(self):
+        connection = FakeAckConnection()
+        acks = StreamAckBatcher(
+            connection, stream="stream", group="group", interval=0.01
+        )
+
+        acks.add([b"1"])
+        acks.add([b"2"])
+        await asyncio.sleep(0.05)
+
+        assert connection.calls == [("stream", "group", b"1", b"2")]
+
+    async def test_retry_failed(self):
+        connection = FakeAckConnection(fails=1)
+        acks = StreamAckBatcher(
+            connection, stream="stream", group="group", interval=0.01
+        )
+
+        acks.add([b"1"])
+        await asyncio.sleep(0.05)
+
+        assert connection.calls == [("stream", "group", b"1")]
+
+    async def test_retry_backoff(self):
+        connection = FakeAckConnection(fails=10**6)
+        acks = StreamAckBatcher(
+            connection,
+            stream="stream",
+            group="group",
+            max_size=1,
+            interval=0.01,
+            max_backoff=0.04,
+        )
+
+        acks.add([b"1"])
+        await asyncio.sleep(0)
+        # full batch doesn't bypass the backoff timer
+        acks.add([b"2"])
+        await asyncio.sleep(0.2)
+
+        assert 3 <= connection.attempts <= 8, connection.attempts
+
+        await acks.close()
+
+    async def test_close_drops_failed(self):
+        connection = FakeAckConnection(fails=10**6)
+        logger = MagicMock()
+        acks = StreamAckBatcher(
+            connection,
+            stream="stream",
+            group="group",
+            interval=0.01,
+            logger=logger,
+        )
+
+        acks.add([b"1"])
+        await asyncio.sleep(0.02)
+        await acks.close()
+
+        attempts = connection.attempts
+        logger.log.assert_called_once()
+        assert not acks._ids
+        assert not acks._tasks
+
+        await asyncio.sleep(0.05)
+        assert connection.attempts == attempts
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("claim_pending", "acked"), [(True, True), (False, False)])
+async def test_stream_reject_acks_claimed_only(claim_pending: bool, acked: bool):
+    redis = AsyncMock()
+    message = RedisStreamMessage(
+        raw_message={
+            "type": "stream",
+            "channel": "stream",
+            "message_ids": [b"1-0"],
+            "data": {},
+        },
+        body=b"",
+    )
+
+    await message.reject(redis=redis, group="group", claim_pending=claim_pending)
+
+    assert redis.xack.called is acked
+
+
+class FakeClaimPipeline:
+    def __init__(self, deliveries: Dict[bytes, int]) -> None:
+        self.deliveries = deliveries
+        self.ranges: List[Tuple[bytes, bytes, int]] = []
+
+    def xpending_range(self, *, min: bytes, max: bytes, count: int, **kwargs):
+        self.ranges.append((min, max, count))
+
+    async def execute(self):
+        return [
+            [{"message_id": message_id, "times_delivered": self.deliveries[message_id]}]
+            for message_id, _, _ in self.ranges
+        ]
+
+
+class FakeClaimClient:
+    def __init__(self, deliveries: Dict[bytes, int]) -> None:
+        self.pipe = FakeClaimPipeline(deliveries)
+        self.acked: List[bytes] = []
+
+    async def xautoclaim(self, **kwargs):
+        return b"3-0", [(b"1-0", {b"k": b"v"}), (b"2-0", {b"k": b"v"})], []
+
+    def pipeline(self, transaction: bool):
+        return self.pipe
+
+    async def xack(self, stream: str, group: str, *ids: bytes) -> None:
+        self.acked.extend(ids)
+
+
+class TestClaimPending:
+    def get_subscriber(self):
+        broker = RedisBroker()
+        return broker.subscriber(
+            stream=StreamSub(
+                "stream",
+                group="group",
+                consumer="consumer",
+                min_idle_time=1000,
+                max_deliveries=1,
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_deliveries_by_claimed_ids(self) -> None:
+        subscriber = self.get_subscriber()
+        client = FakeClaimClient({b"1-0": 2, b"2-0": 1})
+
+        result = await subscriber._claim_pending(client)
+
+        assert client.pipe.ranges == [(b"1-0", b"1-0", 1), (b"2-0", b"2-0", 1)]
+        assert client.acked == [b"1-0"]
+        assert result == ((b"stream", ((b"2-0", {b"k": b"v"}),)),)
+
+    def test_scan_alternates_with_reads(self) -> None:
+        subscriber = self.get_subscriber()
+        assert subscriber._claim_is_due()
+
+        subscriber._claim_cursor = "3-0"
+
+        subscriber._claimed_last = True
+        assert not subscriber._claim_is_due()
+
+        subscriber._claimed_last = False
+        assert subscriber._claim_is_due()
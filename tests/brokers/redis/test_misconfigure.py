@@ -0,0 +1,33 @@
+import pytest
+
+from faststream.exceptions import SetupError
+from faststream.redis import RedisBroker, StreamSub
+
+
+def test_max_workers_with_list(queue: str) -> None:
+    broker = RedisBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(list=queue, max_workers=3)
+
+
+def test_max_workers_with_batch_stream(queue: str) -> None:
+    broker = RedisBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber(stream=StreamSub(queue, batch=True), max_workers=3)
+
+
+def test_min_idle_time_without_group(queue: str) -> None:
+    with pytest.raises(SetupError):
+        StreamSub(queue, min_idle_time=1000)
+
+
+def test_max_deliveries_without_min_idle_time(queue: str) -> None:
+    with pytest.raises(SetupError):
+        StreamSub(queue, group="group", consumer="consumer", max_deliveries=3)
+
+
+def test_min_idle_time_lower_bound(queue: str) -> None:
+    with pytest.raises(SetupError):
+        StreamSub(queue, group="group", consumer="consumer", min_idle_time=100)
@@ -0,0 +1,233 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+from redis.exceptions import TimeoutError
+
+from faststream.redis import RedisBroker
+from faststream.redis.multiplexer import PubSubMultiplexer
+
+
+class FakePubSub:
+    def __init__(self) -> None:
+        self.channels: List[str] = []
+        self.messages: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        self.errors: List[Exception] = []
+
+    @property
+    def subscribed(self) -> bool:
+        return bool(self.channels)
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def psubscribe(self, pattern):
+        self.channels.append(pattern)
+
+    async def unsubscribe(self, channel):
+        self.channels.remove(channel)
+
+    async def punsubscribe(self, pattern):
+        self.channels.remove(pattern)
+
+    async def listen(self):
+        while self.subscribed:
+            if self.errors:
+                raise self.errors.pop(0)
+            yield await self.messages.get()
+
+    async def aclose(self):
+        pass
+
+    def publish(self, channel: str, data: bytes, pattern: Optional[str] = None) -> None:
+        self.messages.put_nowait(
+            {
+                "type": "pmessage" if pattern else "message",
+                "channel": channel.encode(),
+                "pattern": pattern.encode() if pattern else None,
+                "data": data,
+            }
+        )
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.pubsubs: List[FakePubSub] = []
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> FakePubSub:
+        assert ignore_subscribe_messages
+        self.pubsubs.append(psub := FakePubSub())
+        return psub
+
+
+@pytest.mark.asyncio
+class TestPubSubMultiplexer:
+    async def test_single_connection(self):
+        connection = FakeConnection()
+        pubsub = PubSubMultiplexer(connection)
+
+        first = await pubsub.subscribe("first")
+        second = await pubsub.subscribe("second")
+        pattern = await pubsub.subscribe("first.*", pattern=True)
+
+        (psub,) = connection.pubsubs
+        assert psub.channels == ["first", "second", "first.*"]
+
+        psub.publish("second", b"1")
+        psub.publish("first.a", b"2", pattern="first.*")
+
+        assert (await asyncio.wait_for(second.get(), 1))["data"] == b"1"
+        assert (await asyncio.wait_for(pattern.get(), 1)) == {
+            "type": "pmessage",
+            "channel": "first.a",
+            "pattern": b"first.*",
+            "data": b"2",
+        }
+        assert first.empty()
+
+        await pubsub.close()
+
+    async def test_same_channel_queues(self):
+        connection = FakeConnection()
+        pubsub = PubSubMultiplexer(connection)
+
+        first = await pubsub.subscribe("channel")
+        second = await pubsub.subscribe("channel")
+
+        (psub,) = connection.pubsubs
+        assert psub.channels == ["channel"]
+
+        psub.publish("channel", b"1")
+        assert (await asyncio.wait_for(first.get(), 1))["data"] == b"1"
+        assert (await asyncio.wait_for(second.get(), 1))["data"] == b"1"
+
+        await pubsub.unsubscribe("channel", first)
+        assert psub.channels == ["channel"]
+
+        await pubsub.unsubscribe("channel", second)
+        assert psub.channels == []
+
+        await pubsub.close()
+
+    async def test_resubscribe_restarts_reader(self):
+        connection = FakeConnection()
+        pubsub = PubSubMultiplexer(connection)
+
+        queue = await pubsub.subscribe("channel")
+
+        await pubsub.unsubscribe("channel", queue)
+        await asyncio.sleep(0.01)
+        assert pubsub._task.done()
+
+        queue = await pubsub.subscribe("channel")
+        (psub,) = connection.pubsubs
+
+        psub.publish("channel", b"1")
+        assert (await asyncio.wait_for(queue.get(), 1))["data"] == b"1"
+
+        await pubsub.close()
+
+    async def test_full_queue_not_blocks_reader(self):
+        connection = FakeConnection()
+        logger = MagicMock()
+        pubsub = PubSubMultiplexer(connection, buffer_size=2, logger=logger)
+
+        slow = await pubsub.subscribe("slow")
+        fast = await pubsub.subscribe("fast")
+        (psub,) = connection.pubsubs
+
+        for i in range(5):
+            psub.publish("slow", str(i).encode())
+        psub.publish("fast", b"1")
+
+        assert (await asyncio.wait_for(fast.get(), 1))["data"] == b"1"
+
+        assert [slow.get_nowait()["data"] for _ in range(slow.qsize())] == [
+            b"0",
+            b"1",
+        ]
+        logger.log.assert_called_once()
+
+        await pubsub.close()
+
+    async def test_subscription_buffer_size(self):
+        connection = FakeConnection()
+        pubsub = PubSubMultiplexer(connection, buffer_size=2)
+
+        default = await pubsub.subscribe("default")
+        custom = await pubsub.subscribe("custom", buffer_size=5)
+
+        assert default.maxsize == 2
+        assert custom.maxsize == 5
+
+        await pubsub.close()
+
+    async def test_dropped_counted(self):
+        connection = FakeConnection()
+        logger = MagicMock()
+        pubsub = PubSubMultiplexer(connection, buffer_size=1, logger=logger)
+
+        queue = await pubsub.subscribe("channel")
+        (psub,) = connection.pubsubs
+
+        for i in range(4):
+            psub.publish("channel", str(i).encode())
+        await asyncio.sleep(0.01)
+
+        assert pubsub.dropped == 3
+        logger.log.assert_called_once()
+
+        queue.get_nowait()
+        psub.publish("channel", b"4")
+        assert (await asyncio.wait_for(queue.get(), 1))["data"] == b"4"
+
+        assert logger.log.call_count == 2
+        assert "3 messages were dropped" in logger.log.call_args.args[1]
+
+        await pubsub.close()
+
+    async def test_socket_timeout_keeps_reading(self):
+        connection = FakeConnection()
+        logger = MagicMock()
+        pubsub = PubSubMultiplexer(connection, logger=logger)
+
+        queue = await pubsub.subscribe("channel")
+        (psub,) = connection.pubsubs
+        psub.errors = [TimeoutError(), TimeoutError()]
+
+        psub.publish("channel", b"1")
+
+        assert (await asyncio.wait_for(queue.get(), 0.5))["data"] == b"1"
+        assert not psub.errors
+        assert not logger.log.called
+
+        await pubsub.close()
+
+    async def test_error_restarts_reader(self):
+        connection = FakeConnection()
+        logger = MagicMock()
+        pubsub = PubSubMultiplexer(connection, logger=logger)
+
+        queue = await pubsub.subscribe("channel")
+        (psub,) = connection.pubsubs
+        psub.errors = [RuntimeError()]
+
+        psub.publish("channel", b"1")
+
+        assert (await asyncio.wait_for(queue.get(), 3))["data"] == b"1"
+        logger.log.assert_called_once()
+
+        await pubsub.close()
+
+
+@pytest.mark.asyncio
+async def test_broker_buffer_size():
+    broker = RedisBroker(pubsub_buffer_size=10)
+
+    await broker.connect()
+
+    try:
+        assert broker._pubsub.buffer_size == 10
+    finally:
+        await broker.close()
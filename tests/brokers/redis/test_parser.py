@@ -1,9 +1,260 @@
 import pytest
 
-from faststream.redis import RedisBroker
+from faststream import Header
+from faststream.exceptions import SetupError
+from faststream.redis import RedisBroker, StreamSub, TestRedisBroker
+from faststream.redis.parser import (
+    BinaryMessageFormatV1,
+    JSONMessageFormat,
+    MessageFormat,
+    RawMessage,
+    RedisStreamParser,
+)
 from tests.brokers.base.parser import CustomParserTestcase
 
 
 @pytest.mark.redis
 class TestCustomParser(CustomParserTestcase):
     broker_class = RedisBroker
+
+
+class TestMessageFormat:
+    def test_abstract(self) -> None:
+        class EncodeOnly(MessageFormat):
+            @classmethod
+            def encode(cls, data, headers) -> bytes:
+                return data
+
+        with pytest.raises(TypeError):
+            EncodeOnly()
+
+    @pytest.mark.parametrize(
+        "message_format",
+        [JSONMessageFormat, BinaryMessageFormatV1],
+    )
+    def test_detected(self, message_format) -> None:
+        data = RawMessage.encode(
+            message=b"hello",
+            reply_to="reply",
+            headers={"custom": "1"},
+            correlation_id="1",
+            message_format=message_format,
+        )
+
+        body, headers = RawMessage.parse(data)
+
+        assert body == b"hello"
+        assert headers == {
+            "correlation_id": "1",
+            "reply_to": "reply",
+            "custom": "1",
+        }
+
+    def test_binary_body_kept(self) -> None:
+        payload = bytes(range(256))
+
+        data = RawMessage.encode(
+            message=payload,
+            reply_to=None,
+            headers=None,
+            correlation_id="1",
+            message_format=BinaryMessageFormatV1,
+        )
+
+        assert data.endswith(payload)
+        assert RawMessage.parse(data)[0] == payload
+
+    def test_json_body_not_escaped(self) -> None:
+        data = RawMessage.encode(
+            message={"key": "value"},
+            reply_to=None,
+            headers=None,
+            correlation_id="1",
+            message_format=BinaryMessageFormatV1,
+        )
+
+        assert data.endswith(b'{"key":"value"}')
+
+    @pytest.mark.parametrize(
+        "data",
+        [b"raw message", b"\x89FST", b'{"data": "no headers"}'],
+    )
+    def test_raw_message(self, data: bytes) -> None:
+        assert RawMessage.parse(data) == (data, {})
+
+
+@pytest.mark.asyncio
+class TestBinaryFormatTestClient:
+    async def test_binary_message(self, queue: str) -> None:
+        broker = RedisBroker(message_format=BinaryMessageFormatV1)
+
+        @broker.subscriber(list=queue)
+        async def handler(m: bytes) -> None: ...
+
+        payload = bytes(range(256))
+
+        async with TestRedisBroker(broker) as br:
+            await br.publish(payload, list=queue, headers={"custom": "1"})
+
+            handler.mock.assert_called_once_with(payload)
+
+
+class TestNativeStreamFields:
+    def test_encode(self) -> None:
+        fields = RawMessage.encode_stream_fields(
+            message={"key": "value"},
+            reply_to=None,
+            headers={"custom": "1"},
+            correlation_id="1",
+        )
+
+        assert fields == {
+            "correlation_id": "1",
+            "content-type": "application/json",
+            "custom": "1",
+            "__data__": b'{"key":"value"}',
+        }
+
+    def test_parse(self) -> None:
+        body, headers, _ = RedisStreamParser._parse_data(
+            {
+                "data": {
+                    b"correlation_id": b"1",
+                    b"custom": b"1",
+                    b"__data__": b"\xff\x00",
+                },
+            }
+        )
+
+        assert body == b"\xff\x00"
+        assert headers == {"correlation_id": "1", "custom": "1"}
+
+    def test_json_headers(self) -> None:
+        fields = RawMessage.encode_stream_fields(
+            message=b"",
+            reply_to=None,
+            headers={"retry": 1, "flags": {"a": [True, None]}},
+            correlation_id="1",
+        )
+
+        assert fields["retry"] == b"1"
+        assert fields["__json_headers__"] == b'["retry","flags"]'
+
+        _, headers, _ = RedisStreamParser._parse_data(
+            {
+                "data": {
+                    k.encode(): v if isinstance(v, bytes) else v.encode()
+                    for k, v in fields.items()
+                },
+            }
+        )
+
+        assert headers["retry"] == 1
+        assert headers["flags"] == {"a": [True, None]}
+        assert "__json_headers__" not in headers
+
+    def test_parse_undecodable_headers(self) -> None:
+        _, headers, _ = RedisStreamParser._parse_data(
+            {
+                "data": {
+                    b"custom": b"\xff",
+                    b"retry": b"\xfe1",
+                    b"__json_headers__": b'["retry"]',
+                    b"__data__": b"",
+                },
+            }
+        )
+
+        assert headers == {"custom": "\ufffd", "retry": "\ufffd1"}
+
+    def test_parse_malformed_json_headers(self) -> None:
+        _, headers, _ = RedisStreamParser._parse_data(
+            {
+                "data": {
+                    b"custom": b"1",
+                    b"__json_headers__": b"[",
+                    b"__data__": b"",
+                },
+            }
+        )
+
+        assert headers == {"custom": "1"}
+
+    @pytest.mark.parametrize("header", ["__data__", "__json_headers__"])
+    def test_reserved_header(self, header: str) -> None:
+        with pytest.raises(SetupError):
+            RawMessage.encode_stream_fields(
+                message=b"",
+                reply_to=None,
+                headers={header: "1"},
+                correlation_id="1",
+            )
+
+    def test_parse_envelope(self) -> None:
+        data = RawMessage.encode(
+            message=b"hello",
+            reply_to=None,
+            headers=None,
+            correlation_id="1",
+        )
+
+        body, headers, _ = RedisStreamParser._parse_data({"data": {b"__data__": data}})
+
+        assert body == b"hello"
+        assert headers["correlation_id"] == "1"
+
+
+@pytest.mark.asyncio
+class TestNativeStreamFieldsTestClient:
+    async def test_stream(self, queue: str) -> None:
+        broker = RedisBroker(native_stream_fields=True)
+
+        @broker.subscriber(stream=queue)
+        async def handler(m: dict, custom: str = Header()) -> None: ...
+
+        async with TestRedisBroker(broker) as br:
+            await br.publish({"key": "value"}, stream=queue, headers={"custom": "1"})
+
+            handler.mock.assert_called_once_with({"key": "value"})
+
+    async def test_typed_header(self, queue: str) -> None:
+        broker = RedisBroker(native_stream_fields=True)
+
+        @broker.subscriber(stream=queue)
+        async def handler(m: str, retry=Header()) -> None:
+            assert retry == 1
+
+        async with TestRedisBroker(broker) as br:
+            await br.publish("hello", stream=queue, headers={"retry": 1})
+
+            handler.mock.assert_called_once_with("hello")
+
+    async def test_batch_stream(self, queue: str) -> None:
+        broker = RedisBroker(native_stream_fields=True)
+
+        @broker.subscriber(stream=StreamSub(queue, batch=True))
+        async def handler(m: list) -> None: ...
+
+        async with TestRedisBroker(broker) as br:
+            await br.publish({"key": "value"}, stream=queue)
+
+            handler.mock.assert_called_once_with([{"key": "value"}])
+
+
+@pytest.mark.redis
+@pytest.mark.asyncio
+class TestNativeStreamFieldsReal:
+    async def test_stream_fields(self, queue: str) -> None:
+        broker = RedisBroker(native_stream_fields=True)
+
+        async with broker:
+            await broker.publish(b"\xff\x00", stream=queue, headers={"custom": "1"})
+
+            ((_, fields),) = await broker._connection.xrange(queue)
+
+            assert fields[b"custom"] == b"1"
+            assert fields[b"__data__"] == b"\xff\x00"
+
+            body, headers, _ = RedisStreamParser._parse_data({"data": fields})
+            assert body == b"\xff\x00"
+            assert headers["custom"] == "1"
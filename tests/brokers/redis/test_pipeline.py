@@ -0,0 +1,125 @@
+import asyncio
+from typing import Any, List, Optional, Tuple
+
+import pytest
+from redis.exceptions import ResponseError
+
+from faststream.redis.publisher.pipeline import AutoPipeline
+
+
+class FakePipeline:
+    def __init__(self, connection: "FakeConnection") -> None:
+        self.connection = connection
+        self.commands: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def publish(self, channel, message):
+        self.commands.append(("publish", (channel, message)))
+
+    def rpush(self, name, *values):
+        self.commands.append(("rpush", (name, *values)))
+
+    def xadd(self, name, fields, maxlen=None):
+        self.commands.append(("xadd", (name, fields, maxlen)))
+
+    async def execute(self, raise_on_error=True):
+        self.connection.executed.append(self.commands)
+
+        if self.connection.error is not None:
+            raise self.connection.error
+
+        return [
+            ResponseError("WRONGTYPE") if args[0] == "wrong" else len(self.commands)
+            for _, args in self.commands
+        ]
+
+
+class FakeConnection:
+    def __init__(self, error: Optional[Exception] = None) -> None:
+        self.error = error
+        self.executed: List[List[Tuple[str, Tuple[Any, ...]]]] = []
+
+    def pipeline(self, transaction=True):
+        assert not transaction
+        return FakePipeline(self)
+
+
+@pytest.mark.asyncio
+class TestAutoPipeline:
+    async def test_coalesce_same_tick(self):
+        connection = FakeConnection()
+        pipeline = AutoPipeline(connection)
+
+        results = await asyncio.gather(
+            pipeline.publish("channel", b"1"),
+            pipeline.rpush("list", b"2"),
+            pipeline.xadd("stream", {"data": b"3"}),
+        )
+
+        assert results == [3, 3, 3]
+        assert len(connection.executed) == 1
+        assert [c for c, _ in connection.executed[0]] == ["publish", "rpush", "xadd"]
+
+    async def test_sequential_calls_not_delayed(self):
+        connection = FakeConnection()
+        pipeline = AutoPipeline(connection)
+
+        await pipeline.publish("channel", b"1")
+        await pipeline.publish("channel", b"2")
+
+        assert len(connection.executed) == 2
+
+    async def test_linger(self):
+        connection = FakeConnection()
+        pipeline = AutoPipeline(connection, linger=0.05)
+
+        async def delayed():
+            await asyncio.sleep(0.01)
+            return await pipeline.publish("channel", b"2")
+
+        await asyncio.gather(pipeline.publish("channel", b"1"), delayed())
+
+        assert len(connection.executed) == 1
+
+    async def test_max_commands(self):
+        connection = FakeConnection()
+        pipeline = AutoPipeline(connection, max_commands=2)
+
+        await asyncio.gather(*(pipeline.publish("channel", b"") for _ in range(5)))
+
+        assert [len(c) for c in connection.executed] == [2, 2, 1]
+
+    async def test_command_error_per_caller(self):
+        connection = FakeConnection()
+        pipeline = AutoPipeline(connection)
+
+        results = await asyncio.gather(
+            pipeline.rpush("wrong", b"1"),
+            pipeline.rpush("list", b"2"),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], ResponseError)
+        assert results[1] == 2
+
+    async def test_execute_error_to_all_callers(self):
+        connection = FakeConnection(error=ConnectionError("lost"))
+        pipeline = AutoPipeline(connection)
+
+        results = await asyncio.gather(
+            pipeline.publish("channel", b"1"),
+            pipeline.publish("channel", b"2"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    async def test_close_flushes_pending(self):
+        connection = FakeConnection()
+        pipeline = AutoPipeline(connection, linger=10)
+
+        task = asyncio.create_task(pipeline.publish("channel", b"1"))
+        await asyncio.sleep(0)
+
+        await pipeline.close()
+
+        assert (await task) == 1
@@ -75,6 +75,34 @@ class TestPublish(BrokerPublishTestcase):
 
         assert {1, "hi"} == {r.result() for r in result}
 
+    async def test_auto_pipeline_publish(
+        self,
+        queue: str,
+    ):
+        pub_broker = RedisBroker(auto_pipeline=True)
+
+        msgs_queue = asyncio.Queue(maxsize=10)
+
+        @pub_broker.subscriber(list=queue)
+        async def handler(msg):
+            await msgs_queue.put(msg)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            with patch.object(
+                Redis, "pipeline", spy_decorator(Redis.pipeline)
+            ) as pipeline:
+                await asyncio.gather(*(br.publish(i, list=queue) for i in range(10)))
+
+            result = await asyncio.wait_for(
+                asyncio.gather(*(msgs_queue.get() for _ in range(10))),
+                timeout=3,
+            )
+
+        pipeline.mock.assert_called_once()
+        assert set(result) == set(range(10))
+
     async def test_batch_list_publisher(
         self,
         queue: str,
@@ -109,6 +137,68 @@ class TestPublish(BrokerPublishTestcase):
         assert event.is_set()
         mock.assert_called_once_with([1, 2, 3])
 
+    async def test_stream_publish_batch(
+        self,
+        queue: str,
+    ):
+        pub_broker = self.get_broker()
+
+        msgs_queue = asyncio.Queue(maxsize=1)
+
+        @pub_broker.subscriber(stream=StreamSub(queue, batch=True, last_id="0"))
+        async def handler(msg):
+            await msgs_queue.put(msg)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            with patch.object(
+                Redis, "pipeline", spy_decorator(Redis.pipeline)
+            ) as pipeline:
+                ids = await br.publish_batch(1, "hi", stream=queue, maxlen=1000)
+
+            result = await asyncio.wait_for(msgs_queue.get(), timeout=3)
+
+            entries = await br._connection.xrange(queue)
+
+        pipeline.mock.assert_called_once()
+        assert ids == [message_id for message_id, _ in entries]
+        assert result == [1, "hi"]
+
+    async def test_batch_stream_publisher(
+        self,
+        queue: str,
+        event: asyncio.Event,
+        mock: MagicMock,
+    ):
+        pub_broker = self.get_broker()
+
+        batch_stream = StreamSub(queue + "resp", batch=True)
+
+        @pub_broker.subscriber(stream=queue)
+        @pub_broker.publisher(stream=batch_stream)
+        async def m(msg):
+            return 1, 2, 3
+
+        @pub_broker.subscriber(stream=batch_stream)
+        async def resp(msg):
+            event.set()
+            mock(msg)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            await asyncio.wait(
+                (
+                    asyncio.create_task(br.publish("", stream=queue)),
+                    asyncio.create_task(event.wait()),
+                ),
+                timeout=3,
+            )
+
+        assert event.is_set()
+        mock.assert_called_once_with([1, 2, 3])
+
     async def test_publisher_with_maxlen(
         self,
         queue: str,
@@ -1,9 +1,12 @@
+import asyncio
 import json
 
 import pytest
 
 from faststream import BaseMiddleware
 from faststream.redis import RedisBroker, RedisRouter, TestRedisBroker
+from faststream.redis.parser import RawMessage
+from faststream.redis.publisher.reply import RepliesConsumer
 from tests.brokers.base.requests import RequestsTestcase
 
 
@@ -29,6 +32,30 @@ class RedisRequestsTestcase(RequestsTestcase):
     def get_router(self, **kwargs):
         return RedisRouter(**kwargs)
 
+    async def test_concurrent_requests(self, queue: str):
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def handler(msg: int) -> int:
+            await asyncio.sleep(0.01 * (5 - msg))
+            return msg * 10
+
+        async with self.patch_broker(broker):
+            await broker.start()
+
+            responses = await asyncio.gather(
+                *(
+                    broker.request(
+                        i, queue, timeout=self.timeout, correlation_id=str(i)
+                    )
+                    for i in range(5)
+                )
+            )
+
+        for i, response in enumerate(responses):
+            assert response.correlation_id == str(i)
+            assert await response.decode() == i * 10
+
 
 @pytest.mark.redis
 class TestRealRequests(RedisRequestsTestcase):
@@ -38,3 +65,51 @@ class TestRealRequests(RedisRequestsTestcase):
 class TestRequestTestClient(RedisRequestsTestcase):
     def patch_broker(self, broker, **kwargs):
         return TestRedisBroker(broker, **kwargs)
+
+
+def _reply(correlation_id: str) -> dict:
+    return {
+        "type": "message",
+        "pattern": None,
+        "channel": "replies",
+        "data": RawMessage.encode(
+            message=b"",
+            reply_to=None,
+            headers=None,
+            correlation_id=correlation_id,
+        ),
+    }
+
+
+@pytest.mark.asyncio
+class TestRepliesConsumer:
+    def get_replies(self) -> RepliesConsumer:
+        return RepliesConsumer(channel="replies", pubsub=None)
+
+    async def test_resolve_by_correlation_id(self):
+        replies = self.get_replies()
+
+        with replies.wait("1") as first, replies.wait("2") as second:
+            replies.resolve(_reply("2"))
+
+            assert not first.done()
+            assert (await second) == _reply("2")
+
+    async def test_orphaned_reply_dropped(self):
+        replies = self.get_replies()
+
+        with replies.wait("1") as response:
+            pass
+
+        replies.resolve(_reply("1"))
+
+        assert not response.done()
+        assert not replies._futures
+
+    async def test_raw_message_ignored(self):
+        replies = self.get_replies()
+
+        with replies.wait("1") as response:
+            replies.resolve({"data": b"raw"})
+
+            assert not response.done()
@@ -202,6 +202,55 @@ class TestTestclient(BrokerTestclientTestcase):
             await br.publish("hello", stream=queue)
             m.mock.assert_called_once_with(["hello"])
 
+    async def test_stream_batch_pub_by_pub_batch(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        @broker.subscriber(stream=StreamSub(queue, batch=True))
+        async def m(msg):
+            pass
+
+        async with self.patch_broker(broker) as br:
+            ids = await br.publish_batch("hello", 1, stream=queue)
+
+            assert len(ids) == 2
+            m.mock.assert_called_once_with(["hello", 1])
+
+    async def test_stream_pub_by_pub_batch(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        @broker.subscriber(stream=queue)
+        async def m(msg):
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch("hello", 1, stream=queue)
+
+            assert m.mock.call_count == 2
+
+    async def test_stream_batch_publisher_mock(
+        self,
+        queue: str,
+    ):
+        broker = self.get_broker()
+
+        publisher = broker.publisher(stream=StreamSub(queue + "1", batch=True))
+
+        @publisher
+        @broker.subscriber(queue)
+        async def m(msg):
+            return 1, 2, 3
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("hello", queue)
+            m.mock.assert_called_once_with("hello")
+            publisher.mock.assert_called_once_with([1, 2, 3])
+
     async def test_stream_publisher(
         self,
         queue: str,
@@ -14,7 +14,10 @@ from opentelemetry.trace import SpanKind
 from faststream.kafka import KafkaBroker
 from faststream.kafka.opentelemetry import KafkaTelemetryMiddleware
 from faststream.opentelemetry import Baggage, CurrentBaggage
-from faststream.opentelemetry.consts import MESSAGING_DESTINATION_PUBLISH_NAME
+from faststream.opentelemetry.consts import (
+    MESSAGING_CONSUMER_HANDLER,
+    MESSAGING_DESTINATION_PUBLISH_NAME,
+)
 from faststream.opentelemetry.middleware import MessageAction as Action
 from tests.brokers.kafka.test_consume import TestConsume
 from tests.brokers.kafka.test_publish import TestPublish
@@ -275,3 +278,26 @@ class TestConsumeWithTelemetry(TestConsume):
             middlewares=(KafkaTelemetryMiddleware(),),
             apply_types=apply_types,
         )
+
+
+def test_consumer_lag_by_handler() -> None:
+    reader = InMemoryMetricReader()
+    middleware = KafkaTelemetryMiddleware(
+        meter_provider=MeterProvider(metric_readers=(reader,))
+    )
+    recorder = middleware.consumer_metrics
+
+    for handler, lag in (("first", 1), ("second", 2)):
+        recorder.set_consumer_lag(
+            broker="kafka", handler=handler, topic="topic", partition=0, lag=lag
+        )
+    recorder.remove_consumer_lag(
+        broker="kafka", handler="first", topic="topic", partition=0
+    )
+
+    metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+    (lag,) = (m for m in metrics if m.name == "messaging.consumer.lag")
+    (point,) = lag.data.data_points
+
+    assert point.value == 2
+    assert point.attributes[MESSAGING_CONSUMER_HANDLER] == "second"
@@ -1,12 +1,19 @@
 import asyncio
+import json
 from unittest.mock import Mock
 
 import pytest
+from dirty_equals import IsStr
 from prometheus_client import CollectorRegistry
 
 from faststream import Context
 from faststream.confluent import KafkaBroker
 from faststream.confluent.prometheus.middleware import KafkaPrometheusMiddleware
+from faststream.confluent.stats import (
+    StatisticsBridge,
+    create_stats_callback,
+    parse_stats,
+)
 from tests.brokers.confluent.basic import ConfluentTestcaseConfig
 from tests.brokers.confluent.test_consume import TestConsume
 from tests.brokers.confluent.test_publish import TestPublish
@@ -58,6 +65,138 @@ class TestPrometheus(ConfluentTestcaseConfig, LocalPrometheusTestcase):
         )
         self.assert_publish_metrics(metrics_manager=metrics_manager_mock)
 
+    async def test_librdkafka_stats(self, queue: str):
+        registry = CollectorRegistry()
+        stats_received = asyncio.Event()
+
+        middleware = self.get_middleware(registry=registry)
+        observe_client_stats = middleware.client_metrics.observe_client_stats
+
+        def observe_spy(*args, **kwargs):
+            observe_client_stats(*args, **kwargs)
+            stats_received.set()
+
+        middleware.client_metrics.observe_client_stats = observe_spy
+
+        broker = self.get_broker(
+            middlewares=(middleware,),
+            config={"statistics.interval.ms": 100},
+        )
+
+        async with broker:
+            await broker.publish("hello", queue)
+            await asyncio.wait_for(stats_received.wait(), timeout=self.timeout)
+
+        assert (
+            registry.get_sample_value(
+                "faststream_librdkafka_queue_messages",
+                {
+                    "app_name": "faststream",
+                    "broker": "kafka",
+                    "client": IsStr,
+                    "client_type": "producer",
+                },
+            )
+            is not None
+        )
+
+
+STATS = {
+    "name": "rdkafka#producer-1",
+    "client_id": "faststream",
+    "type": "producer",
+    "ts": 5016483227792,
+    "msg_cnt": 3,
+    "msg_size": 120,
+    "replyq": 1,
+    "txmsgs": 100,
+    "rxmsgs": 0,
+    "brokers": {
+        "localhost:9092/1": {
+            "name": "localhost:9092/1",
+            "nodeid": 1,
+            "state": "UP",
+            "outbuf_cnt": 2,
+            "waitresp_cnt": 1,
+            "rtt": {"min": 100, "max": 3000, "avg": 1500, "p99": 2900},
+            "req": {"Produce": 10, "Metadata": 2},
+            "toppars": {"test-0": {"topic": "test", "partition": 0}},
+        }
+    },
+    "topics": {
+        "test": {
+            "topic": "test",
+            "batchsize": {"min": 10, "max": 100, "avg": 64},
+            "batchcnt": {"min": 1, "max": 5, "avg": 2},
+            "partitions": {
+                "0": {"partition": 0, "txmsgs": 100, "msgq_cnt": 3},
+                "-1": {"partition": -1, "txmsgs": 0, "msgq_cnt": 0},
+            },
+        }
+    },
+    "cgrp": {"state": "up", "rebalance_cnt": 1},
+}
+
+
+def test_parse_stats() -> None:
+    stats = parse_stats(json.dumps(STATS))
+
+    assert stats.name == "rdkafka#producer-1"
+    assert stats.type == "producer"
+    assert stats.queue_messages == 3
+    assert stats.queue_bytes == 120
+    assert stats.reply_queue_ops == 1
+    assert stats.transmitted_messages == 100
+    assert stats.brokers["localhost:9092/1"] == (0.0015, 2, 1)
+    assert stats.topics == {"test": (64, 2)}
+
+
+def test_stats_bridge_to_prometheus() -> None:
+    registry = CollectorRegistry()
+    middleware = KafkaPrometheusMiddleware(registry=registry)
+
+    bridge = create_stats_callback({"statistics.interval.ms": 1000}, (middleware,))
+    assert isinstance(bridge, StatisticsBridge)
+
+    bridge(json.dumps(STATS))
+
+    labels = {
+        "app_name": "faststream",
+        "broker": "kafka",
+        "client": "rdkafka#producer-1",
+        "client_type": "producer",
+    }
+    assert (
+        registry.get_sample_value("faststream_librdkafka_queue_messages", labels) == 3.0
+    )
+    assert (
+        registry.get_sample_value(
+            "faststream_librdkafka_broker_rtt_seconds",
+            {**labels, "node": "localhost:9092/1"},
+        )
+        == 0.0015
+    )
+    assert (
+        registry.get_sample_value(
+            "faststream_librdkafka_topic_batch_size_bytes",
+            {**labels, "topic": "test"},
+        )
+        == 64.0
+    )
+
+
+def test_stats_bridge_opt_in() -> None:
+    middleware = KafkaPrometheusMiddleware(registry=CollectorRegistry())
+
+    assert create_stats_callback({}, (middleware,)) is None
+    assert create_stats_callback({"statistics.interval.ms": 1000}, ()) is None
+    assert (
+        create_stats_callback(
+            {"statistics.interval.ms": 1000, "stats_cb": print}, (middleware,)
+        )
+        is None
+    )
+
 
 @pytest.mark.confluent
 class TestPublishWithPrometheus(TestPublish):
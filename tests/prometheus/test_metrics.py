@@ -7,6 +7,8 @@ from dirty_equals import IsPositiveFloat, IsStr
 from prometheus_client import CollectorRegistry, Histogram, Metric
 from prometheus_client.samples import Sample
 
+from faststream.broker.subscriber.metrics import ConsumerMetrics
+from faststream.prometheus import BasePrometheusMiddleware
 from faststream.prometheus.container import MetricsContainer
 from faststream.prometheus.manager import MetricsManager
 from faststream.prometheus.types import ProcessingStatus, PublishingStatus
@@ -642,3 +644,204 @@ class TestCaseMetrics:
         metric_values = manager._container.published_messages_exceptions_total.collect()
 
         assert metric_values == [expected]
+
+    def test_set_consumer_lag(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+        )
+
+        expected = Metric(
+            name=f"{metrics_prefix}_consumer_lag",
+            documentation="Gauge of not consumed records by broker, handler, topic and partition",
+            unit="",
+            typ="gauge",
+        )
+        expected.samples = [
+            Sample(
+                name=f"{metrics_prefix}_consumer_lag",
+                labels={
+                    "app_name": app_name,
+                    "broker": broker,
+                    "handler": queue,
+                    "topic": queue,
+                    "partition": "1",
+                },
+                value=10.0,
+                timestamp=None,
+                exemplar=None,
+            ),
+        ]
+
+        manager.set_consumer_lag(
+            broker=broker,
+            handler=queue,
+            topic=queue,
+            partition=1,
+            lag=10,
+        )
+
+        metric_values = manager._container.consumer_lag.collect()
+
+        assert metric_values == [expected]
+
+    def test_remove_consumer_lag(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+        )
+
+        for partition in (0, 1):
+            manager.set_consumer_lag(
+                broker=broker,
+                handler=queue,
+                topic=queue,
+                partition=partition,
+                lag=10,
+            )
+
+        manager.remove_consumer_lag(
+            broker=broker, handler=queue, topic=queue, partition=0
+        )
+        # not reported partition is ignored
+        manager.remove_consumer_lag(
+            broker=broker, handler=queue, topic=queue, partition=2
+        )
+
+        (metric,) = manager._container.consumer_lag.collect()
+        assert [s.labels["partition"] for s in metric.samples] == ["1"]
+
+    def test_observe_consumer_fetch(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+        messages_amount: int,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+        )
+        registry = manager._container._registry
+        labels = {"app_name": app_name, "broker": broker, "handler": queue}
+
+        manager.observe_consumer_fetch(broker=broker, handler=queue, records=0)
+
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_consumer_fetched_records_count", labels
+            )
+            is None
+        )
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_consumer_last_fetch_timestamp_seconds", labels
+            )
+            == IsPositiveFloat()
+        )
+
+        manager.observe_consumer_fetch(
+            broker=broker,
+            handler=queue,
+            records=messages_amount,
+        )
+
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_consumer_fetched_records_count", labels
+            )
+            == 1.0
+        )
+        assert registry.get_sample_value(
+            f"{metrics_prefix}_consumer_fetched_records_sum", labels
+        ) == float(messages_amount)
+
+    def test_observe_consumer_rebalance(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+        )
+        registry = manager._container._registry
+        labels = {"app_name": app_name, "broker": broker, "handler": queue}
+
+        # the first assignment has no revoke to measure the duration from
+        manager.observe_consumer_rebalance(broker=broker, handler=queue, duration=None)
+        manager.observe_consumer_rebalance(broker=broker, handler=queue, duration=0.5)
+
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_consumer_rebalances_total", labels
+            )
+            == 2.0
+        )
+        assert (
+            registry.get_sample_value(
+                f"{metrics_prefix}_consumer_rebalance_duration_seconds_sum", labels
+            )
+            == 0.5
+        )
+
+
+def test_consumer_metrics_from_middlewares() -> None:
+    registry = CollectorRegistry()
+    middleware = BasePrometheusMiddleware(
+        settings_provider_factory=lambda _: None,
+        registry=registry,
+    )
+
+    metrics = ConsumerMetrics(
+        broker="kafka",
+        handler="topic",
+        middlewares=(middleware, lambda msg: None),
+    )
+    assert metrics
+
+    metrics.lag("topic", 0, -1)
+    metrics.rebalance_started()
+    metrics.rebalance_finished()
+
+    labels = {"app_name": "faststream", "broker": "kafka", "handler": "topic"}
+    assert (
+        registry.get_sample_value(
+            "faststream_consumer_lag", {**labels, "topic": "topic", "partition": "0"}
+        )
+        == 0.0
+    )
+    assert (
+        registry.get_sample_value("faststream_consumer_rebalances_total", labels) == 1.0
+    )
+    assert (
+        registry.get_sample_value(
+            "faststream_consumer_rebalance_duration_seconds_count", labels
+        )
+        == 1.0
+    )
+
+    metrics.remove_lag("topic", 0)
+    assert (
+        registry.get_sample_value(
+            "faststream_consumer_lag", {**labels, "topic": "topic", "partition": "0"}
+        )
+        is None
+    )
+
+    assert not ConsumerMetrics(broker="kafka", handler="topic")